@@ -1 +1,20 @@
-from .__main__ import solve as solve
+"""Wordle Bot, solves NYT Wordle. Submodules are only imported when first used."""
+
+import importlib
+
+__all__ = ["solve", "solve_many", "SolverEngine", "Wordle"]
+
+_LAZY = {
+    "solve": ".__main__",
+    "solve_many": ".stream",
+    "SolverEngine": ".engine",
+    "Wordle": ".wordle",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,35 +1,419 @@
 """Main function that handles creating an instance and solving wordle."""
 
-from .wordle import Wordle
-from .output_file import output_file
+import argparse
 import os
+import time
 
+from .profiler import PROFILER
+from .strategies import STRATEGIES
 
-def solve(first_guess: str = "") -> None:
+
+def solve(
+    first_guess: str = "", strategy: str = "heuristic", base_url: str = None, hard_mode: bool = False
+) -> None:
     """
     Solve the wordle by selecting random 'best guesses'.
 
         Args:
             first_guess (str, optional):
                 The first guess the wordle solver will use.
-                If blank, will just pick a random word. Defaults to "".
+                If blank, the strategy picks one. Defaults to "".
+            strategy (str, optional):
+                How guesses are picked, "heuristic" or "entropy". Defaults to "heuristic".
+            base_url (str, optional):
+                Page to play on, like `wordle_bot serve`. Defaults to NYT Wordle.
+            hard_mode (bool, optional):
+                Reuse every hint, like NYT hard mode. Defaults to False.
 
         Raises:
             ValueError:
                 Will raise a ValueError if provided an invalid first guess.
 
     """
-    # Solve wordle
-    for _ in range(5):  # Attempts to solve wordle 5 times in case it fails
-        wordle = Wordle(headless=True)
-        solved = wordle.solve(first_guess=first_guess)
-        if solved is True:
-            break
+    # Selenium and rich are only needed here, so don't slow down the other commands
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+
+    from .browser_pool import BrowserPool
+    from .output_file import output_file
+    from .rules import Rules
+    from .wordle import Wordle
+
+    # Solve wordle, reusing the same browser for every attempt
+    wordle = None
+    with BrowserPool(headless=True, max_size=1) as pool:
+        for retries in range(5):  # Attempts to solve wordle 5 times in case it fails
+            start = time.perf_counter()
+            solved = False
+            attempt = None
+            discard = False
+            try:
+                attempt = Wordle(
+                    headless=True, base_url=base_url, pool=pool, rules=Rules(hard_mode=hard_mode)
+                )
+                wordle = attempt
+                solved = attempt.solve(first_guess=first_guess, strategy=strategy)
+            except (TimeoutException, WebDriverException) as error:
+                # A slow or broken page only costs this attempt, not the whole run
+                print(f"Attempt {retries + 1} failed: {type(error).__name__}")
+                discard = not isinstance(error, TimeoutException)
+            finally:
+                if attempt is not None:
+                    attempt.close(discard=discard)
+            if solved is True:
+                break
+
+    if os.getenv("GITHUB_WORKSPACE") and wordle is not None:
+        output_file(
+            wordle, strategy=strategy, retries=retries, seconds=time.perf_counter() - start
+        )
+
+
+def add_shared_arguments(parser: argparse.ArgumentParser, defaults: bool = True) -> None:
+    """
+    Adds the options every command takes.
+
+        Args:
+            parser (argparse.ArgumentParser):
+                Parser to add them to.
+            defaults (bool, optional):
+                Give them defaults. Commands don't, or their default would overwrite
+                a value given before the command. Defaults to True.
+    """
+    unset = argparse.SUPPRESS
+    parser.add_argument(
+        "--first-guess",
+        default="" if defaults else unset,
+        help="opening guess (default: the strategy's)",
+    )
+    parser.add_argument(
+        "--hard-mode",
+        action="store_true",
+        default=False if defaults else unset,
+        help="reuse every hint",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None if defaults else unset,
+        help="append per-phase timings of each solve to this JSON lines file",
+    )
+
+
+def main(argv: list = None) -> None:
+    """
+    Command line entry point. Solves today's wordle unless a command is given.
+
+        Args:
+            argv (list, optional):
+                Command line arguments. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(prog="wordle_bot", description="Plays Wordle.")
+    add_shared_arguments(parser)
+    # Commands take them too, before or after the command's name
+    shared = argparse.ArgumentParser(add_help=False)
+    add_shared_arguments(shared, defaults=False)
+    parser.add_argument(
+        "--strategy", default="heuristic", choices=STRATEGIES, help="how guesses are picked"
+    )
+    parser.add_argument("--url", help="page to play on (default: NYT Wordle)")
+    commands = parser.add_subparsers(dest="command")
+
+    bench_parser = commands.add_parser(
+        "bench",
+        help="play every word offline and report how each strategy did",
+        parents=[shared],
+    )
+    bench_parser.add_argument(
+        "--strategy",
+        dest="strategies",
+        action="append",
+        choices=STRATEGIES,
+        help="strategy to benchmark, can be repeated (default: entropy)",
+    )
+    bench_parser.add_argument("--sample", type=int, help="only play this many random answers")
+    bench_parser.add_argument("--seed", type=int, help="seed for picking the sample")
+    bench_parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    bench_parser.add_argument("--output", help="JSON file for the results")
+    bench_parser.add_argument(
+        "--no-memo", action="store_true", help="don't share work between games with the same state"
+    )
+    bench_parser.add_argument(
+        "--answers", help="file of the words that can be the answer, one per line (default: all)"
+    )
+    bench_parser.add_argument(
+        "--boards",
+        type=int,
+        default=1,
+        help="answers per game, guessed together like Dordle (2) or Quordle (4) (default: 1)",
+    )
+    bench_parser.add_argument(
+        "--max-guesses", type=int, default=6, help="guesses before a game is lost (default: 6)"
+    )
+
+    book_parser = commands.add_parser(
+        "book",
+        help="precompute a strategy's replies to its opener's feedback",
+        parents=[shared],
+    )
+    book_parser.add_argument(
+        "--strategy", default="entropy", choices=STRATEGIES, help="strategy to precompute"
+    )
+    book_parser.add_argument("--opener", default="", help="first guess (default: the strategy's)")
+    book_parser.add_argument(
+        "--depth", type=int, default=2, help="turns after the opener to precompute (default: 2)"
+    )
+    book_parser.add_argument("--directory", help="where to save the book")
+
+    tree_parser = commands.add_parser(
+        "tree",
+        help="build the complete decision tree of a strategy for the tree strategy",
+        parents=[shared],
+    )
+    tree_parser.add_argument(
+        "--strategy",
+        default="entropy",
+        choices=[name for name in STRATEGIES if name != "tree"],
+        help="strategy to build the tree from",
+    )
+    tree_parser.add_argument("--opener", default="", help="first guess (default: the strategy's)")
+    tree_parser.add_argument("--directory", help="where to save the tree")
+    tree_parser.add_argument("--text", help="also write every answer's guesses to this file")
+
+    serve_parser = commands.add_parser(
+        "serve",
+        help="serve a local mock Wordle page to play against with --url",
+        parents=[shared],
+    )
+    serve_parser.add_argument("--answer", help="hidden word (default: random)")
+    serve_parser.add_argument("--port", type=int, default=8000, help="port (default: 8000)")
+    serve_parser.add_argument(
+        "--flip-delay", type=float, default=0.3, help="seconds per tile flip (default: 0.3)"
+    )
+    serve_parser.add_argument(
+        "--popup-delay", type=float, default=1, help="seconds before popups (default: 1)"
+    )
+
+    play_parser = commands.add_parser(
+        "play",
+        help="play several browser games at once and report the results",
+        parents=[shared],
+    )
+    play_parser.add_argument("--games", type=int, default=4, help="games to play (default: 4)")
+    play_parser.add_argument(
+        "--concurrency", type=int, default=4, help="most games played at once (default: 4)"
+    )
+    play_parser.add_argument(
+        "--show", action="store_true", help="show the browser windows side by side"
+    )
+    play_parser.add_argument("--output", help="JSON file for the report")
+
+    words_parser = commands.add_parser(
+        "words",
+        help="convert between the packed word list and its JSON export",
+        parents=[shared],
+    )
+    words_parser.add_argument(
+        "--pack", metavar="JSON", help="rebuild the bundled packed word list from a JSON word list"
+    )
+    words_parser.add_argument(
+        "--export", metavar="JSON", help="export the bundled word list as JSON"
+    )
+
+    reverse_parser = commands.add_parser(
+        "reverse",
+        help="list the answers that could be behind shared result grids",
+        parents=[shared],
+    )
+    reverse_parser.add_argument(
+        "input", nargs="?", default="-", help="file with one grid per line (default: stdin)"
+    )
+    reverse_parser.add_argument(
+        "--top", type=int, default=10, help="most answers per grid (default: 10)"
+    )
+    reverse_parser.add_argument(
+        "--answers", help="file of the words that can be the answer, one per line (default: all)"
+    )
+
+    results_parser = commands.add_parser(
+        "results",
+        help="sum up the games in the results store",
+        parents=[shared],
+    )
+    results_parser.add_argument(
+        "--db", help="results database (default: WORDLE_BOT_RESULTS or docs/results.db)"
+    )
+    results_parser.add_argument("--strategy", help="only games played by this strategy")
+    results_parser.add_argument(
+        "--markdown", help="regenerate this markdown page from the store"
+    )
+
+    feed_parser = commands.add_parser(
+        "feed",
+        help="solve a stream of known answers offline, one JSON line per game",
+        parents=[shared],
+    )
+    feed_parser.add_argument(
+        "input", nargs="?", default="-", help="file with one answer per line (default: stdin)"
+    )
+    feed_parser.add_argument(
+        "--strategy", default="entropy", choices=STRATEGIES, help="strategy to play with"
+    )
+    feed_parser.add_argument(
+        "--in-flight", type=int, default=64, help="games played at once (default: 64)"
+    )
+
+    args = parser.parse_args(argv)
+    if args.profile:
+        PROFILER.path = args.profile
+    if args.command == "feed":
+        import json
+        import sys
+        from contextlib import nullcontext
+
+        from .rules import Rules
+        from .stream import solve_many
+
+        if args.in_flight < 1:
+            parser.error("--in-flight has to be at least 1")
+        if args.input == "-":
+            lines = nullcontext(sys.stdin)
+        else:
+            lines = open(args.input, encoding="utf-8")
+        with lines as file:
+            try:
+                results = solve_many(
+                    file,
+                    strategy=args.strategy,
+                    first_guess=args.first_guess,
+                    rules=Rules(hard_mode=args.hard_mode),
+                    in_flight=args.in_flight,
+                )
+            except ValueError as error:
+                parser.error(str(error))
+            for result in results:
+                # Flushed per game so whatever reads the output sees results as they finish
+                sys.stdout.write(json.dumps(result) + "\n")
+                sys.stdout.flush()
+    elif args.command == "results":
+        import json
+
+        from .output_file import seed_store, write_markdown
+        from .results import ResultsStore, results_path
+
+        path = args.db or results_path()
+        if path is None:
+            parser.error("no results database, pass --db or set WORDLE_BOT_RESULTS")
+        with ResultsStore(path) as store:
+            if args.markdown:
+                # Rewriting the page from an empty store would drop the games already on it
+                seed_store(store, args.markdown)
+            print(json.dumps(store.stats(strategy=args.strategy), indent=1))
+            if args.markdown:
+                write_markdown(store, args.markdown)
+    elif args.command == "reverse":
+        import json
+        import sys
+        from contextlib import nullcontext
+
+        from .reverse import ReverseSolver
+        from .words import read_word_file
+
+        if args.top < 1:
+            parser.error("--top has to be at least 1")
+        solver = ReverseSolver(answers=read_word_file(args.answers) if args.answers else None)
+        if args.input == "-":
+            lines = nullcontext(sys.stdin)
+        else:
+            lines = open(args.input, encoding="utf-8")
+        with lines as file:
+            for result in solver.solve_lines(file, top=args.top):
+                sys.stdout.write(json.dumps(result) + "\n")
+    elif args.command == "words":
+        from .words import (
+            BUNDLED_PACKED_PATH,
+            _read_json,
+            decode_words,
+            export_json,
+            read_packed,
+            write_packed,
+        )
+
+        if args.pack:
+            write_packed(BUNDLED_PACKED_PATH, _read_json(args.pack))
+            print(f"Packed {args.pack} into {BUNDLED_PACKED_PATH}")
+        if args.export:
+            export_json(args.export, decode_words(read_packed(BUNDLED_PACKED_PATH)))
+            print(f"Exported {BUNDLED_PACKED_PATH} to {args.export}")
+    elif args.command == "play":
+        from .orchestrator import run
+        from .rules import Rules
+
+        run(
+            games=args.games,
+            concurrency=args.concurrency,
+            headless=not args.show,
+            base_url=args.url,
+            strategy=args.strategy,
+            first_guess=args.first_guess,
+            output=args.output,
+            rules=Rules(hard_mode=args.hard_mode),
+        )
+    elif args.command == "serve":
+        from .mock_server import MockWordleServer
+
+        server = MockWordleServer(
+            answer=args.answer,
+            flip_delay=args.flip_delay,
+            popup_delay=args.popup_delay,
+            port=args.port,
+        )
+        print(f"Serving mock Wordle on {server.url}, answer: {server.answer}")
+        try:
+            server.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.stop()
+    elif args.command == "tree":
+        from .tree import build_tree, save_tree
+
+        tree = build_tree(strategy=args.strategy, opener=args.opener)
+        print(f"Saved decision tree to {save_tree(tree, directory=args.directory)}")
+        print(", ".join(f"{key}: {value}" for key, value in tree.stats().items()))
+        if args.text:
+            with open(args.text, "w", encoding="utf-8") as file:
+                file.write(tree.to_text())
+    elif args.command == "book":
+        from .opening_book import build_book, save_book
 
-    if os.getenv("GITHUB_WORKSPACE"):
-        output_file(wordle)
+        book = build_book(strategy=args.strategy, opener=args.opener, depth=args.depth)
+        print(f"Saved opening book to {save_book(book, directory=args.directory)}")
+    elif args.command == "bench":
+        from .bench import bench
+        from .rules import Rules
+        from .words import read_word_file
 
+        answers = read_word_file(args.answers) if args.answers else None
+        bench(
+            strategies=args.strategies,
+            sample=args.sample,
+            seed=args.seed,
+            workers=args.workers,
+            first_guess=args.first_guess,
+            output=args.output,
+            memo=not args.no_memo,
+            rules=Rules(
+                hard_mode=args.hard_mode, answers=answers, max_guesses=args.max_guesses
+            ),
+            boards=args.boards,
+        )
+    else:
+        solve(
+            first_guess=args.first_guess,
+            strategy=args.strategy,
+            base_url=args.url,
+            hard_mode=args.hard_mode,
+        )
 
 
 if __name__ == "__main__":
-    solve()
\ No newline at end of file
+    main()
@@ -0,0 +1,273 @@
+"""Benchmark Module, plays every word offline and reports how well a strategy did."""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+
+from .patterns import PatternMatrix
+from .rules import Rules
+from .simulate import simulate
+from .strategies import get_strategy
+from .words import load_words
+
+# Entry points whose import time is measured, cheapest first
+IMPORT_MODULES = ("wordle_bot", "wordle_bot.engine", "wordle_bot.__main__", "wordle_bot.bench")
+
+
+def import_times(modules: tuple = IMPORT_MODULES) -> dict:
+    """
+    Measures how long each module takes to import in a fresh interpreter,
+    using Python's -X importtime.
+
+    Args:
+        modules (tuple, optional): Modules to import. Defaults to IMPORT_MODULES.
+
+    Returns:
+        dict: Milliseconds to import each module, with everything it imports.
+    """
+    times = {}
+    for module in modules:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # Lines look like "import time: self [us] | cumulative | imported package"
+        for line in result.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                times[module] = int(fields[1]) / 1000
+    return times
+
+
+def summarize(
+    strategy: str,
+    games: list,
+    seconds: float,
+    workers: int,
+    rules: Rules = None,
+    boards: int = 1,
+) -> dict:
+    """
+    Builds the report for one strategy.
+
+    Args:
+        strategy (str): Name of the strategy.
+        games (list): Results from play_game.
+        seconds (float): Wall time of the whole run.
+        workers (int): Number of worker processes used.
+        rules (Rules, optional): Rules the games were played by. Defaults to normal Wordle.
+        boards (int, optional): Answers per game, see MultiBoardSolver. Defaults to 1.
+
+    Returns:
+        dict: Guess distribution, failure rate, decision times and throughput.
+    """
+    rules = rules or Rules()
+    max_guesses = rules.max_guesses + boards - 1
+    distribution = {str(guesses): 0 for guesses in range(1, max_guesses + 1)}
+    distribution["failed"] = 0
+    for game in games:
+        if game["solved"] is True:
+            distribution[str(len(game["guesses"]))] += 1
+        else:
+            distribution["failed"] += 1
+    solved = [len(game["guesses"]) for game in games if game["solved"] is True]
+    timings = np.array([timing for game in games for timing in game["timings"]])
+    memo_hits = sum(game["memo"]["hits"] for game in games)
+    memo_lookups = memo_hits + sum(game["memo"]["misses"] for game in games)
+    return {
+        "strategy": strategy,
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "word_list": PatternMatrix.for_words(load_words(offline=True, overlay=False)).digest,
+        "games": len(games),
+        "workers": workers,
+        "boards": boards,
+        "rules": {
+            "hard_mode": rules.hard_mode,
+            "answers": None if rules.answers is None else len(rules.answers),
+            "max_guesses": max_guesses,
+        },
+        "guess_distribution": distribution,
+        "failure_rate": distribution["failed"] / len(games) if games else 0.0,
+        "mean_guesses": float(np.mean(solved)) if solved else None,
+        "decision_seconds": {
+            "mean": float(timings.mean()) if len(timings) else None,
+            "p50": float(np.percentile(timings, 50)) if len(timings) else None,
+            "p99": float(np.percentile(timings, 99)) if len(timings) else None,
+            "max": float(timings.max()) if len(timings) else None,
+        },
+        "memo": {
+            "hits": memo_hits,
+            "misses": memo_lookups - memo_hits,
+            "hit_rate": memo_hits / memo_lookups if memo_lookups else None,
+        },
+        "total_seconds": seconds,
+        "games_per_second": len(games) / seconds if seconds else None,
+    }
+
+
+def run(
+    strategy: str = "entropy",
+    sample: int = None,
+    seed: int = None,
+    workers: int = None,
+    first_guess: str = "",
+    memo: bool = True,
+    rules: Rules = None,
+    boards: int = 1,
+) -> dict:
+    """
+    Plays every possible answer (or a random sample) as the answer, spread over a pool of
+    workers that share the word list and pattern matrix without copying it.
+
+    Args:
+        strategy (str, optional): Name of the strategy to benchmark. Defaults to "entropy".
+        sample (int, optional): Only play this many random answers. Defaults to every word.
+        seed (int, optional): Seed for picking the sample.
+        workers (int, optional): Worker processes. Defaults to the number of cores.
+        first_guess (str, optional): Opener to use for every game. Defaults to the strategy's.
+        memo (bool, optional): Let games share a TransitionCache. Defaults to True.
+        rules (Rules, optional):
+            Rules every game is played by, its answers are the words played.
+            Defaults to normal Wordle.
+        boards (int, optional):
+            Answers per game, more than 1 plays multi-board games where every
+            answer is used once per board and strategy is ignored. Defaults to 1.
+
+    Returns:
+        dict: Report from summarize.
+    """
+    get_strategy(strategy)
+    words = load_words(offline=True)
+    if rules is not None and rules.answers is not None:
+        answers = sorted(word for word in rules.answers if word in words)
+    else:
+        answers = list(words)
+    if boards > 1:
+        random.Random(seed).shuffle(answers)
+        answers = [
+            tuple(answers[start : start + boards])
+            for start in range(0, len(answers) - boards + 1, boards)
+        ]
+    if sample is not None and sample < len(answers):
+        answers = random.Random(seed).sample(answers, sample)
+    workers = workers or os.cpu_count() or 1
+    # Build the pattern matrix before the clock starts
+    PatternMatrix.for_words(load_words(offline=True, overlay=False)).matrix
+
+    start = time.perf_counter()
+    games = list(
+        simulate(
+            answers,
+            strategy=strategy,
+            workers=workers,
+            first_guess=first_guess,
+            memo=memo,
+            rules=rules,
+        )
+    )
+    return summarize(
+        strategy, games, time.perf_counter() - start, workers, rules=rules, boards=boards
+    )
+
+
+def print_report(report: dict, console: Console = None) -> None:
+    """
+    Prints a report as a table.
+
+    Args:
+        report (dict): Report from summarize.
+        console (Console, optional): Console to print to. Defaults to a new one.
+    """
+    console = console or Console()
+    title = f"Benchmark: {report['strategy']}"
+    if report["boards"] > 1:
+        title = f"Benchmark: {report['boards']} boards"
+    if report["rules"]["hard_mode"] is True:
+        title += " (hard mode)"
+    table = Table(title=title, show_header=False)
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_row("Games", str(report["games"]))
+    for guesses, count in report["guess_distribution"].items():
+        table.add_row(f"Solved in {guesses}" if guesses != "failed" else "Failed", str(count))
+    table.add_row("Failure rate", f"{report['failure_rate']:.2%}")
+    if report["mean_guesses"] is not None:
+        table.add_row("Mean guesses", f"{report['mean_guesses']:.3f}")
+    if report["decision_seconds"]["mean"] is not None:
+        table.add_row("Mean decision", f"{report['decision_seconds']['mean'] * 1000:.2f} ms")
+        table.add_row("p99 decision", f"{report['decision_seconds']['p99'] * 1000:.2f} ms")
+    if report["memo"]["hit_rate"] is not None:
+        table.add_row("Memo hit rate", f"{report['memo']['hit_rate']:.1%}")
+    table.add_row("Total time", f"{report['total_seconds']:.1f} s")
+    table.add_row("Games / second", f"{report['games_per_second']:.1f}")
+    for module, milliseconds in report.get("import_ms", {}).items():
+        table.add_row(f"import {module}", f"{milliseconds:.0f} ms")
+    console.print(table)
+
+
+def bench(
+    strategies: list = None,
+    sample: int = None,
+    seed: int = None,
+    workers: int = None,
+    first_guess: str = "",
+    output: str = None,
+    memo: bool = True,
+    rules: Rules = None,
+    boards: int = 1,
+) -> list:
+    """
+    Benchmarks each strategy, prints the results and saves them as JSON.
+
+    Args:
+        strategies (list, optional): Strategy names. Defaults to ["entropy"].
+        sample (int, optional): Only play this many random answers. Defaults to every word.
+        seed (int, optional): Seed for picking the sample.
+        workers (int, optional): Worker processes. Defaults to the number of cores.
+        first_guess (str, optional): Opener to use for every game.
+        output (str, optional):
+            JSON file for the reports. Defaults to bench_<date>.json.
+        memo (bool, optional): Let games share a TransitionCache. Defaults to True.
+        rules (Rules, optional): Rules every game is played by. Defaults to normal Wordle.
+        boards (int, optional): Answers per game, see run. Defaults to 1.
+
+    Returns:
+        list: One report per strategy.
+    """
+    console = Console()
+    imports = import_times()
+    reports = []
+    if boards > 1:
+        # Multi-board games always pick guesses by joint entropy
+        strategies = ["entropy"]
+    for strategy in strategies or ["entropy"]:
+        with console.status(f"Benchmarking {strategy}..."):
+            report = run(
+                strategy=strategy,
+                sample=sample,
+                seed=seed,
+                workers=workers,
+                first_guess=first_guess,
+                memo=memo,
+                rules=rules,
+                boards=boards,
+            )
+        report["import_ms"] = imports
+        print_report(report, console=console)
+        reports.append(report)
+
+    output = output or f"bench_{datetime.now():%Y%m%d_%H%M%S}.json"
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(reports, file, indent=1)
+    console.print(f"Saved results to [cyan]{output}")
+    return reports
@@ -0,0 +1,121 @@
+"""Board Module, reads the whole Wordle grid in a single WebDriver call."""
+
+from dataclasses import dataclass
+
+UNSETTLED_STATES = ("empty", "tbd")
+
+# Runs in the page, arguments are the row, tile and toast class names
+BOARD_SCRIPT = """
+const [rowClass, tileClass, toastClass] = arguments;
+return {
+    rows: Array.from(document.getElementsByClassName(rowClass), (row) =>
+        Array.from(row.getElementsByClassName(tileClass), (tile) => [
+            tile.innerText.trim(),
+            tile.getAttribute("data-state") || "empty",
+            tile.getAttribute("data-animation") || "",
+        ])
+    ),
+    toast: document.getElementsByClassName(toastClass).length > 0,
+};
+"""
+
+
+@dataclass(frozen=True)
+class TileSnapshot:
+    """
+    One tile of the board.
+
+    Args:
+        letter (str): Letter shown on the tile, empty if there isn't one.
+        state (str): The tile's data-state, like "tbd" or "correct".
+        animation (str): The tile's data-animation, like "flip-in" or "idle".
+    """
+
+    letter: str
+    state: str
+    animation: str = ""
+
+    @property
+    def settled(self) -> bool:
+        """True once the tile has been scored and stopped flipping."""
+        return self.state not in UNSETTLED_STATES and not self.animation.startswith("flip")
+
+
+@dataclass(frozen=True)
+class RowSnapshot:
+    """
+    One row of the board.
+
+    Args:
+        tiles (tuple[TileSnapshot, ...]): The row's tiles, left to right.
+    """
+
+    tiles: tuple
+
+    @property
+    def word(self) -> str:
+        """Letters typed into the row."""
+        return "".join(tile.letter for tile in self.tiles).lower()
+
+    @property
+    def pattern(self) -> tuple:
+        """The data-state of each tile."""
+        return tuple(tile.state for tile in self.tiles)
+
+    @property
+    def settled(self) -> bool:
+        """True once every tile has been scored."""
+        return bool(self.tiles) and all(tile.settled for tile in self.tiles)
+
+    @property
+    def empty(self) -> bool:
+        """True if nothing has been typed into the row."""
+        return not any(tile.letter or tile.state == "tbd" for tile in self.tiles)
+
+
+@dataclass(frozen=True)
+class BoardSnapshot:
+    """
+    The whole board at one point in time.
+
+    Args:
+        rows (tuple[RowSnapshot, ...]): Every row, top to bottom.
+        toast (bool): True if a toast, like "Not in word list", is showing.
+    """
+
+    rows: tuple
+    toast: bool = False
+
+    def row(self, row_number: int) -> RowSnapshot:
+        """
+        Looks up a row.
+
+        Args:
+            row_number (int): Row number, starting at 1.
+
+        Returns:
+            RowSnapshot: The row.
+        """
+        return self.rows[row_number - 1]
+
+    @classmethod
+    def read(cls, browser, row_class: str, tile_class: str, toast_class: str) -> "BoardSnapshot":
+        """
+        Reads the letters and states of every tile with one execute_script call.
+
+        Args:
+            browser (WebDriver): Browser showing the Wordle page.
+            row_class (str): Class name of the rows.
+            tile_class (str): Class name of the tiles.
+            toast_class (str): Class name of the toasts.
+
+        Returns:
+            BoardSnapshot: Snapshot of the board.
+        """
+        board = browser.execute_script(BOARD_SCRIPT, row_class, tile_class, toast_class)
+        return cls(
+            rows=tuple(
+                RowSnapshot(tuple(TileSnapshot(*tile) for tile in row)) for row in board["rows"]
+            ),
+            toast=bool(board["toast"]),
+        )
@@ -0,0 +1,139 @@
+"""Browser Pool Module, launches Chrome once and hands the same sessions out again."""
+
+import socket
+import threading
+
+from selenium.webdriver import Chrome
+from selenium.webdriver.chrome.options import Options
+
+# Clears whatever the page saved, so the next game starts from the welcome screen
+RESET_SCRIPT = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+
+def free_port() -> int:
+    """
+    Asks the OS for a port nobody is listening on.
+
+    Returns:
+        int: Port number.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def chrome_options(headless: bool = False, debugging_port: int = None) -> Options:
+    """
+    Chrome options used for playing Wordle.
+
+    Args:
+        headless (bool, optional): Run Chrome without a window. Defaults to False.
+        debugging_port (int, optional): Remote debugging port. Defaults to a free port.
+
+    Returns:
+        Options: Options for Chrome.
+    """
+    options = Options()
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    options.add_argument("--log-level=3")
+    options.add_argument("--no-sandbox")  # Bypass OS security model
+    options.add_argument("--disable-dev-shm-usage")  # Overcome limited resource issues
+    options.add_argument("--disable-gpu")  # Applicable for Windows/Linux GUI environments
+    # Debugging port for ChromeDriver, unique so several browsers can run at once
+    options.add_argument(f"--remote-debugging-port={debugging_port or free_port()}")
+    options.add_argument("--disable-software-rasterizer")  # Avoid GPU rendering issues
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-logging")
+    options.add_argument("--disable-popup-blocking")
+    if headless is True:
+        options.add_argument("--headless")
+    options.add_argument("--ignore-certificate-errors")
+    options.add_argument("--ignore-ssl-errors")
+    return options
+
+
+def reset_browser(browser: Chrome) -> None:
+    """
+    Forgets the game saved by the current page, so reloading it starts a new game.
+
+    Args:
+        browser (Chrome): Browser to reset.
+    """
+    try:
+        browser.execute_script(RESET_SCRIPT)
+    except Exception:
+        # Pages like about:blank don't have storage to clear
+        pass
+
+
+class BrowserPool:
+    """
+    Keeps Chrome sessions alive between games. Each session gets its own
+    remote debugging port, and is reset instead of relaunched when it's reused.
+
+    Args:
+        headless (bool, optional): Run Chrome without a window. Defaults to False.
+        max_size (int, optional): Most idle sessions to keep. Defaults to 4.
+    """
+
+    def __init__(self, headless: bool = False, max_size: int = 4) -> None:
+        self.headless = headless
+        self.max_size = max_size
+        self.idle = []
+        self.launched = 0
+        self.lock = threading.Lock()
+
+    def launch(self) -> Chrome:
+        """
+        Starts a new Chrome session.
+
+        Raises:
+            SessionNotCreatedException: If Chrome can't be started.
+
+        Returns:
+            Chrome: The new browser.
+        """
+        browser = Chrome(options=chrome_options(headless=self.headless))
+        with self.lock:
+            self.launched += 1
+        return browser
+
+    def acquire(self) -> Chrome:
+        """
+        Hands out an idle session, or launches one if they're all in use.
+
+        Returns:
+            Chrome: Browser to play with, reset if it was used before.
+        """
+        with self.lock:
+            browser = self.idle.pop() if self.idle else None
+        if browser is None:
+            return self.launch()
+        reset_browser(browser)
+        return browser
+
+    def release(self, browser: Chrome) -> None:
+        """
+        Gives a session back to the pool, or quits it if the pool is full.
+
+        Args:
+            browser (Chrome): Browser from acquire.
+        """
+        with self.lock:
+            if len(self.idle) < self.max_size:
+                self.idle.append(browser)
+                return
+        browser.quit()
+
+    def close(self) -> None:
+        """Quits every idle session."""
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for browser in idle:
+            browser.quit()
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,226 @@
+"""Constraint Module, tracks what the feedback so far says about the answer."""
+
+import numpy as np
+
+from .patterns import ABSENT, CORRECT, decode_pattern
+
+ALL_LETTERS = (1 << 26) - 1
+MAX_COUNT = 5
+
+_INDEXES = {}
+
+
+def letter_bit(letter: str) -> int:
+    """
+    Bit for a letter in a 26 bit letter mask, "a" is the lowest bit.
+
+    Args:
+        letter (str): Lowercase letter.
+
+    Returns:
+        int: Letter bit.
+    """
+    return 1 << (ord(letter) - ord("a"))
+
+
+class Constraints:
+    """
+    Everything the feedback so far says about the answer.
+    Each position has a 26 bit mask of the letters it can still be,
+    and each letter has a minimum and maximum number of copies.
+    """
+
+    __slots__ = ("allowed", "min_counts", "max_counts")
+
+    def __init__(self) -> None:
+        self.allowed = [ALL_LETTERS] * 5
+        self.min_counts = [0] * 26
+        self.max_counts = [MAX_COUNT] * 26
+
+    def copy(self) -> "Constraints":
+        """
+        Copies the constraints so they can be updated separately.
+
+        Returns:
+            Constraints: Copy of these constraints.
+        """
+        constraints = Constraints()
+        constraints.allowed = list(self.allowed)
+        constraints.min_counts = list(self.min_counts)
+        constraints.max_counts = list(self.max_counts)
+        return constraints
+
+    def key(self) -> tuple:
+        """
+        Hashable snapshot of the constraints.
+
+        Returns:
+            tuple: Masks followed by the minimum and maximum letter counts.
+        """
+        return (*self.allowed, *self.min_counts, *self.max_counts)
+
+    def update(self, guess: str, pattern) -> None:
+        """
+        Adds the feedback for a guess. Duplicate letters are handled exactly,
+        a letter that is green or yellow twice has at least two copies, and an
+        absent tile caps the letter at the number of green and yellow copies.
+
+        Args:
+            guess (str): The 5 letter word that was guessed.
+            pattern (tuple | int): The data-state of each tile, or its pattern code.
+        """
+        if not isinstance(pattern, (tuple, list)):
+            pattern = decode_pattern(pattern)
+        found = {}
+        capped = set()
+        for indx, (letter, state) in enumerate(zip(guess, pattern)):
+            bit = letter_bit(letter)
+            if state == CORRECT:
+                self.allowed[indx] = bit
+            else:
+                self.allowed[indx] &= ~bit
+            if state == ABSENT:
+                capped.add(letter)
+            else:
+                found[letter] = found.get(letter, 0) + 1
+
+        for letter in set(guess):
+            number = ord(letter) - ord("a")
+            count = found.get(letter, 0)
+            self.min_counts[number] = max(self.min_counts[number], count)
+            if letter in capped:
+                self.max_counts[number] = min(self.max_counts[number], count)
+            if self.max_counts[number] == 0:
+                for indx in range(5):
+                    self.allowed[indx] &= ~letter_bit(letter)
+
+    def known(self) -> list[str]:
+        """
+        Letters that are known to be at each position.
+
+        Returns:
+            list[str]: One letter per position, "" if it's still unknown.
+        """
+        letters = []
+        for mask in self.allowed:
+            if mask and mask & (mask - 1) == 0:
+                letters.append(chr(ord("a") + mask.bit_length() - 1))
+            else:
+                letters.append("")
+        return letters
+
+    def present_mask(self) -> int:
+        """
+        Letters that are known to be in the answer.
+
+        Returns:
+            int: 26 bit letter mask.
+        """
+        mask = 0
+        for number, count in enumerate(self.min_counts):
+            if count > 0:
+                mask |= 1 << number
+        return mask
+
+    def misplaced(self, indx: int) -> int:
+        """
+        Letters that are in the answer but known not to be at a position.
+
+        Args:
+            indx (int): Position from 0 to 4.
+
+        Returns:
+            int: 26 bit letter mask.
+        """
+        return self.present_mask() & ~self.allowed[indx]
+
+    def reuses_hints(self, word: str) -> bool:
+        """
+        Checks if a word is a legal hard mode guess, keeping every known letter
+        in place and using every letter known to be in the answer.
+
+        Args:
+            word (str): 5 letter word.
+
+        Returns:
+            bool: True if the word reuses every hint, False if otherwise.
+        """
+        for letter, known in zip(word, self.known()):
+            if known and letter != known:
+                return False
+        for number, count in enumerate(self.min_counts):
+            if count and word.count(chr(ord("a") + number)) < count:
+                return False
+        return True
+
+
+class ConstraintIndex:
+    """
+    Precomputed letter bits and letter counts of every word,
+    so a word list can be checked against Constraints with integer operations.
+
+    Args:
+        letters (np.ndarray): (words, 5) array from encode_words.
+    """
+
+    def __init__(self, letters: np.ndarray) -> None:
+        self.position_bits = np.left_shift(1, letters.astype(np.int32))
+        self.letter_counts = np.zeros((len(letters), 26), dtype=np.uint8)
+        for indx in range(5):
+            np.add.at(self.letter_counts, (np.arange(len(letters)), letters[:, indx]), 1)
+
+    @classmethod
+    def for_patterns(cls, patterns) -> "ConstraintIndex":
+        """
+        Shares one ConstraintIndex per word list across the whole process.
+
+        Args:
+            patterns (PatternMatrix): Matrix whose words get indexed.
+
+        Returns:
+            ConstraintIndex: Index in the same word order as the matrix.
+        """
+        if patterns.digest not in _INDEXES:
+            _INDEXES[patterns.digest] = cls(patterns.letters)
+        return _INDEXES[patterns.digest]
+
+    def filter(self, candidates: np.ndarray, constraints: Constraints) -> np.ndarray:
+        """
+        Keeps the candidates that fit the constraints.
+
+        Args:
+            candidates (np.ndarray): Indexes of words that could be the answer.
+            constraints (Constraints): Constraints to check.
+
+        Returns:
+            np.ndarray: Indexes of the candidates that are still possible.
+        """
+        allowed = np.array(constraints.allowed, dtype=np.int32)
+        fits = np.all(self.position_bits[candidates] & allowed, axis=1)
+        counts = self.letter_counts[candidates]
+        fits &= np.all(
+            (counts >= np.array(constraints.min_counts, dtype=np.uint8))
+            & (counts <= np.array(constraints.max_counts, dtype=np.uint8)),
+            axis=1,
+        )
+        return candidates[fits]
+
+    def hard_mode_filter(self, guesses: np.ndarray, constraints: Constraints) -> np.ndarray:
+        """
+        Keeps the guesses that are legal in hard mode, see Constraints.reuses_hints.
+
+        Args:
+            guesses (np.ndarray): Indexes of words that can be guessed.
+            constraints (Constraints): Constraints so far.
+
+        Returns:
+            np.ndarray: Indexes of the guesses that reuse every hint.
+        """
+        fits = np.all(
+            self.letter_counts[guesses] >= np.array(constraints.min_counts, dtype=np.uint8),
+            axis=1,
+        )
+        for indx, letter in enumerate(constraints.known()):
+            if letter:
+                fits &= self.position_bits[guesses, indx] == letter_bit(letter)
+        return guesses[fits]
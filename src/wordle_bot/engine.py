@@ -0,0 +1,445 @@
+"""Solver Module, solves Wordle without needing a browser."""
+
+import copy
+import random
+import time
+import zlib
+
+import numpy as np
+
+from .constraints import ConstraintIndex, Constraints
+from .memo import TRANSITIONS, TransitionCache
+from .opening_book import OpeningBook
+from .patterns import ABSENT, CORRECT, PRESENT, PatternMatrix, decode_pattern
+from .profiler import PROFILER
+from .rules import Rules
+from .strategies import Strategy, get_strategy
+from .words import load_words
+
+
+def get_feedback(guess: str, answer: str) -> tuple[str, ...]:
+    """
+    Scores a guess against an answer the same way NYT Wordle colors its tiles.
+
+    Args:
+        guess (str): 5 letter word that was guessed.
+        answer (str): 5 letter word that is the hidden answer.
+
+    Returns:
+        tuple[str, ...]: The data-state of each of the 5 tiles.
+    """
+    pattern = [ABSENT] * 5
+    remaining = {}
+    for indx, (guess_letter, answer_letter) in enumerate(zip(guess, answer)):
+        if guess_letter == answer_letter:
+            pattern[indx] = CORRECT
+        else:
+            remaining[answer_letter] = remaining.get(answer_letter, 0) + 1
+    for indx, guess_letter in enumerate(guess):
+        if pattern[indx] == CORRECT:
+            continue
+        if remaining.get(guess_letter, 0) > 0:
+            pattern[indx] = PRESENT
+            remaining[guess_letter] -= 1
+    return tuple(pattern)
+
+
+class SolverEngine:
+    """
+    Handles all the logic for picking Wordle guesses from tile feedback.
+    Has no knowledge of the browser, so it can be used to simulate games offline.
+
+    Args:
+        five_letter_words (Iterable[str]):
+            Every valid guess, like the mapping from load_words.
+            Only used to pick the guessable words, the engine itself works on
+            indexes into patterns.words.
+        patterns (PatternMatrix, optional):
+            Precomputed feedback for the word list.
+            Defaults to the shared matrix for the full word list.
+        strategy (str | Strategy, optional):
+            How guesses are picked, "heuristic" or "entropy". Defaults to "heuristic".
+        use_book (bool, optional):
+            Take the early guesses from the strategy's opening book when there is one.
+            Defaults to True.
+        memo (TransitionCache | bool, optional):
+            Cache of the potential words and guesses for each constraint state,
+            False to not use one. Defaults to the cache shared by the whole process.
+        rules (Rules, optional):
+            Hard mode, the words that can be the answer and the guesses allowed.
+            Defaults to normal Wordle.
+        offline (bool, optional):
+            Load the word list for the default patterns without touching the network.
+            Defaults to the WORDLE_BOT_OFFLINE environment variable.
+    """
+
+    def __init__(
+        self,
+        five_letter_words: dict,
+        patterns: PatternMatrix = None,
+        strategy: str | Strategy = "heuristic",
+        use_book: bool = True,
+        memo: TransitionCache | bool = None,
+        rules: Rules = None,
+        offline: bool = None,
+    ) -> None:
+        if patterns is None:
+            # Rejected words are left out of the matrix's word list, not rebuilt out of it
+            patterns = PatternMatrix.for_words(load_words(offline=offline, overlay=False))
+            if any(word not in patterns.index for word in five_letter_words):
+                patterns = PatternMatrix.for_words(five_letter_words)
+        self.patterns = patterns
+        self.guesses = np.sort(
+            np.fromiter(
+                (self.patterns.index[word] for word in five_letter_words),
+                dtype=np.int32,
+                count=len(five_letter_words),
+            )
+        )
+        self.guessable = np.zeros(len(self.patterns.words), dtype=np.bool_)
+        self.guessable[self.guesses] = True
+        self.rules = rules or Rules()
+        # Words that can be the answer before any feedback
+        self.answers = self.guesses
+        if self.rules.answers is not None:
+            answers = [
+                self.patterns.index[word]
+                for word in self.rules.answers
+                if word in self.patterns.index
+            ]
+            self.answers = np.intersect1d(self.guesses, np.array(answers, dtype=np.int32))
+        self.candidates = self.answers
+        self.strategy = get_strategy(strategy)
+        self.use_book = use_book
+        self.constraints = Constraints()
+        self.constraint_index = ConstraintIndex.for_patterns(self.patterns)
+        self.history = []
+        self.memo = TRANSITIONS if memo is None else memo
+        self._words_key = self._get_words_key()
+
+    def _get_words_key(self) -> tuple:
+        """Identifies the word list, the words that can be guessed and the rules, for state_key."""
+        return (self.patterns.digest, zlib.crc32(self.guesses.tobytes()), *self.rules.key())
+
+    def state_key(self) -> tuple:
+        """
+        Canonical key for everything the feedback so far says, given the words that can be
+        guessed. Games that reach the same constraints share it, whatever order they got there.
+
+        Returns:
+            tuple: Word list key and Constraints.key().
+        """
+        return (self._words_key, self.constraints.key())
+
+    @property
+    def potential_words(self) -> dict:
+        """
+        Words that could still be the answer, mapping each word to 1.
+        Built from candidates on every access, so prefer candidates in hot paths.
+        """
+        return dict.fromkeys([self.patterns.words[indx] for indx in self.candidates], 1)
+
+    @property
+    def five_letter_words(self) -> dict:
+        """
+        Words that can still be guessed, mapping each word to 1.
+        Built from guesses on every access, so prefer guesses or is_guessable in hot paths.
+        """
+        return dict.fromkeys([self.patterns.words[indx] for indx in self.guesses], 1)
+
+    @property
+    def potential_letters(self) -> list:
+        """Letters that are still useful for narrowing down the answer."""
+        return list(self._get_available_letters())
+
+    def is_guessable(self, word: str) -> bool:
+        """
+        Checks if a word is in the word list and hasn't been rejected.
+
+        Args:
+            word (str): 5 letter word.
+
+        Returns:
+            bool: True if the word can be guessed.
+        """
+        indx = self.patterns.index.get(word)
+        return indx is not None and bool(self.guessable[indx])
+
+    def allowed_guesses(self) -> np.ndarray:
+        """
+        Words the rules allow as the next guess, every guessable word
+        unless hard mode makes the hints so far compulsory.
+
+        Returns:
+            np.ndarray: Indexes of the allowed guesses.
+        """
+        if self.rules.hard_mode is False or not self.history:
+            return self.guesses
+        allowed = self.constraint_index.hard_mode_filter(self.guesses, self.constraints)
+        # Only empty if the answer was rejected by Wordle, there's nothing legal left
+        return allowed if len(allowed) else self.candidates
+
+    def is_allowed(self, word: str) -> bool:
+        """
+        Checks if a word can be guessed and follows the rules, see allowed_guesses.
+
+        Args:
+            word (str): 5 letter word.
+
+        Returns:
+            bool: True if the word can be the next guess.
+        """
+        if not self.is_guessable(word):
+            return False
+        return self.rules.hard_mode is False or self.constraints.reuses_hints(word)
+
+    @property
+    def wordle_today(self) -> str:
+        """
+        Grabs the answer from the correct letters found so far.
+        Only works if wordle has been solved.
+
+        Returns:
+            str: Today's wordle.
+        """
+        return "".join(self.constraints.known())
+
+    def update(self, guess: str, pattern: tuple) -> None:
+        """Records the feedback for a guess and narrows down the potential words.
+
+        Args:
+            guess (str):
+                The 5 letter word that was guessed.
+            pattern (tuple | int):
+                The data-state of each tile, one of "absent", "present" or "correct",
+                or the pattern code.
+        """
+        guess = guess.lower()
+        if not isinstance(pattern, (tuple, list)):
+            pattern = decode_pattern(pattern)
+        self.constraints.update(guess, pattern)
+        self.history.append((guess, tuple(pattern)))
+        self.candidates = self._get_potential_words(guess, pattern)
+
+    def new_game(self) -> "SolverEngine":
+        """Copies the engine with no feedback recorded, sharing the word arrays.
+
+        Returns:
+            SolverEngine: Engine ready for a new game.
+        """
+        engine = copy.copy(self)
+        engine.constraints = Constraints()
+        engine.history = []
+        engine.candidates = self.answers
+        return engine
+
+    def branch(self, guess: str, pattern) -> "SolverEngine":
+        """Copies the engine and records feedback on the copy, leaving this engine as is.
+
+        Args:
+            guess (str):
+                The 5 letter word that was guessed.
+            pattern (tuple | int):
+                The data-state of each tile, or the pattern code.
+
+        Returns:
+            SolverEngine: Engine with the extra guess recorded.
+        """
+        # Arrays are replaced rather than changed in place, so the copy can share them
+        engine = copy.copy(self)
+        engine.constraints = self.constraints.copy()
+        engine.history = list(self.history)
+        engine.update(guess, pattern)
+        return engine
+
+    def remove_word(self, word: str) -> None:
+        """Removes a word that Wordle rejected so it won't be guessed again.
+
+        Args:
+            word (str): Word that isn't in Wordle's word list.
+        """
+        indx = self.patterns.index.get(word)
+        if indx is None:
+            return
+        self.candidates = self.candidates[self.candidates != indx]
+        self.answers = self.answers[self.answers != indx]
+        if self.guessable[indx]:
+            self.guessable = self.guessable.copy()
+            self.guessable[indx] = False
+            self.guesses = self.guesses[self.guesses != indx]
+            self._words_key = self._get_words_key()
+
+    @PROFILER.timed("engine.filter")
+    def _get_potential_words(self, guess: str, pattern: tuple) -> np.ndarray:
+        """
+        Filters the potential words with one row of the pattern matrix,
+        or with the constraint bitmasks if the guess isn't in the word list.
+
+        Args:
+            guess (str): The 5 letter word that was guessed.
+            pattern (tuple): The data-state of each tile.
+
+        Returns:
+            np.ndarray: Indexes of the words that are still possible.
+        """
+        key = self.state_key() if self.memo else None
+        candidates = self.memo.candidates(key) if self.memo else None
+        if candidates is not None:
+            return candidates
+        if guess in self.patterns.index:
+            candidates = self.patterns.filter(self.candidates, guess, pattern)
+        else:
+            candidates = self.constraint_index.filter(self.candidates, self.constraints)
+        if self.memo:
+            self.memo.add_candidates(key, candidates)
+        return candidates
+
+    def check_for_win(self, check_word: str) -> bool:
+        """Checks if the given word was the answer.
+
+        Args:
+            check_word (str): Word that was last guessed.
+
+        Returns:
+            bool: True if the word is the answer, False if otherwise.
+        """
+        if not all(self.constraints.known()):
+            return False
+        if check_word != self.wordle_today:
+            return False
+        return True
+
+    def _get_available_letters(self) -> dict:
+        """Letters in the potential words that aren't known yet, mapping each letter to 1."""
+        present = np.zeros(26, dtype=np.bool_)
+        present[self.patterns.letters[self.candidates].ravel()] = True
+        for letter in self.constraints.known():
+            if letter:
+                present[ord(letter) - ord("a")] = False
+        return {chr(ord("a") + indx): 1 for indx in np.flatnonzero(present)}
+
+    @PROFILER.timed("engine.heuristic")
+    def _get_best_guess(self, score: int = 5) -> str:
+        """
+        Picks a random word from the words with no repeated letters, no letters
+        in a spot they're known not to be in, and the most letters left in the
+        potential words. Works on the letter array of every guessable word at once.
+
+        Args:
+            score (int, optional):
+                Most letters left in the potential words to look for. Defaults to 5.
+                Words scoring higher than this are skipped.
+
+        Raises:
+            ValueError: If no word fits the feedback so far.
+
+        Returns:
+            guess (str):
+                Random guess for the list of potential guesses.
+        """
+        if len(self.candidates) == 0:
+            raise ValueError("No words left that fit the feedback")
+        words = self.patterns.words
+        availible_letters = self._get_available_letters()
+
+        if len(self.candidates) == 1 or len(availible_letters) == 0:
+            return words[self.candidates[0]]
+
+        if len(self.candidates) == 2:
+            return words[random.choice(self.candidates)]
+
+        allowed = self.allowed_guesses()
+        letters = self.patterns.letters[allowed]
+        ordered = np.sort(letters, axis=1)
+        valid = (ordered[:, 1:] != ordered[:, :-1]).all(axis=1)
+        for indx in range(5):
+            misplaced = self.constraints.misplaced(indx)
+            valid &= (misplaced >> letters[:, indx].astype(np.int64)) & 1 == 0
+
+        available = np.zeros(26, dtype=np.int8)
+        available[[ord(letter) - ord("a") for letter in availible_letters]] = 1
+        scores = available[letters].sum(axis=1)
+        valid &= scores <= score
+        if not valid.any():
+            return words[random.choice(self.candidates)]
+        best_guesses = allowed[valid & (scores == scores[valid].max())]
+        return words[random.choice(best_guesses)]
+
+    def _book_guess(self):
+        """Looks up the next guess in the strategy's opening book, if it has one."""
+        # Books are built for normal Wordle with every word as a possible answer,
+        # their lines aren't what hard mode would play even where each guess is legal
+        if self.use_book is False or self.rules.hard_mode or self.rules.answers is not None:
+            return None
+        book = OpeningBook.load(self.strategy.name, self.patterns)
+        if book is None:
+            return None
+        guess = book.lookup(self.history)
+        if guess is None or not self.is_allowed(guess):
+            return None
+        return guess
+
+    def first_guess(self) -> str:
+        """Picks the opening guess, a random word unless the strategy knows better.
+
+        Returns:
+            str: 5 letter word.
+        """
+        return self._book_guess() or self.strategy.first_guess(self)
+
+    @PROFILER.timed("engine.next_guess")
+    def next_guess(self) -> str:
+        """Picks the next guess based on all the feedback recorded so far.
+
+        Returns:
+            str: The 5 letter word to guess next.
+        """
+        if not self.history:
+            return self.first_guess()
+        return self._book_guess() or self._choose()
+
+    def _choose(self) -> str:
+        """Asks the strategy for a guess, through the memo if the strategy is deterministic."""
+        if not self.memo or self.strategy.deterministic is False:
+            return self.strategy.choose(self)
+        key = self.state_key()
+        guess = self.memo.guess(key, self.strategy.name)
+        if guess is None:
+            guess = self.strategy.choose(self)
+            self.memo.add_guess(key, self.strategy.name, guess)
+        return guess
+
+    def play(
+        self,
+        answer: str,
+        first_guess: str = "",
+        max_guesses: int = None,
+        timings: list = None,
+    ) -> list[str]:
+        """Plays a full game offline against a known answer.
+
+        Args:
+            answer (str):
+                The hidden 5 letter word.
+            first_guess (str, optional):
+                The first guess the solver will use.
+                If blank, the strategy picks one. Defaults to "".
+            max_guesses (int, optional):
+                Number of guesses before the game is lost. Defaults to the rules' max guesses.
+            timings (list, optional):
+                If given, the seconds spent picking each guess are appended to it.
+
+        Returns:
+            list[str]: Every guess made, the last one is the answer if solved.
+        """
+        guesses = []
+        for turn in range(max_guesses or self.rules.max_guesses):
+            start = time.perf_counter()
+            guess = first_guess.lower() if turn == 0 and first_guess else self.next_guess()
+            if timings is not None:
+                timings.append(time.perf_counter() - start)
+            guesses.append(guess)
+            self.update(guess, get_feedback(guess, answer))
+            if self.check_for_win(guess) is True or len(self.candidates) == 0:
+                break
+        return guesses
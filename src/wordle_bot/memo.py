@@ -0,0 +1,179 @@
+"""Memo Module, remembers where each constraint state leads so games can share the work."""
+
+import atexit
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .words import _read_json, _write_json
+
+MEMO_ENV = "WORDLE_BOT_MEMO"  # File the shared memo is loaded from and saved to
+MAX_ENTRIES = 4096
+
+
+class TransitionCache:
+    """
+    Bounded LRU cache from a constraint state to the words still possible
+    and the guess each deterministic strategy picks there.
+    Keys are (word list key, Constraints.key()), see SolverEngine.state_key.
+
+    Args:
+        max_entries (int, optional): States kept before the oldest is dropped. Defaults to 4096.
+        path (str, optional): JSON file to load from now and to save to. Defaults to none.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, path: str = None) -> None:
+        self.max_entries = max_entries
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.hits = {"candidates": 0, "guesses": 0}
+        self.misses = {"candidates": 0, "guesses": 0}
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def _entry(self, key: tuple) -> dict:
+        """Finds or adds the entry for a state and marks it as most recently used."""
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = {"candidates": None, "guesses": {}}
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        else:
+            self.entries.move_to_end(key)
+        return entry
+
+    def _count(self, kind: str, value):
+        """Counts a lookup as a hit or a miss and passes the value through."""
+        if value is None:
+            self.misses[kind] += 1
+        else:
+            self.hits[kind] += 1
+        return value
+
+    def candidates(self, key: tuple):
+        """
+        Looks up the words still possible in a state.
+
+        Args:
+            key (tuple): State key.
+
+        Returns:
+            np.ndarray | None: Read only word indexes, or None if the state isn't cached.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return self._count("candidates", entry and entry["candidates"])
+
+    def add_candidates(self, key: tuple, candidates: np.ndarray) -> None:
+        """
+        Remembers the words still possible in a state.
+
+        Args:
+            key (tuple): State key.
+            candidates (np.ndarray): Word indexes, shared with every engine that hits it.
+        """
+        candidates.setflags(write=False)
+        with self.lock:
+            self._entry(key)["candidates"] = candidates
+
+    def guess(self, key: tuple, strategy: str):
+        """
+        Looks up the guess a strategy picked in a state.
+
+        Args:
+            key (tuple): State key.
+            strategy (str): Name of the strategy.
+
+        Returns:
+            str | None: The guess, or None if it isn't cached.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return self._count("guesses", entry and entry["guesses"].get(strategy))
+
+    def add_guess(self, key: tuple, strategy: str, guess: str) -> None:
+        """
+        Remembers the guess a strategy picked in a state.
+
+        Args:
+            key (tuple): State key.
+            strategy (str): Name of the strategy.
+            guess (str): The guess.
+        """
+        with self.lock:
+            self._entry(key)["guesses"][strategy] = guess
+
+    def stats(self) -> dict:
+        """
+        Hit and miss counts since the cache was made.
+
+        Returns:
+            dict: Entries plus hits, misses and hit rate for candidates and guesses.
+        """
+        with self.lock:
+            stats = {"entries": len(self.entries)}
+            for kind in self.hits:
+                lookups = self.hits[kind] + self.misses[kind]
+                stats[kind] = {
+                    "hits": self.hits[kind],
+                    "misses": self.misses[kind],
+                    "hit_rate": self.hits[kind] / lookups if lookups else None,
+                }
+            return stats
+
+    def clear(self) -> None:
+        """Forgets every state and resets the stats."""
+        with self.lock:
+            self.entries.clear()
+            self.hits = dict.fromkeys(self.hits, 0)
+            self.misses = dict.fromkeys(self.misses, 0)
+
+    def save(self, path: str = None) -> None:
+        """
+        Saves every state as JSON, most recently used last.
+
+        Args:
+            path (str, optional): File to write. Defaults to the path the cache was made with.
+        """
+        path = path or self.path
+        with self.lock:
+            entries = [
+                [
+                    list(key),
+                    None if entry["candidates"] is None else entry["candidates"].tolist(),
+                    entry["guesses"],
+                ]
+                for key, entry in self.entries.items()
+            ]
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        _write_json(path, {"entries": entries})
+
+    def load(self, path: str) -> None:
+        """
+        Adds the states saved in a file.
+
+        Args:
+            path (str): File written by save.
+        """
+        try:
+            entries = _read_json(path)["entries"]
+        except (OSError, ValueError, KeyError):
+            return
+        for key, candidates, guesses in entries:
+            key = (tuple(key[0]), tuple(key[1]))
+            if candidates is not None:
+                self.add_candidates(key, np.array(candidates, dtype=np.int32))
+            for strategy, guess in guesses.items():
+                self.add_guess(key, strategy, guess)
+
+
+TRANSITIONS = TransitionCache(path=os.getenv(MEMO_ENV))
+if TRANSITIONS.path:
+    atexit.register(TRANSITIONS.save)
@@ -0,0 +1,106 @@
+"""Mock Server Module, serves a local Wordle page for testing the browser without NYT."""
+
+import json
+import os
+import random
+import threading
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .words import load_words
+
+PAGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mock_wordle.html")
+CONFIG_MARKER = "/*CONFIG*/{}"
+
+
+class MockWordleHandler(BaseHTTPRequestHandler):
+    """Serves the mock Wordle page on every path."""
+
+    def __init__(self, page: bytes, *args, **kwargs) -> None:
+        self.page = page
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.page)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(self.page)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class MockWordleServer:
+    """
+    Local HTTP server for a minimal Wordle page that uses the same class names
+    and data-state attributes as the NYT page, so Wordle(base_url=server.url)
+    plays it like the real thing.
+
+    Args:
+        answer (str, optional): The hidden word. Defaults to a random word.
+        flip_delay (float, optional): Seconds each tile takes to flip. Defaults to 0.3.
+        popup_delay (float, optional): Seconds before the end of game popups show. Defaults to 1.
+        toast_delay (float, optional): Seconds a toast stays up. Defaults to 1.
+        host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+        port (int, optional): Port to listen on. Defaults to any free port.
+    """
+
+    def __init__(
+        self,
+        answer: str = None,
+        flip_delay: float = 0.3,
+        popup_delay: float = 1,
+        toast_delay: float = 1,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        words = sorted(load_words(offline=True, overlay=False))
+        self.answer = (answer or random.choice(words)).lower()
+        if self.answer not in words:
+            raise ValueError(f"{self.answer!r} isn't in the word list.")
+        config = {
+            "answer": self.answer,
+            "flip_delay": flip_delay,
+            "popup_delay": popup_delay,
+            "toast_delay": toast_delay,
+            "words": words,
+        }
+        with open(PAGE_PATH, "r", encoding="utf-8") as file:
+            page = file.read().replace(CONFIG_MARKER, json.dumps(config, separators=(",", ":")))
+        self.server = ThreadingHTTPServer(
+            (host, port), partial(MockWordleHandler, page.encode("utf-8"))
+        )
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        """Address of the mock page."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "MockWordleServer":
+        """
+        Serves the page on a background thread.
+
+        Returns:
+            MockWordleServer: The running server.
+        """
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and closes the socket."""
+        if self.thread is not None:
+            self.server.shutdown()
+            self.thread.join()
+            self.thread = None
+        self.server.server_close()
+
+    def __enter__(self) -> "MockWordleServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
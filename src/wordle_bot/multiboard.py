@@ -0,0 +1,168 @@
+"""Multi-board Module, solves Dordle/Quordle style games where every guess goes to every board."""
+
+import time
+
+import numpy as np
+
+from .engine import SolverEngine, get_feedback
+from .memo import TransitionCache
+from .patterns import CORRECT, PatternMatrix
+from .profiler import PROFILER
+from .rules import Rules
+from .strategies import batched_entropy_scores
+
+
+class MultiBoardSolver:
+    """
+    Plays several hidden answers at once with one guess per turn, like Dordle or Quordle.
+    Each board keeps its own SolverEngine, and guesses are picked by the joint
+    information gain across the boards that are still unsolved.
+
+    Args:
+        five_letter_words (Iterable[str]): Every valid guess, like the mapping from load_words.
+        boards (int, optional): Number of hidden answers. Defaults to 4.
+        patterns (PatternMatrix, optional):
+            Precomputed feedback for the word list. Defaults to the shared matrix.
+        rules (Rules, optional):
+            Rules of each board. Hard mode has to hold on every unsolved board.
+            Defaults to normal Wordle.
+        memo (TransitionCache | bool, optional):
+            Cache of the potential words per constraint state, shared by the boards.
+            Defaults to the cache shared by the whole process.
+        offline (bool, optional):
+            Load the word list for the default patterns without touching the network.
+            Defaults to the WORDLE_BOT_OFFLINE environment variable.
+    """
+
+    def __init__(
+        self,
+        five_letter_words: dict,
+        boards: int = 4,
+        patterns: PatternMatrix = None,
+        rules: Rules = None,
+        memo: TransitionCache | bool = None,
+        offline: bool = None,
+    ) -> None:
+        self.rules = rules or Rules()
+        self.engines = []
+        for _ in range(boards):
+            engine = SolverEngine(
+                five_letter_words,
+                patterns=patterns,
+                strategy="entropy",
+                memo=memo,
+                rules=rules,
+                offline=offline,
+            )
+            patterns = engine.patterns
+            self.engines.append(engine)
+        self.patterns = patterns
+        self.solved = [False] * boards
+        self.history = []
+
+    @property
+    def max_guesses(self) -> int:
+        """Guesses before the game is lost, one more per extra board like Dordle and Quordle."""
+        return self.rules.max_guesses + len(self.engines) - 1
+
+    def unsolved(self) -> list:
+        """
+        Engines of the boards that haven't been solved yet.
+
+        Returns:
+            list: SolverEngine per unsolved board.
+        """
+        return [engine for engine, solved in zip(self.engines, self.solved) if solved is False]
+
+    def allowed_guesses(self) -> np.ndarray:
+        """
+        Words every unsolved board allows as the next guess, see SolverEngine.allowed_guesses.
+
+        Returns:
+            np.ndarray: Indexes of the allowed guesses.
+        """
+        engines = self.unsolved()
+        allowed = engines[0].allowed_guesses()
+        for engine in engines[1:]:
+            allowed = np.intersect1d(allowed, engine.allowed_guesses(), assume_unique=True)
+        # Hard mode on two boards can leave no word legal on both, then only the answers are left
+        if len(allowed) == 0:
+            allowed = np.unique(np.concatenate([engine.candidates for engine in engines]))
+        return allowed
+
+    @PROFILER.timed("multiboard.next_guess")
+    def next_guess(self) -> str:
+        """
+        Picks the next guess for every board.
+
+        Returns:
+            str: The 5 letter word to guess next.
+        """
+        engines = self.unsolved()
+        if not self.history:
+            # Every board starts out the same, so the single board opener is the best one
+            return engines[0].first_guess()
+        for engine in engines:
+            # A board that's down to one word is solved by guessing it
+            if len(engine.candidates) == 1:
+                return self.patterns.words[engine.candidates[0]]
+        guesses = self.allowed_guesses()
+        candidate_sets = [engine.candidates for engine in engines]
+        scores = batched_entropy_scores(self.patterns.matrix, guesses, candidate_sets).sum(axis=0)
+        # Ties go to words that could still solve a board, the more boards the better
+        for candidates in candidate_sets:
+            scores[np.isin(guesses, candidates)] += 1e-9
+        return self.patterns.words[guesses[np.argmax(scores)]]
+
+    def update(self, guess: str, patterns: list) -> None:
+        """
+        Records the feedback of a guess on every unsolved board.
+
+        Args:
+            guess (str): The 5 letter word that was guessed.
+            patterns (list): Data-state of each tile or the pattern code, one per board.
+                Solved boards are skipped.
+        """
+        guess = guess.lower()
+        for board, (engine, pattern) in enumerate(zip(self.engines, patterns)):
+            if self.solved[board] is True:
+                continue
+            engine.update(guess, pattern)
+            if all(state == CORRECT for state in engine.history[-1][1]):
+                self.solved[board] = True
+        self.history.append((guess, tuple(patterns)))
+
+    def play(
+        self,
+        answers: list,
+        first_guess: str = "",
+        max_guesses: int = None,
+        timings: list = None,
+    ) -> list[str]:
+        """
+        Plays a full game offline against known answers.
+
+        Args:
+            answers (list): The hidden 5 letter word of each board.
+            first_guess (str, optional): The first guess. If blank, the solver picks one.
+            max_guesses (int, optional):
+                Guesses before the game is lost. Defaults to max_guesses.
+            timings (list, optional):
+                If given, the seconds spent picking each guess are appended to it.
+
+        Returns:
+            list[str]: Every guess made, every answer is in it if solved.
+        """
+        guesses = []
+        for turn in range(max_guesses or self.max_guesses):
+            start = time.perf_counter()
+            guess = first_guess.lower() if turn == 0 and first_guess else self.next_guess()
+            if timings is not None:
+                timings.append(time.perf_counter() - start)
+            guesses.append(guess)
+            self.update(guess, [get_feedback(guess, answer) for answer in answers])
+            if all(self.solved) or any(
+                len(engine.candidates) == 0 for engine in self.unsolved()
+            ):
+                break
+        return guesses
@@ -0,0 +1,176 @@
+"""Opening Book Module, precomputed first guesses and replies to their feedback."""
+
+import json
+import os
+
+import numpy as np
+
+from .patterns import PATTERN_DIRECTORY, SOLVED_PATTERN, PatternMatrix, encode_pattern
+from .words import CACHE_DIRECTORY, load_words
+
+BOOK_DIRECTORIES = (PATTERN_DIRECTORY, CACHE_DIRECTORY)
+
+_BOOKS = {}
+
+
+def book_filename(strategy: str) -> str:
+    """
+    File name of the opening book for a strategy.
+
+    Args:
+        strategy (str): Name of the strategy.
+
+    Returns:
+        str: File name.
+    """
+    return f"opening_book.{strategy}.json"
+
+
+class OpeningBook:
+    """
+    Opener for a strategy plus the guess it makes after each feedback pattern,
+    optionally a few turns deep. Stored as nested JSON keyed by pattern code.
+
+    Args:
+        book (dict): Book as saved by build_book.
+    """
+
+    def __init__(self, book: dict) -> None:
+        self.strategy = book["strategy"]
+        self.word_list = book["word_list"]
+        self.opener = book["opener"]
+        self.depth = book["depth"]
+        self.replies = book["replies"]
+
+    @classmethod
+    def load(cls, strategy: str, patterns: PatternMatrix):
+        """
+        Loads the book for a strategy once per process.
+        Books built for a different word list are ignored.
+
+        Args:
+            strategy (str): Name of the strategy.
+            patterns (PatternMatrix): Matrix for the word list being played.
+
+        Returns:
+            OpeningBook | None: The book, or None if there isn't a usable one.
+        """
+        key = (strategy, patterns.digest)
+        if key not in _BOOKS:
+            _BOOKS[key] = None
+            for directory in BOOK_DIRECTORIES:
+                try:
+                    with open(
+                        os.path.join(directory, book_filename(strategy)), "r", encoding="utf-8"
+                    ) as file:
+                        book = json.load(file)
+                except (OSError, ValueError):
+                    continue
+                if book.get("word_list") == patterns.digest:
+                    _BOOKS[key] = cls(book)
+                    break
+        return _BOOKS[key]
+
+    def lookup(self, history: list):
+        """
+        Finds the next guess for the guesses and feedback so far.
+
+        Args:
+            history (list): (guess, pattern) pairs, oldest first.
+
+        Returns:
+            str | None: The next guess, or None if the book doesn't go that far.
+        """
+        if not history:
+            return self.opener
+        expected = self.opener
+        replies = self.replies
+        for guess, pattern in history:
+            if guess != expected or replies is None:
+                return None
+            reply = replies.get(str(encode_pattern(pattern)))
+            if reply is None:
+                return None
+            expected = reply["guess"]
+            replies = reply.get("replies")
+        return expected
+
+
+def _build_replies(engine_factory, history: list, guess: str, depth: int) -> dict:
+    """Records the strategy's reply to every feedback pattern guess can get after history."""
+    engine = engine_factory(history)
+    replies = {}
+    for code in np.unique(engine.patterns.row(guess)[engine.candidates]).tolist():
+        if code == SOLVED_PATTERN:
+            continue
+        child_history = history + [(guess, code)]
+        child = engine_factory(child_history)
+        reply = {"guess": child.next_guess()}
+        if depth > 1 and len(child.candidates) > 2:
+            reply["replies"] = _build_replies(
+                engine_factory, child_history, reply["guess"], depth - 1
+            )
+        replies[str(code)] = reply
+    return replies
+
+
+def build_book(strategy: str = "entropy", opener: str = "", depth: int = 1) -> dict:
+    """
+    Works out the strategy's reply to every feedback pattern of the opener.
+
+    Args:
+        strategy (str, optional): Name of the strategy. Defaults to "entropy".
+        opener (str, optional): First guess. Defaults to the strategy's own opener.
+        depth (int, optional): Turns after the opener to precompute. Defaults to 1.
+
+    Returns:
+        dict: The book, ready to be saved as JSON.
+    """
+    from .engine import SolverEngine  # The engine reads books, so import it late
+
+    five_letter_words = load_words(offline=True)
+    patterns = PatternMatrix.for_words(load_words(offline=True, overlay=False))
+
+    def engine_factory(history: list) -> SolverEngine:
+        engine = SolverEngine(
+            five_letter_words, patterns=patterns, strategy=strategy, use_book=False
+        )
+        for guess, code in history:
+            engine.update(guess, code)
+        return engine
+
+    opener = opener.lower() or engine_factory([]).first_guess()
+    return {
+        "strategy": strategy,
+        "word_list": patterns.digest,
+        "opener": opener,
+        "depth": depth,
+        "replies": _build_replies(engine_factory, [], opener, depth),
+    }
+
+
+def save_book(book: dict, directory: str = None) -> str:
+    """
+    Saves a book where OpeningBook.load will find it.
+
+    Args:
+        book (dict): Book from build_book.
+        directory (str, optional):
+            Where to save it. Defaults to the package directory,
+            or the cache directory if the package can't be written to.
+
+    Returns:
+        str: Path of the saved book.
+    """
+    directories = [directory] if directory else BOOK_DIRECTORIES
+    for directory in directories:
+        path = os.path.join(directory, book_filename(book["strategy"]))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(book, file, separators=(",", ":"))
+        except OSError:
+            continue
+        _BOOKS.pop((book["strategy"], book["word_list"]), None)
+        return path
+    raise OSError("Couldn't save the opening book anywhere.")
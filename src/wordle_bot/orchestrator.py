@@ -0,0 +1,269 @@
+"""Orchestrator Module, plays many browser games at once from a single event loop."""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from rich.console import Console
+from rich.table import Table
+
+from .browser_pool import BrowserPool
+from .profiler import PROFILER
+from .rules import Rules
+from .wordle import Wordle
+
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+
+
+def _play_blocking(
+    game: int,
+    pool: BrowserPool,
+    base_url: str,
+    strategy: str,
+    first_guess: str,
+    window: tuple,
+    rules: Rules = None,
+) -> dict:
+    """Plays one game on a pooled browser, this is what runs on the worker threads."""
+    start = time.perf_counter()
+    wordle = Wordle(base_url=base_url, pool=pool, quiet=True, rules=rules)
+    try:
+        if window is not None:
+            x, y, width, height = window
+            wordle.browser.set_window_position(x=x, y=y)
+            wordle.browser.set_window_size(width=width, height=height)
+        solved = wordle.solve(first_guess=first_guess, strategy=strategy)
+    finally:
+        wordle.close()
+    return {
+        "game": game,
+        "solved": solved,
+        "answer": wordle.wordle_today if solved is True else None,
+        "guesses": [guess for guess, _ in wordle.engine.history],
+        "seconds": time.perf_counter() - start,
+        "wait_seconds": sum(seconds for _, seconds in wordle.wait_times),
+    }
+
+
+async def play_game(
+    game: int,
+    pool: BrowserPool,
+    limit: asyncio.Semaphore,
+    base_url: str = None,
+    strategy: str = "heuristic",
+    first_guess: str = "",
+    window: tuple = None,
+    rules: Rules = None,
+) -> dict:
+    """
+    Plays one game once a slot is free.
+
+    Args:
+        game (int): Number of the game, used in the report.
+        pool (BrowserPool): Pool to borrow a browser from.
+        limit (asyncio.Semaphore): Caps how many games are played at once.
+        base_url (str, optional): Page to play on. Defaults to NYT Wordle.
+        strategy (str, optional): How guesses are picked. Defaults to "heuristic".
+        first_guess (str, optional): Opening guess. Defaults to the strategy's.
+        window (tuple, optional): x, y, width and height of the browser window.
+        rules (Rules, optional): Rules to solve by. Defaults to normal Wordle.
+
+    Returns:
+        dict: Whether it was solved, the guesses and how long it took.
+    """
+    async with limit:
+        try:
+            # Selenium's WebDriver is blocking, so each game gets a thread while it plays
+            return await asyncio.to_thread(
+                _play_blocking, game, pool, base_url, strategy, first_guess, window, rules
+            )
+        except Exception as error:
+            return {
+                "game": game,
+                "solved": False,
+                "answer": None,
+                "guesses": [],
+                "seconds": None,
+                "wait_seconds": None,
+                "error": f"{type(error).__name__}: {error}",
+            }
+
+
+def window_layout(concurrency: int) -> list:
+    """
+    Splits the screen into side by side windows, one per concurrent game.
+
+    Args:
+        concurrency (int): Games played at once.
+
+    Returns:
+        list: x, y, width and height of each window.
+    """
+    width = SCREEN_WIDTH // concurrency
+    return [(slot * width, 0, width, SCREEN_HEIGHT) for slot in range(concurrency)]
+
+
+async def orchestrate(
+    games: int = 4,
+    concurrency: int = 4,
+    headless: bool = True,
+    base_url: str = None,
+    strategy: str = "heuristic",
+    first_guess: str = "",
+    rules: Rules = None,
+) -> dict:
+    """
+    Plays several games at once with a shared browser pool.
+    Profiling is turned off while they play, the games would share one profiler
+    and each game's write would reset the timings of the others.
+
+    Args:
+        games (int, optional): Games to play. Defaults to 4.
+        concurrency (int, optional): Most games played at once. Defaults to 4.
+        headless (bool, optional): Run the browsers without windows. Defaults to True.
+        base_url (str, optional): Page to play on. Defaults to NYT Wordle.
+        strategy (str, optional): How guesses are picked. Defaults to "heuristic".
+        first_guess (str, optional): Opening guess. Defaults to the strategy's.
+        rules (Rules, optional): Rules every game is solved by. Defaults to normal Wordle.
+
+    Returns:
+        dict: Report from summarize.
+    """
+    concurrency = max(1, min(concurrency, games))
+    windows = None if headless is True else window_layout(concurrency)
+    limit = asyncio.Semaphore(concurrency)
+    # to_thread's default executor is capped by the core count, not by concurrency
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(concurrency))
+    start = time.perf_counter()
+    profile, PROFILER.path = PROFILER.path, None
+    try:
+        with BrowserPool(headless=headless, max_size=concurrency) as pool:
+            results = await asyncio.gather(
+                *(
+                    play_game(
+                        game,
+                        pool,
+                        limit,
+                        base_url=base_url,
+                        strategy=strategy,
+                        first_guess=first_guess,
+                        window=windows[game % concurrency] if windows else None,
+                        rules=rules,
+                    )
+                    for game in range(games)
+                )
+            )
+            browsers = pool.launched
+    finally:
+        PROFILER.path = profile
+    return summarize(results, time.perf_counter() - start, concurrency, browsers)
+
+
+def summarize(results: list, seconds: float, concurrency: int, browsers: int) -> dict:
+    """
+    Builds the report for a run.
+
+    Args:
+        results (list): Results from play_game.
+        seconds (float): Wall time of the whole run.
+        concurrency (int): Most games played at once.
+        browsers (int): Browsers launched.
+
+    Returns:
+        dict: Solve rate, mean guesses, timings and every game's result.
+    """
+    solved = [len(result["guesses"]) for result in results if result["solved"] is True]
+    played = [result["seconds"] for result in results if result["seconds"] is not None]
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "games": len(results),
+        "concurrency": concurrency,
+        "browsers": browsers,
+        "solved": len(solved),
+        "errors": sum(1 for result in results if "error" in result),
+        "mean_guesses": sum(solved) / len(solved) if solved else None,
+        "mean_game_seconds": sum(played) / len(played) if played else None,
+        "total_seconds": seconds,
+        "results": sorted(results, key=lambda result: result["game"]),
+    }
+
+
+def print_report(report: dict, console: Console = None) -> None:
+    """
+    Prints a report as a table.
+
+    Args:
+        report (dict): Report from summarize.
+        console (Console, optional): Console to print to. Defaults to a new one.
+    """
+    console = console or Console()
+    table = Table(title=f"{report['games']} games, {report['concurrency']} at once")
+    table.add_column("Game", justify="right")
+    table.add_column("Guesses")
+    table.add_column("Result")
+    table.add_column("Time", justify="right")
+    for result in report["results"]:
+        if "error" in result:
+            outcome = f"[red]{result['error']}"
+        elif result["solved"] is True:
+            outcome = f"[green bold]{result['answer'].upper()}"
+        else:
+            outcome = "[red]Failed"
+        table.add_row(
+            str(result["game"] + 1),
+            " ".join(result["guesses"]),
+            outcome,
+            f"{result['seconds']:.1f} s" if result["seconds"] is not None else "",
+        )
+    console.print(table)
+    console.print(
+        f"Solved {report['solved']}/{report['games']} with {report['browsers']} browsers "
+        f"in {report['total_seconds']:.1f} s"
+    )
+
+
+def run(
+    games: int = 4,
+    concurrency: int = 4,
+    headless: bool = True,
+    base_url: str = None,
+    strategy: str = "heuristic",
+    first_guess: str = "",
+    output: str = None,
+    rules: Rules = None,
+) -> dict:
+    """
+    Plays the games, prints the report and optionally saves it as JSON.
+
+    Args:
+        games (int, optional): Games to play. Defaults to 4.
+        concurrency (int, optional): Most games played at once. Defaults to 4.
+        headless (bool, optional): Run the browsers without windows. Defaults to True.
+        base_url (str, optional): Page to play on. Defaults to NYT Wordle.
+        strategy (str, optional): How guesses are picked. Defaults to "heuristic".
+        first_guess (str, optional): Opening guess. Defaults to the strategy's.
+        output (str, optional): JSON file for the report.
+        rules (Rules, optional): Rules every game is solved by. Defaults to normal Wordle.
+
+    Returns:
+        dict: Report from summarize.
+    """
+    report = asyncio.run(
+        orchestrate(
+            games=games,
+            concurrency=concurrency,
+            headless=headless,
+            base_url=base_url,
+            strategy=strategy,
+            first_guess=first_guess,
+            rules=rules,
+        )
+    )
+    print_report(report)
+    if output:
+        with open(output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=1)
+    return report
@@ -1,43 +1,173 @@
 import os
-from rich.console import Console
-from datetime import date
-from wordle_bot.wordle import Wordle
+import re
+from typing import TYPE_CHECKING
 
+from wordle_bot.engine import get_feedback
+from wordle_bot.results import ResultsStore, results_path
 
-def output_file(wordle: Wordle) -> None:
-    """Plays wordle, then exports wordle to docs/final_table.md.
+if TYPE_CHECKING:
+    # Only needed for the annotation, importing it would load selenium and rich
+    from wordle_bot.wordle import Wordle
+
+FINAL_TABLE_FILE = "docs/final_table.md"  # Relative to the GitHub workspace
+HEADER = (
+    "# Today's Wordle\n"
+    "\n"
+    "This page displays the results from a GitHub runner, "
+    "which runs the wordle-bot every single day.\n"
+    "\n"
+    "If everything is working correctly, then below should be what the wordle is today:\n"
+)
+RESULT_LINE = re.compile(r"The Wordle for (\S+) (?:is: (\w*)|wasn't solved)")
+
+
+def render_markdown(games: list) -> str:
+    """Builds docs/final_table.md from stored games.
 
     Args:
-        wordle (Wordle):
-            Wordle object used for the data in exporting.
+        games (list):
+            Games from ResultsStore.games, oldest first.
+
+    Returns:
+        str: The whole page.
     """
+    lines = [HEADER]
+    for game in games:
+        lines.append("|   |   |   |   |   |   |")
+        lines.append("| - | - | - | - | - | - |")
+        for x in range(6):
+            if x < len(game["guesses"]):
+                word = game["guesses"][x]
+                lines.append(f"| {word.capitalize()} | " + " | ".join(word.upper()) + " |")
+            else:
+                lines.append("|   |   |   |   |   |   |")
+        if game["solved"] is True:
+            lines.append(f"The Wordle for {game['date']} is: {game['answer'].upper()}")
+        else:
+            lines.append(f"The Wordle for {game['date']} wasn't solved")
+    return "\n".join(lines) + "\n"
+
+
+def read_markdown(text: str) -> list:
+    """Reads the games back out of a page written by render_markdown, or the older appended one.
 
-    FINAL_TABLE_ABSOLUTE_PATH = os.path.join(os.getenv("GITHUB_WORKSPACE"), "docs/final_table.md")
-    with open(
-        FINAL_TABLE_ABSOLUTE_PATH,
-        "a",
-        encoding="utf-8",
-    ) as file:
-        final_table = Console(file=file)
-        today = date.today()
-        final_table.print(
-            "|   |   |   |   |   |   |"
-            + "\n"
-            + "| - | - | - | - | - | - |"
+    Args:
+        text (str):
+            The whole page.
+
+    Returns:
+        list: Dict per game with its date, guesses, answer and whether it was solved,
+        oldest first.
+    """
+    games = []
+    guesses = []
+    for line in text.splitlines():
+        cells = [cell.strip() for cell in line.strip().strip("|").split("|")]
+        if line.startswith("|") and cells[0].isalpha() and len(cells[0]) == 5:
+            guesses.append(cells[0].lower())
+            continue
+        match = RESULT_LINE.match(line.strip())
+        if match is None:
+            continue
+        day, answer = match.groups()
+        # Unsolved games used to print the letters found so far as the answer
+        answer = answer.lower() if answer and len(answer) == 5 else None
+        games.append(
+            {
+                "date": day,
+                "guesses": guesses,
+                "answer": answer,
+                "solved": bool(guesses) and guesses[-1] == answer,
+            }
         )
-        for x in range(1, 7):
-            if not len(wordle.wordle["guess"][x]["word"]) == 0:
-                final_table.print(
-                    f"| {wordle.wordle["guess"][x]["word"].capitalize()}" +
-                    f" | {wordle.wordle["guess"][x]["letters"][0][0]}" +
-                    f" | {wordle.wordle["guess"][x]["letters"][1][0]}" +
-                    f" | {wordle.wordle["guess"][x]["letters"][2][0]}" +
-                    f" | {wordle.wordle["guess"][x]["letters"][3][0]}" +
-                    f" | {wordle.wordle["guess"][x]["letters"][4][0]} |"
-                )
-            else:
-                final_table.print(
-                    "|   |   |   |   |   |   |"
-                )
+        guesses = []
+    return games
+
+
+def seed_store(store: ResultsStore, path: str) -> int:
+    """Fills an empty results store from the games already on the markdown page,
+    so a store that wasn't kept between runs doesn't drop the page's history.
+
+    Args:
+        store (ResultsStore):
+            Store to fill, left alone unless it has no games.
+        path (str):
+            Markdown page to read, see read_markdown.
 
-        final_table.print(f"The Wordle for {today} is: {wordle.wordle_today.upper()}")
+    Returns:
+        int: Games added to the store.
+    """
+    if store.stats()["games"] or not os.path.exists(path):
+        return 0
+    with open(path, encoding="utf-8") as file:
+        games = read_markdown(file.read())
+    for game in games:
+        # The page only keeps the words, the tiles can be worked out when the answer is known
+        patterns = [
+            get_feedback(guess, game["answer"]) if game["answer"] else None
+            for guess in game["guesses"]
+        ]
+        store.record(
+            guesses=game["guesses"],
+            patterns=patterns,
+            strategy="unknown",
+            answer=game["answer"],
+            day=game["date"],
+        )
+    return len(games)
+
+
+def write_markdown(store: ResultsStore, path: str) -> None:
+    """Regenerates the markdown page from the results store.
+
+    Args:
+        store (ResultsStore):
+            Store to read every game from.
+        path (str):
+            Markdown file to overwrite.
+    """
+    games = list(reversed(store.games()))
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        file.write(render_markdown(games))
+    os.replace(temp_path, path)
+
+
+def output_file(
+    wordle: "Wordle",
+    strategy: str = "heuristic",
+    retries: int = 0,
+    seconds: float = None,
+) -> int:
+    """Records a played wordle in the results store, then regenerates docs/final_table.md.
+    An empty store is first filled from the games already on the page.
+
+    Args:
+        wordle (Wordle):
+            Wordle object used for the data in exporting.
+        strategy (str, optional):
+            Strategy that played. Defaults to "heuristic".
+        retries (int, optional):
+            Attempts that failed before this one. Defaults to 0.
+        seconds (float, optional):
+            Wall time of the game.
+
+    Returns:
+        int: Id of the game in the store.
+    """
+    history = wordle.engine.history
+    solved = bool(history) and wordle.engine.check_for_win(history[-1][0])
+    path = os.path.join(os.getenv("GITHUB_WORKSPACE"), FINAL_TABLE_FILE)
+    with ResultsStore(results_path()) as store:
+        seed_store(store, path)
+        game_id = store.record(
+            guesses=[guess for guess, _ in history],
+            patterns=[pattern for _, pattern in history],
+            strategy=strategy,
+            answer=wordle.wordle_today if solved else None,
+            retries=retries,
+            seconds=seconds,
+            wait_seconds=sum(wait for _, wait in wordle.wait_times),
+        )
+        write_markdown(store, path)
+    return game_id
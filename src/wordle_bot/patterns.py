@@ -0,0 +1,277 @@
+"""Pattern Module, precomputes the feedback of every guess against every answer."""
+
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+from .words import CACHE_DIRECTORY, decode_words, encode_words
+
+ABSENT = "absent"
+PRESENT = "present"
+CORRECT = "correct"
+TILE_STATES = (ABSENT, PRESENT, CORRECT)
+PATTERN_COUNT = 243
+SOLVED_PATTERN = PATTERN_COUNT - 1
+PATTERN_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+CHUNK_SIZE = 512
+
+_MATRICES = {}
+
+
+def encode_pattern(pattern: tuple) -> int:
+    """
+    Turns the data-state of 5 tiles into a base 3 code between 0 and 242.
+    The first tile is the least significant digit, "absent" is 0,
+    "present" is 1 and "correct" is 2.
+
+    Args:
+        pattern (tuple): The data-state of each tile.
+
+    Returns:
+        int: Pattern code.
+    """
+    if isinstance(pattern, (int, np.integer)):
+        return int(pattern)
+    code = 0
+    for state in reversed(pattern):
+        code = code * 3 + TILE_STATES.index(state)
+    return code
+
+
+def decode_pattern(code: int) -> tuple[str, ...]:
+    """
+    Turns a pattern code back into the data-state of 5 tiles.
+
+    Args:
+        code (int): Pattern code between 0 and 242.
+
+    Returns:
+        tuple[str, ...]: The data-state of each tile.
+    """
+    pattern = []
+    for _ in range(5):
+        code, state = divmod(int(code), 3)
+        pattern.append(TILE_STATES[state])
+    return tuple(pattern)
+
+
+def compute_patterns(guesses: np.ndarray, answers: np.ndarray) -> np.ndarray:
+    """
+    Scores every guess against every answer, handling duplicate letters
+    the same way NYT Wordle does.
+
+    Args:
+        guesses (np.ndarray): (guesses, 5) array from encode_words.
+        answers (np.ndarray): (answers, 5) array from encode_words.
+
+    Returns:
+        np.ndarray: (guesses, answers) uint8 array of pattern codes.
+    """
+    letter_counts = np.zeros((26, len(answers)), dtype=np.int8)
+    for indx in range(5):
+        np.add.at(letter_counts, (answers[:, indx], np.arange(len(answers))), 1)
+
+    greens = [guesses[:, indx, None] == answers[None, :, indx] for indx in range(5)]
+    codes = np.zeros((len(guesses), len(answers)), dtype=np.uint8)
+    yellows = []
+    for indx in range(5):
+        same_letter = guesses == guesses[:, indx : indx + 1]
+        # Copies of the letter in the answer that aren't already used up by a green tile
+        available = letter_counts[guesses[:, indx]]
+        used = np.zeros_like(available)
+        for other in range(5):
+            used += greens[other] & same_letter[:, other : other + 1]
+            if other < indx:
+                used += yellows[other] & same_letter[:, other : other + 1]
+        yellow = ~greens[indx] & (available > used)
+        yellows.append(yellow)
+        codes += (greens[indx] * np.uint8(2) + yellow) * np.uint8(3**indx)
+    return codes
+
+
+def words_digest(words: list) -> str:
+    """
+    Fingerprints a word list, used to tell if a saved matrix is stale.
+
+    Args:
+        words (list): Sorted 5 letter words.
+
+    Returns:
+        str: Short hex digest.
+    """
+    return hashlib.sha1("\n".join(words).encode("ascii")).hexdigest()[:12]
+
+
+class PatternMatrix:
+    """
+    Guess x answer matrix of pattern codes for a word list.
+    The matrix is saved as a .npy next to the word list and memory mapped
+    the first time it is needed. The file name contains a digest of the
+    word list, so it gets rebuilt whenever the word list changes.
+
+    Args:
+        words (list):
+            Every 5 letter word, used both as guesses and answers.
+        directory (str, optional):
+            Where the .npy is saved. Defaults to the package directory.
+    """
+
+    def __init__(self, words: list, directory: str = PATTERN_DIRECTORY) -> None:
+        self.words = sorted(words)
+        self.index = {word: indx for indx, word in enumerate(self.words)}
+        self.letters = encode_words(self.words)
+        self.digest = words_digest(self.words)
+        self.directory = directory
+        self._matrix = None
+
+    @classmethod
+    def for_words(cls, words, directory: str = PATTERN_DIRECTORY) -> "PatternMatrix":
+        """
+        Shares one PatternMatrix per word list across the whole process.
+
+        Args:
+            words (Iterable[str]): Every 5 letter word.
+            directory (str, optional): Where the .npy is saved.
+
+        Returns:
+            PatternMatrix: Matrix for the word list.
+        """
+        words = sorted(words)
+        key = (words_digest(words), directory)
+        if key not in _MATRICES:
+            _MATRICES[key] = cls(words, directory=directory)
+        return _MATRICES[key]
+
+    @classmethod
+    def from_arrays(
+        cls, letters: np.ndarray, matrix: np.ndarray, directory: str = PATTERN_DIRECTORY
+    ) -> "PatternMatrix":
+        """
+        Wraps arrays that were already built somewhere else, like shared memory,
+        without copying them. The result is shared the same way as for_words.
+
+        Args:
+            letters (np.ndarray): (words, 5) array from encode_words, in sorted order.
+            matrix (np.ndarray): (guesses, answers) pattern matrix for those words.
+            directory (str, optional): Directory the matrix would be saved to.
+
+        Returns:
+            PatternMatrix: Matrix for the word list.
+        """
+        patterns = cls(decode_words(letters), directory=directory)
+        patterns.letters = letters
+        patterns._matrix = matrix
+        _MATRICES[patterns.digest, directory] = patterns
+        return patterns
+
+    @property
+    def filename(self) -> str:
+        """File name of the saved matrix for this word list."""
+        return f"five_letter_words.{self.digest}.npy"
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The (guesses, answers) pattern matrix, built on first use."""
+        if self._matrix is None:
+            self._matrix = self._load()
+        return self._matrix
+
+    def _load(self) -> np.ndarray:
+        for directory in (self.directory, CACHE_DIRECTORY):
+            path = os.path.join(directory, self.filename)
+            if os.path.exists(path):
+                matrix = np.load(path, mmap_mode="r")
+                if matrix.shape == (len(self.words), len(self.words)):
+                    return matrix
+        for directory in (self.directory, CACHE_DIRECTORY):
+            try:
+                return self.build(directory)
+            except OSError:
+                continue
+        return self.compute()
+
+    def compute(self) -> np.ndarray:
+        """
+        Computes the whole matrix in memory without saving it.
+
+        Returns:
+            np.ndarray: (guesses, answers) uint8 array of pattern codes.
+        """
+        matrix = np.empty((len(self.words), len(self.words)), dtype=np.uint8)
+        for start in range(0, len(self.words), CHUNK_SIZE):
+            matrix[start : start + CHUNK_SIZE] = compute_patterns(
+                self.letters[start : start + CHUNK_SIZE], self.letters
+            )
+        return matrix
+
+    def build(self, directory: str) -> np.ndarray:
+        """
+        Computes the matrix and saves it to directory. Matrices for other word lists
+        are left alone, the cached and bundled lists can both be in use.
+
+        Args:
+            directory (str): Where the .npy is saved.
+
+        Raises:
+            OSError: If directory can't be written to.
+
+        Returns:
+            np.ndarray: Memory mapped (guesses, answers) matrix.
+        """
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix=".npy", dir=directory)
+        os.close(fd)
+        try:
+            matrix = np.lib.format.open_memmap(
+                temp_path, mode="w+", dtype=np.uint8, shape=(len(self.words), len(self.words))
+            )
+            for start in range(0, len(self.words), CHUNK_SIZE):
+                matrix[start : start + CHUNK_SIZE] = compute_patterns(
+                    self.letters[start : start + CHUNK_SIZE], self.letters
+                )
+            matrix.flush()
+            del matrix
+            os.chmod(temp_path, 0o644)
+            path = os.path.join(directory, self.filename)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return np.load(path, mmap_mode="r")
+
+    def row(self, guess: str) -> np.ndarray:
+        """
+        Pattern codes of a guess against every answer.
+        Guesses outside the word list are scored on the fly.
+
+        Args:
+            guess (str): 5 letter word.
+
+        Returns:
+            np.ndarray: uint8 array of pattern codes, one per word.
+        """
+        if guess in self.index:
+            return self.matrix[self.index[guess]]
+        return compute_patterns(encode_words([guess]), self.letters)[0]
+
+    def filter(self, candidates: np.ndarray, guess: str, pattern) -> np.ndarray:
+        """
+        Keeps the candidates that would have produced the observed pattern.
+
+        Args:
+            candidates (np.ndarray): Indexes of words that could be the answer.
+            guess (str): 5 letter word that was guessed.
+            pattern (tuple | int): Observed data-states or pattern code.
+
+        Returns:
+            np.ndarray: Indexes of the candidates that are still possible.
+        """
+        code = encode_pattern(pattern)
+        if guess in self.index:
+            row = self.matrix[self.index[guess], candidates]
+        else:
+            row = compute_patterns(encode_words([guess]), self.letters[candidates])[0]
+        return candidates[row == code]
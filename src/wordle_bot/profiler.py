@@ -0,0 +1,190 @@
+"""Profiler Module, optional wall time and call counters for the hot paths."""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+PROFILE_ENV = "WORDLE_BOT_PROFILE"  # File to append the JSON lines to, enables profiling
+
+
+class Profiler:
+    """
+    Wall time and call count of named phases, plus plain counters like WebDriver calls.
+    Does nothing but a flag check while disabled.
+
+    Args:
+        path (str, optional): JSON lines file for write. Profiling is disabled without one.
+    """
+
+    def __init__(self, path: str = None) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.phases = {}
+        self.counters = {}
+
+    @property
+    def enabled(self) -> bool:
+        """True if anything is being recorded."""
+        return bool(self.path)
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Records one run of a phase.
+
+        Args:
+            phase (str): Name of the phase.
+            seconds (float): Wall time it took.
+        """
+        with self.lock:
+            calls, total = self.phases.get(phase, (0, 0.0))
+            self.phases[phase] = (calls + 1, total + seconds)
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        """
+        Bumps a counter.
+
+        Args:
+            counter (str): Name of the counter.
+            amount (int, optional): How much to add. Defaults to 1.
+        """
+        with self.lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    @contextmanager
+    def phase(self, phase: str):
+        """
+        Times the body of a with block as a phase.
+
+        Args:
+            phase (str): Name of the phase.
+        """
+        if not self.path:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+    def timed(self, phase: str):
+        """
+        Decorator that times every call of a function as a phase.
+
+        Args:
+            phase (str): Name of the phase.
+
+        Returns:
+            Callable: The decorator.
+        """
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.path:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.add(phase, time.perf_counter() - start)
+
+            return wrapper
+
+        return decorator
+
+    def watch(self, browser) -> None:
+        """
+        Counts every WebDriver command a browser sends, per command.
+        Elements send their commands through the browser, so they're counted too.
+
+        Args:
+            browser (WebDriver): Browser to watch.
+        """
+        # Pooled browsers come back here for every game, only wrap them once
+        if not self.path or hasattr(browser.execute, "__wrapped__"):
+            return
+        execute = browser.execute
+
+        @functools.wraps(execute)
+        def counted(driver_command: str, params: dict = None):
+            self.count("webdriver")
+            self.count(f"webdriver.{driver_command}")
+            return execute(driver_command, params)
+
+        browser.execute = counted
+
+    def summary(self) -> dict:
+        """
+        Everything recorded so far.
+
+        Returns:
+            dict: Calls and seconds per phase, and the counters.
+        """
+        with self.lock:
+            return {
+                "date": datetime.now().isoformat(timespec="seconds"),
+                "phases": {
+                    phase: {"calls": calls, "seconds": seconds}
+                    for phase, (calls, seconds) in sorted(self.phases.items())
+                },
+                "counters": dict(sorted(self.counters.items())),
+            }
+
+    def reset(self) -> None:
+        """Forgets everything recorded so far."""
+        with self.lock:
+            self.phases = {}
+            self.counters = {}
+
+    def write(self, **fields) -> dict:
+        """
+        Appends the summary as one JSON line and starts over.
+
+        Args:
+            **fields: Extra fields for the line, like the game's result.
+
+        Returns:
+            dict: The line that was written.
+        """
+        line = {**fields, **self.summary()}
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(line) + "\n")
+        self.reset()
+        return line
+
+
+def print_summary(summary: dict, console=None) -> None:
+    """
+    Prints a summary as a table.
+
+    Args:
+        summary (dict): Summary from Profiler.summary.
+        console (Console, optional): Console to print to. Defaults to a new one.
+    """
+    from rich.console import Console
+    from rich.table import Table
+
+    console = console or Console()
+    table = Table(title="Profile")
+    table.add_column("Phase")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Mean", justify="right")
+    for phase, stats in summary["phases"].items():
+        table.add_row(
+            phase,
+            str(stats["calls"]),
+            f"{stats['seconds'] * 1000:.1f} ms",
+            f"{stats['seconds'] * 1000 / stats['calls']:.2f} ms",
+        )
+    for counter, value in summary["counters"].items():
+        table.add_row(counter, str(value), "", "")
+    console.print(table)
+
+
+PROFILER = Profiler(os.getenv(PROFILE_ENV))
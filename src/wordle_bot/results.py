@@ -0,0 +1,214 @@
+"""Results Module, keeps every game played in a SQLite database that can be queried."""
+
+import json
+import os
+import sqlite3
+from datetime import date
+
+from .patterns import SOLVED_PATTERN, decode_pattern, encode_pattern
+
+RESULTS_ENV = "WORDLE_BOT_RESULTS"  # Database the daily results are recorded in
+RESULTS_FILE = "docs/results.db"  # Relative to the GitHub workspace
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    answer TEXT,
+    solved INTEGER NOT NULL,
+    strategy TEXT NOT NULL,
+    retries INTEGER NOT NULL DEFAULT 0,
+    seconds REAL,
+    wait_seconds REAL,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS guesses (
+    game_id INTEGER NOT NULL REFERENCES games (id) ON DELETE CASCADE,
+    turn INTEGER NOT NULL,
+    word TEXT NOT NULL,
+    pattern INTEGER,
+    seconds REAL,
+    PRIMARY KEY (game_id, turn)
+);
+CREATE INDEX IF NOT EXISTS games_date ON games (date);
+CREATE INDEX IF NOT EXISTS games_strategy ON games (strategy, date);
+CREATE INDEX IF NOT EXISTS guesses_word ON guesses (word);
+"""
+
+
+def results_path() -> str:
+    """
+    Where the daily results are recorded, WORDLE_BOT_RESULTS or docs/results.db
+    in the GitHub workspace.
+
+    Returns:
+        str: Path of the database, or None if neither is set.
+    """
+    if os.getenv(RESULTS_ENV):
+        return os.getenv(RESULTS_ENV)
+    if os.getenv("GITHUB_WORKSPACE"):
+        return os.path.join(os.getenv("GITHUB_WORKSPACE"), RESULTS_FILE)
+    return None
+
+
+class ResultsStore:
+    """
+    SQLite database of played games, one row per game plus one row per guess.
+
+    Args:
+        path (str): Database file, created if it doesn't exist. ":memory:" works too.
+    """
+
+    def __init__(self, path: str) -> None:
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+
+    def record(
+        self,
+        guesses: list,
+        patterns: list,
+        strategy: str,
+        answer: str = None,
+        day: str = None,
+        retries: int = 0,
+        seconds: float = None,
+        wait_seconds: float = None,
+        timings: list = None,
+        extra: dict = None,
+    ) -> int:
+        """
+        Saves one game.
+
+        Args:
+            guesses (list): Every word guessed, in order.
+            patterns (list): Data-state of each tile or the pattern code, per guess.
+                None where it isn't known, like games read back from the page.
+            strategy (str): Name of the strategy that played.
+            answer (str, optional): The hidden word, if it's known.
+            day (str, optional): ISO date of the game. Defaults to today.
+            retries (int, optional): Attempts that failed before this one. Defaults to 0.
+            seconds (float, optional): Wall time of the game.
+            wait_seconds (float, optional): Part of seconds spent waiting on the page.
+            timings (list, optional): Seconds spent picking each guess.
+            extra (dict, optional): Anything else worth keeping, saved as JSON.
+
+        Returns:
+            int: Id of the game.
+        """
+        codes = [None if pattern is None else encode_pattern(pattern) for pattern in patterns]
+        solved = bool(codes) and codes[-1] == SOLVED_PATTERN
+        timings = timings or [None] * len(guesses)
+        with self.connection:
+            game_id = self.connection.execute(
+                "INSERT INTO games (date, answer, solved, strategy, retries, seconds, "
+                "wait_seconds, extra) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    day or date.today().isoformat(),
+                    answer or (guesses[-1] if solved else None),
+                    int(solved),
+                    strategy,
+                    retries,
+                    seconds,
+                    wait_seconds,
+                    json.dumps(extra) if extra else None,
+                ),
+            ).lastrowid
+            self.connection.executemany(
+                "INSERT INTO guesses (game_id, turn, word, pattern, seconds) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (game_id, turn, word, code, timing)
+                    for turn, (word, code, timing) in enumerate(
+                        zip(guesses, codes, timings), start=1
+                    )
+                ],
+            )
+        return game_id
+
+    def games(self, strategy: str = None, since: str = None, limit: int = None) -> list:
+        """
+        Looks up games, newest first.
+
+        Args:
+            strategy (str, optional): Only games played by this strategy.
+            since (str, optional): Only games on or after this ISO date.
+            limit (int, optional): Most games to return. Defaults to all.
+
+        Returns:
+            list: Dict per game, with its guesses and the data-state of their tiles.
+        """
+        query = "SELECT * FROM games WHERE 1"
+        params = []
+        if strategy is not None:
+            query += " AND strategy = ?"
+            params.append(strategy)
+        if since is not None:
+            query += " AND date >= ?"
+            params.append(since)
+        query += " ORDER BY date DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        games = [dict(row) for row in self.connection.execute(query, params)]
+        for game in games:
+            rows = self.connection.execute(
+                "SELECT word, pattern, seconds FROM guesses WHERE game_id = ? ORDER BY turn",
+                (game["id"],),
+            ).fetchall()
+            game["solved"] = bool(game["solved"])
+            game["extra"] = json.loads(game["extra"]) if game["extra"] else None
+            game["guesses"] = [row["word"] for row in rows]
+            game["patterns"] = [
+                None if row["pattern"] is None else decode_pattern(row["pattern"]) for row in rows
+            ]
+            game["guess_seconds"] = [row["seconds"] for row in rows]
+        return games
+
+    def stats(self, strategy: str = None) -> dict:
+        """
+        Sums up every game, without loading them.
+
+        Args:
+            strategy (str, optional): Only games played by this strategy.
+
+        Returns:
+            dict: Games, solve rate, mean guesses and guess distribution.
+        """
+        where, params = ("WHERE strategy = ?", (strategy,)) if strategy else ("WHERE 1", ())
+        games, solved, retries = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(solved), 0), COALESCE(SUM(retries), 0) "
+            f"FROM games {where}",
+            params,
+        ).fetchone()
+        distribution = dict(
+            self.connection.execute(
+                "SELECT turns, COUNT(*) FROM (SELECT COUNT(*) AS turns FROM guesses "
+                f"JOIN games ON games.id = game_id {where} AND solved = 1 GROUP BY game_id) "
+                "GROUP BY turns ORDER BY turns",
+                params,
+            ).fetchall()
+        )
+        turns = sum(turn * count for turn, count in distribution.items())
+        return {
+            "games": games,
+            "solved": solved,
+            "retries": retries,
+            "solve_rate": solved / games if games else None,
+            "mean_guesses": turns / solved if solved else None,
+            "guess_distribution": {str(turn): count for turn, count in distribution.items()},
+        }
+
+    def close(self) -> None:
+        """Closes the database."""
+        self.connection.close()
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,327 @@
+"""Reverse Module, works out which answers could be behind shared result grids."""
+
+import functools
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from .patterns import (
+    ABSENT,
+    CORRECT,
+    PATTERN_COUNT,
+    PATTERN_DIRECTORY,
+    PRESENT,
+    SOLVED_PATTERN,
+    PatternMatrix,
+    encode_pattern,
+)
+from .words import CACHE_DIRECTORY, load_words
+
+COLUMN_CHUNK = 64  # Answers counted at once while building the index
+CACHE_SIZE = 1 << 16  # Grids remembered, shared grids repeat a lot
+TILES = {
+    "🟩": CORRECT,  # Green
+    "🟧": CORRECT,  # High contrast orange
+    "g": CORRECT,
+    "2": CORRECT,
+    "🟨": PRESENT,  # Yellow
+    "🟦": PRESENT,  # High contrast blue
+    "y": PRESENT,
+    "1": PRESENT,
+    "⬛": ABSENT,  # Dark theme
+    "⬜": ABSENT,  # Light theme
+    "b": ABSENT,
+    "x": ABSENT,
+    ".": ABSENT,
+    "-": ABSENT,
+    "0": ABSENT,
+}
+
+_INDEXES = {}
+
+
+def parse_row(row: str, index: dict = None) -> tuple:
+    """
+    Reads one row of a grid, like "🟩⬛🟨⬛⬛", "gbybb" or "crane:gbybb".
+
+    Args:
+        row (str): Tiles of the row, optionally after the guess and a colon.
+        index (dict, optional): Word to index of the word list, like PatternMatrix.index.
+            If given, guesses have to be in it.
+
+    Raises:
+        ValueError: If the row isn't 5 known tiles, or the guess isn't a known 5 letter word.
+
+    Returns:
+        tuple: The guess or None, and the pattern code.
+    """
+    guess = None
+    if ":" in row:
+        guess, row = row.split(":", 1)
+        guess = guess.strip().lower()
+        if len(guess) != 5 or not guess.isascii() or not guess.isalpha():
+            raise ValueError(f"{guess!r} isn't a 5 letter word")
+        if index is not None and guess not in index:
+            raise ValueError(f"{guess!r} isn't in the word list")
+    # Emoji sometimes carry a variation selector after them
+    tiles = [TILES.get(tile.lower()) for tile in row.strip().replace("\ufe0f", "")]
+    if len(tiles) != 5 or None in tiles:
+        raise ValueError(f"Can't read {row!r} as a row of 5 tiles")
+    return guess, encode_pattern(tuple(tiles))
+
+
+def parse_grid(line: str, index: dict = None) -> list:
+    """
+    Reads a grid from one line of input. The line is either plain text with
+    the rows separated by spaces, commas or slashes, a JSON list of rows,
+    or a JSON object with a "grid" list and an optional "guesses" list.
+
+    Args:
+        line (str): One line of input.
+        index (dict, optional): Word list the guesses have to be in, see parse_row.
+
+    Raises:
+        ValueError: If the line isn't a grid.
+
+    Returns:
+        list: (guess or None, pattern code) for each row.
+    """
+    line = line.strip()
+    if line.startswith(("{", "[")):
+        grid = json.loads(line)
+        if isinstance(grid, dict):
+            guesses = grid.get("guesses") or []
+            grid = grid["grid"]
+            if not isinstance(grid, list) or not isinstance(guesses, list):
+                raise ValueError("\"grid\" and \"guesses\" have to be lists")
+            grid = [
+                f"{guesses[indx]}:{row}" if indx < len(guesses) else row
+                for indx, row in enumerate(grid)
+            ]
+    else:
+        grid = line.replace(",", " ").replace("/", " ").split()
+    if not isinstance(grid, list) or not grid:
+        raise ValueError("Empty grid")
+    for row in grid:
+        if not isinstance(row, str):
+            raise ValueError(f"Can't read {row!r} as a row, rows have to be text")
+    return [parse_row(row, index=index) for row in grid]
+
+
+class ReverseIndex:
+    """
+    (PATTERN_COUNT, answers) count of the guesses that give each pattern against each answer,
+    so a grid without its guesses can be checked against every answer with one lookup per row.
+    Saved as a .npy next to the pattern matrix the first time it is needed.
+
+    Args:
+        patterns (PatternMatrix): Pattern matrix for the word list.
+        directory (str, optional): Where the .npy is saved. Defaults to the package directory.
+    """
+
+    def __init__(self, patterns: PatternMatrix, directory: str = PATTERN_DIRECTORY) -> None:
+        self.patterns = patterns
+        self.directory = directory
+        self._counts = None
+        self._log_counts = None
+
+    @classmethod
+    def for_patterns(cls, patterns: PatternMatrix) -> "ReverseIndex":
+        """
+        Shares one ReverseIndex per word list across the whole process.
+
+        Args:
+            patterns (PatternMatrix): Pattern matrix for the word list.
+
+        Returns:
+            ReverseIndex: Index for the word list.
+        """
+        if patterns.digest not in _INDEXES:
+            _INDEXES[patterns.digest] = cls(patterns, directory=patterns.directory)
+        return _INDEXES[patterns.digest]
+
+    @property
+    def filename(self) -> str:
+        """File name of the saved index for this word list."""
+        return f"pattern_counts.{self.patterns.digest}.npy"
+
+    @property
+    def counts(self) -> np.ndarray:
+        """The (PATTERN_COUNT, answers) uint16 counts, built on first use."""
+        if self._counts is None:
+            self._counts = self._load()
+        return self._counts
+
+    @property
+    def log_counts(self) -> np.ndarray:
+        """log2 of counts as float32, -inf where a pattern can't happen. Kept in memory."""
+        if self._log_counts is None:
+            with np.errstate(divide="ignore"):
+                self._log_counts = np.log2(self.counts, dtype=np.float32)
+        return self._log_counts
+
+    def _load(self) -> np.ndarray:
+        shape = (PATTERN_COUNT, len(self.patterns.words))
+        for directory in (self.directory, CACHE_DIRECTORY):
+            path = os.path.join(directory, self.filename)
+            if os.path.exists(path):
+                counts = np.load(path, mmap_mode="r")
+                if counts.shape == shape:
+                    return counts
+        counts = self.compute()
+        for directory in (self.directory, CACHE_DIRECTORY):
+            try:
+                self.save(counts, directory)
+                break
+            except OSError:
+                continue
+        return counts
+
+    def compute(self) -> np.ndarray:
+        """
+        Counts the patterns in every column of the pattern matrix, a chunk of answers at a time.
+
+        Returns:
+            np.ndarray: (PATTERN_COUNT, answers) uint16 counts.
+        """
+        matrix = self.patterns.matrix
+        answers = matrix.shape[1]
+        counts = np.empty((PATTERN_COUNT, answers), dtype=np.uint16)
+        for start in range(0, answers, COLUMN_CHUNK):
+            columns = np.asarray(matrix[:, start : start + COLUMN_CHUNK], dtype=np.int32)
+            offsets = np.arange(columns.shape[1], dtype=np.int32) * PATTERN_COUNT
+            chunk = np.bincount(
+                (columns + offsets).ravel(), minlength=columns.shape[1] * PATTERN_COUNT
+            )
+            counts[:, start : start + columns.shape[1]] = chunk.reshape(-1, PATTERN_COUNT).T
+        return counts
+
+    def save(self, counts: np.ndarray, directory: str) -> None:
+        """
+        Saves the counts to directory.
+
+        Args:
+            counts (np.ndarray): Result of compute.
+            directory (str): Where the .npy is saved.
+
+        Raises:
+            OSError: If directory can't be written to.
+        """
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix=".npy", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                np.save(file, counts)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, os.path.join(directory, self.filename))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+class ReverseSolver:
+    """
+    Finds the answers that are consistent with result grids, and ranks them.
+    Rows with a known guess are checked exactly against the pattern matrix.
+    Rows without one only need some word to give that pattern, and an answer
+    ranks higher the more words would, as if the player guessed at random.
+
+    Args:
+        patterns (PatternMatrix, optional):
+            Pattern matrix for the word list. Defaults to the shared matrix for the full list.
+        answers (Iterable[str], optional):
+            Words that can be the answer. Defaults to every word.
+        cache_size (int, optional): Grids remembered. Defaults to CACHE_SIZE.
+    """
+
+    def __init__(
+        self, patterns: PatternMatrix = None, answers=None, cache_size: int = CACHE_SIZE
+    ) -> None:
+        if patterns is None:
+            patterns = PatternMatrix.for_words(load_words(offline=True, overlay=False))
+        self.patterns = patterns
+        self.index = ReverseIndex.for_patterns(patterns)
+        self.answers = np.arange(len(patterns.words), dtype=np.int32)
+        if answers is not None:
+            self.answers = np.array(
+                sorted(patterns.index[word] for word in answers if word in patterns.index),
+                dtype=np.int32,
+            )
+        self._solve = functools.lru_cache(maxsize=cache_size)(self._solve_grid)
+
+    def _solve_grid(self, grid: tuple, top: int) -> tuple:
+        """Number of consistent answers, and the best ones with their probability."""
+        # Only the last row can be solved, a grid that goes on after it is made up
+        if any(code == SOLVED_PATTERN for _, code in grid[:-1]):
+            return 0, ()
+        candidates = self.answers
+        for guess, code in grid:
+            if guess is not None:
+                candidates = candidates[self.patterns.row(guess)[candidates] == code]
+        codes = [code for guess, code in grid if guess is None]
+        # Rows with a known guess are exact, the rest rank by how many guesses fit them
+        scores = self.index.log_counts[codes].sum(axis=0)[candidates]
+        possible = np.isfinite(scores)
+        candidates, scores = candidates[possible], scores[possible]
+        if len(candidates) == 0:
+            return 0, ()
+        probabilities = np.exp2(scores - scores.max())
+        probabilities /= probabilities.sum()
+        best = np.arange(len(candidates))
+        if len(best) > top:
+            # Everything tied with the last of the top stays in, so ties keep word order
+            cutoff = np.partition(scores, len(scores) - top)[len(scores) - top]
+            best = np.flatnonzero(scores >= cutoff)
+        best = best[np.lexsort((candidates[best], -scores[best]))][:top]
+        return len(candidates), tuple(
+            (self.patterns.words[candidates[indx]], float(probabilities[indx])) for indx in best
+        )
+
+    def solve(self, grid: list, top: int = 10) -> dict:
+        """
+        Finds the answers that could be behind a grid.
+
+        Args:
+            grid (list): (guess or None, pattern code) for each row, like parse_grid.
+            top (int, optional): Most answers to return. Defaults to 10.
+
+        Returns:
+            dict: How many answers are consistent and the best ones,
+            with the probability of each among all of them.
+
+        Raises:
+            ValueError: If top is less than 1.
+        """
+        if top < 1:
+            raise ValueError(f"top has to be at least 1, not {top}")
+        count, best = self._solve(tuple(grid), top)
+        return {
+            "count": count,
+            "answers": [{"word": word, "probability": probability} for word, probability in best],
+        }
+
+    def solve_lines(self, lines, top: int = 10):
+        """
+        Solves a stream of grids, one per line, keeping only one grid in memory at a time.
+
+        Args:
+            lines (Iterable[str]): Lines read by parse_grid, blank lines are skipped.
+            top (int, optional): Most answers per grid. Defaults to 10.
+
+        Yields:
+            dict: Line number and the result of solve, or the error if the line isn't a grid.
+        """
+        if top < 1:
+            raise ValueError(f"top has to be at least 1, not {top}")
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                result = self.solve(parse_grid(line, index=self.patterns.index), top=top)
+            except (ValueError, KeyError, TypeError) as error:
+                yield {"line": number, "error": str(error)}
+                continue
+            yield {"line": number, **result}
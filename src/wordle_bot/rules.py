@@ -0,0 +1,34 @@
+"""Rules Module, the variant of Wordle being played."""
+
+import zlib
+
+
+class Rules:
+    """
+    Rules every strategy has to follow.
+
+    Args:
+        hard_mode (bool, optional):
+            NYT hard mode, every guess has to keep the green letters in place
+            and reuse the yellow ones. Defaults to False.
+        answers (Iterable[str], optional):
+            Words that can be the answer, when it's a smaller list than the words
+            that can be guessed. Defaults to every word that can be guessed.
+        max_guesses (int, optional): Guesses before the game is lost. Defaults to 6.
+    """
+
+    def __init__(self, hard_mode: bool = False, answers=None, max_guesses: int = 6) -> None:
+        self.hard_mode = hard_mode
+        self.answers = None if answers is None else frozenset(answers)
+        self.max_guesses = max_guesses
+
+    def key(self) -> tuple:
+        """
+        Hashable summary of the rules that change which guess is best.
+
+        Returns:
+            tuple: Hard mode and a checksum of the answer list.
+        """
+        if self.answers is None:
+            return (self.hard_mode, None)
+        return (self.hard_mode, zlib.crc32("\n".join(sorted(self.answers)).encode("ascii")))
@@ -0,0 +1,321 @@
+"""Simulation Module, plays offline games across a pool of worker processes."""
+
+import os
+import tempfile
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .engine import SolverEngine
+from .memo import TRANSITIONS
+from .multiboard import MultiBoardSolver
+from .patterns import PatternMatrix, decode_words
+from .rules import Rules
+from .words import load_words
+
+CHUNK_SIZE = 64
+
+_worker = {}
+
+
+class SharedIndex:
+    """
+    Encoded word list, allowed guess mask and pattern matrix shared between processes,
+    so every worker reads the same pages instead of holding its own copy.
+    Arrays already saved as a .npy, like the pattern matrix, are memory mapped
+    from the file by every worker. The rest go in shared memory, or a temporary
+    .npy when shared memory is too small (Docker gives /dev/shm 64MB).
+
+    Args:
+        arrays (dict): Name to numpy array for every shared array.
+        blocks (dict): Name to the SharedMemory block behind the array, if it's in one.
+        files (dict, optional): Name to the .npy behind the array, if it's in one.
+        owner (bool, optional): Unlink the blocks and temporary files on close. Defaults to False.
+        temporary (list, optional): Files created for this index, removed on close by the owner.
+    """
+
+    def __init__(
+        self,
+        arrays: dict,
+        blocks: dict,
+        files: dict = None,
+        owner: bool = False,
+        temporary: list = None,
+    ) -> None:
+        self.arrays = arrays
+        self.blocks = blocks
+        self.files = files or {}
+        self.owner = owner
+        self.temporary = temporary or []
+
+    @classmethod
+    def create(cls, patterns: PatternMatrix, five_letter_words) -> "SharedIndex":
+        """
+        Shares the word list and pattern matrix, copying only what isn't on disk already.
+
+        Args:
+            patterns (PatternMatrix): Matrix to share.
+            five_letter_words (Iterable[str]): Words that can be guessed.
+
+        Returns:
+            SharedIndex: Index that owns the blocks and temporary files.
+        """
+        allowed = np.zeros(len(patterns.words), dtype=np.bool_)
+        allowed[[patterns.index[word] for word in five_letter_words]] = True
+        shared = cls({}, {}, owner=True)
+        for name, array in (
+            ("letters", patterns.letters),
+            ("allowed", allowed),
+            ("matrix", patterns.matrix),
+        ):
+            path = getattr(array, "filename", None)
+            if path is not None:
+                shared.arrays[name] = array
+                shared.files[name] = path
+                continue
+            try:
+                block = SharedMemory(create=True, size=max(array.nbytes, 1))
+            except OSError:
+                fd, path = tempfile.mkstemp(suffix=".npy")
+                shared.temporary.append(path)
+                with os.fdopen(fd, "wb") as file:
+                    np.save(file, array)
+                shared.arrays[name] = np.load(path, mmap_mode="r")
+                shared.files[name] = path
+                continue
+            shared.blocks[name] = block
+            shared.arrays[name] = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            shared.arrays[name][...] = array
+        return shared
+
+    def describe(self) -> dict:
+        """
+        Everything a worker needs to attach to the arrays, small enough to pickle.
+
+        Returns:
+            dict: Where each array is ("shm" block name or "file" path), its shape and dtype.
+        """
+        description = {}
+        for name, array in self.arrays.items():
+            if name in self.files:
+                location = ("file", self.files[name])
+            else:
+                location = ("shm", self.blocks[name].name)
+            description[name] = (*location, array.shape, array.dtype.str)
+        return description
+
+    @classmethod
+    def attach(cls, description: dict) -> "SharedIndex":
+        """
+        Maps arrays shared by another process, without copying them.
+
+        Args:
+            description (dict): Result of describe.
+
+        Raises:
+            ValueError: If a shared file doesn't hold the described array.
+
+        Returns:
+            SharedIndex: Index that doesn't own the blocks.
+        """
+        shared = cls({}, {})
+        for name, (kind, location, shape, dtype) in description.items():
+            if kind == "file":
+                array = np.load(location, mmap_mode="r")
+                if array.shape != tuple(shape) or array.dtype != np.dtype(dtype):
+                    raise ValueError(f"{location} changed since it was shared")
+                shared.arrays[name] = array
+                shared.files[name] = location
+                continue
+            block = SharedMemory(name=location)
+            shared.blocks[name] = block
+            shared.arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        return shared
+
+    def patterns(self) -> PatternMatrix:
+        """
+        PatternMatrix backed by the shared arrays.
+
+        Returns:
+            PatternMatrix: Matrix for the shared word list.
+        """
+        return PatternMatrix.from_arrays(self.arrays["letters"], self.arrays["matrix"])
+
+    def five_letter_words(self) -> dict:
+        """
+        Words that can be guessed, decoded from the shared arrays.
+
+        Returns:
+            dict: Word list mapping each word to 1.
+        """
+        words = decode_words(self.arrays["letters"][self.arrays["allowed"]])
+        return dict.fromkeys(words, 1)
+
+    def close(self) -> None:
+        """Releases the blocks, and frees them and any temporary files if this index made them."""
+        self.arrays = {}
+        for block in self.blocks.values():
+            block.close()
+            if self.owner is True:
+                block.unlink()
+        self.blocks = {}
+        self.files = {}
+        if self.owner is True:
+            for path in self.temporary:
+                if os.path.exists(path):
+                    os.remove(path)
+        self.temporary = []
+
+    def __enter__(self) -> "SharedIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _init_worker(
+    description: dict, strategy: str, first_guess: str, memo: bool = True, rules: Rules = None
+) -> None:
+    """Attaches to the shared index once per worker and warms up the strategy's opener."""
+    shared = SharedIndex.attach(description)
+    _worker["shared"] = shared
+    _worker["patterns"] = shared.patterns()
+    _worker["words"] = shared.five_letter_words()
+    _worker["strategy"] = strategy
+    _worker["first_guess"] = first_guess
+    _worker["memo"] = None if memo is True else False
+    _worker["rules"] = rules
+    if not first_guess:
+        SolverEngine(
+            _worker["words"],
+            patterns=_worker["patterns"],
+            strategy=strategy,
+            memo=False,
+            rules=rules,
+        ).first_guess()
+
+
+def play_game(answer: str) -> dict:
+    """
+    Plays one offline game in a worker.
+
+    Args:
+        answer (str): The hidden 5 letter word.
+
+    Returns:
+        dict: Answer, guesses, whether it was solved, the seconds spent per decision
+        and the memo hits and misses of the game.
+    """
+    engine = SolverEngine(
+        _worker["words"],
+        patterns=_worker["patterns"],
+        strategy=_worker["strategy"],
+        memo=_worker["memo"],
+        rules=_worker["rules"],
+    )
+    hits, misses = sum(TRANSITIONS.hits.values()), sum(TRANSITIONS.misses.values())
+    timings = []
+    guesses = engine.play(
+        answer,
+        first_guess=_worker["first_guess"],
+        timings=timings,
+    )
+    return {
+        "answer": answer,
+        "guesses": guesses,
+        "solved": guesses[-1] == answer,
+        "timings": timings,
+        "memo": {
+            "hits": sum(TRANSITIONS.hits.values()) - hits,
+            "misses": sum(TRANSITIONS.misses.values()) - misses,
+        },
+    }
+
+
+def play_boards(answers: tuple) -> dict:
+    """
+    Plays one offline multi-board game in a worker, see MultiBoardSolver.
+
+    Args:
+        answers (tuple): The hidden 5 letter word of each board.
+
+    Returns:
+        dict: Same as play_game, with every board's answer instead of one.
+    """
+    solver = MultiBoardSolver(
+        _worker["words"],
+        boards=len(answers),
+        patterns=_worker["patterns"],
+        memo=_worker["memo"],
+        rules=_worker["rules"],
+    )
+    hits, misses = sum(TRANSITIONS.hits.values()), sum(TRANSITIONS.misses.values())
+    timings = []
+    guesses = solver.play(answers, first_guess=_worker["first_guess"], timings=timings)
+    return {
+        "answers": list(answers),
+        "guesses": guesses,
+        "solved": all(solver.solved),
+        "timings": timings,
+        "memo": {
+            "hits": sum(TRANSITIONS.hits.values()) - hits,
+            "misses": sum(TRANSITIONS.misses.values()) - misses,
+        },
+    }
+
+
+def play_chunk(answers: list) -> list:
+    """
+    Plays a chunk of games in a worker.
+
+    Args:
+        answers (list): Hidden 5 letter words, or tuples of them for multi-board games.
+
+    Returns:
+        list: Results from play_game or play_boards.
+    """
+    return [
+        play_game(answer) if isinstance(answer, str) else play_boards(answer)
+        for answer in answers
+    ]
+
+
+def simulate(
+    answers: list,
+    strategy: str = "entropy",
+    workers: int = None,
+    first_guess: str = "",
+    chunk_size: int = CHUNK_SIZE,
+    memo: bool = True,
+    rules: Rules = None,
+):
+    """
+    Plays every answer offline, spread over a pool of worker processes.
+    Results are yielded as soon as each chunk finishes, in no particular order.
+
+    Args:
+        answers (list):
+            Hidden 5 letter words to play, or tuples of them to play multi-board games.
+            Multi-board games always pick guesses by joint entropy.
+        strategy (str, optional): Name of the strategy to play with. Defaults to "entropy".
+        workers (int, optional): Worker processes. Defaults to the number of cores.
+        first_guess (str, optional): Opener to use for every game. Defaults to the strategy's.
+        chunk_size (int, optional): Games sent to a worker at once. Defaults to CHUNK_SIZE.
+        memo (bool, optional): Let games in a worker share a TransitionCache. Defaults to True.
+        rules (Rules, optional): Rules every game is played by. Defaults to normal Wordle.
+
+    Yields:
+        dict: Result from play_game.
+    """
+    workers = workers or os.cpu_count() or 1
+    patterns = PatternMatrix.for_words(load_words(offline=True, overlay=False))
+    chunks = [answers[start : start + chunk_size] for start in range(0, len(answers), chunk_size)]
+    with SharedIndex.create(patterns, load_words(offline=True)) as shared:
+        with Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(shared.describe(), strategy, first_guess, memo, rules),
+        ) as pool:
+            for results in pool.imap_unordered(play_chunk, chunks):
+                yield from results
@@ -0,0 +1,381 @@
+"""Strategy Module, different ways of picking the next guess."""
+
+import random
+
+import numpy as np
+
+from .patterns import PATTERN_COUNT
+from .tree import DecisionTree
+
+SCORE_BUDGET = 1 << 21  # Pattern codes bincounted at once, keeps memory flat
+
+_OPENERS = {}
+
+
+def pattern_counts(matrix: np.ndarray, guesses: np.ndarray, candidates: np.ndarray):
+    """
+    Counts how many candidates give each feedback pattern for each guess,
+    a chunk of guesses at a time. Every scoring strategy is built on this.
+
+    Args:
+        matrix (np.ndarray): Pattern matrix from PatternMatrix.matrix.
+        guesses (np.ndarray): Indexes of the words to score.
+        candidates (np.ndarray): Indexes of the words that could be the answer.
+
+    Yields:
+        tuple: Offset of the chunk in guesses, and its (chunk, PATTERN_COUNT) counts.
+    """
+    chunk = max(1, SCORE_BUDGET // max(1, len(candidates)))
+    for start in range(0, len(guesses), chunk):
+        rows = matrix[np.ix_(guesses[start : start + chunk], candidates)]
+        offsets = np.arange(len(rows), dtype=np.int32)[:, None] * PATTERN_COUNT
+        counts = np.bincount(
+            (rows + offsets).ravel(), minlength=len(rows) * PATTERN_COUNT
+        ).reshape(len(rows), PATTERN_COUNT)
+        yield start, counts
+
+
+def entropy_scores(matrix: np.ndarray, guesses: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Scores guesses by the expected information (in bits) their feedback
+    gives about which candidate is the answer.
+
+    Args:
+        matrix (np.ndarray): Pattern matrix from PatternMatrix.matrix.
+        guesses (np.ndarray): Indexes of the words to score.
+        candidates (np.ndarray): Indexes of the words that could be the answer.
+
+    Returns:
+        np.ndarray: Expected information gain of each guess.
+    """
+    total = len(candidates)
+    scores = np.zeros(len(guesses))
+    if total == 0:
+        return scores
+    n_log_n = np.zeros(total + 1)
+    n_log_n[1:] = np.arange(1, total + 1) * np.log2(np.arange(1, total + 1))
+    for start, counts in pattern_counts(matrix, guesses, candidates):
+        scores[start : start + len(counts)] = np.log2(total) - n_log_n[counts].sum(axis=1) / total
+    return scores
+
+
+def batched_entropy_scores(
+    matrix: np.ndarray, guesses: np.ndarray, candidate_sets: list
+) -> np.ndarray:
+    """
+    Scores guesses against several sets of candidates in one pass over the pattern matrix,
+    like the boards of a multi-board game or games being played side by side.
+    The candidate sets are gathered together and told apart by a per-set pattern offset,
+    so each chunk of guesses is bincounted once for every set.
+
+    Args:
+        matrix (np.ndarray): Pattern matrix from PatternMatrix.matrix.
+        guesses (np.ndarray): Indexes of the words to score.
+        candidate_sets (list): Indexes of the words that could be the answer, per set.
+
+    Returns:
+        np.ndarray: (sets, guesses) expected information gain of each guess for each set.
+    """
+    totals = np.array([len(candidates) for candidates in candidate_sets], dtype=np.int64)
+    scores = np.zeros((len(candidate_sets), len(guesses)))
+    if totals.sum() == 0:
+        return scores
+    candidates = np.concatenate(candidate_sets).astype(np.int32)
+    set_offsets = np.repeat(np.arange(len(candidate_sets), dtype=np.int32), totals)
+    set_offsets *= PATTERN_COUNT
+    width = len(candidate_sets) * PATTERN_COUNT
+    n_log_n = np.zeros(totals.max() + 1)
+    n_log_n[1:] = np.arange(1, totals.max() + 1) * np.log2(np.arange(1, totals.max() + 1))
+    # Sets that are empty score 0 instead of dividing by 0
+    safe_totals = np.maximum(totals, 1)[:, None]
+    chunk = max(1, SCORE_BUDGET // max(len(candidates), width))
+    for start in range(0, len(guesses), chunk):
+        rows = matrix[np.ix_(guesses[start : start + chunk], candidates)].astype(np.int32)
+        offsets = np.arange(len(rows), dtype=np.int32)[:, None] * width
+        counts = np.bincount(
+            (rows + set_offsets + offsets).ravel(), minlength=len(rows) * width
+        ).reshape(len(rows), len(candidate_sets), PATTERN_COUNT)
+        scores[:, start : start + len(rows)] = (
+            np.log2(safe_totals) - n_log_n[counts].sum(axis=2).T / safe_totals
+        )
+    return scores
+
+
+def worst_case_sizes(matrix: np.ndarray, guesses: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Scores guesses by the most candidates any of their feedback could leave.
+
+    Args:
+        matrix (np.ndarray): Pattern matrix from PatternMatrix.matrix.
+        guesses (np.ndarray): Indexes of the words to score.
+        candidates (np.ndarray): Indexes of the words that could be the answer.
+
+    Returns:
+        np.ndarray: Size of the biggest group of candidates left by each guess.
+    """
+    sizes = np.zeros(len(guesses), dtype=np.int64)
+    for start, counts in pattern_counts(matrix, guesses, candidates):
+        sizes[start : start + len(counts)] = counts.max(axis=1)
+    return sizes
+
+
+def expected_sizes(matrix: np.ndarray, guesses: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Scores guesses by how many candidates are expected to be left after their feedback,
+    when every candidate is as likely to be the answer.
+
+    Args:
+        matrix (np.ndarray): Pattern matrix from PatternMatrix.matrix.
+        guesses (np.ndarray): Indexes of the words to score.
+        candidates (np.ndarray): Indexes of the words that could be the answer.
+
+    Returns:
+        np.ndarray: Expected candidates left by each guess.
+    """
+    sizes = np.zeros(len(guesses))
+    if len(candidates) == 0:
+        return sizes
+    for start, counts in pattern_counts(matrix, guesses, candidates):
+        counts = counts.astype(np.int64)
+        sizes[start : start + len(counts)] = (counts * counts).sum(axis=1) / len(candidates)
+    return sizes
+
+
+STRATEGIES = {}
+
+
+def register_strategy(strategy: type) -> type:
+    """
+    Class decorator that makes a strategy available by its name,
+    to get_strategy and the --strategy options.
+
+    Args:
+        strategy (type): Strategy subclass with a unique name.
+
+    Returns:
+        type: The same class.
+    """
+    STRATEGIES[strategy.name] = strategy
+    return strategy
+
+
+class Strategy:
+    """Base class for picking guesses, subclasses override choose."""
+
+    name = ""
+    deterministic = False  # Always picks the same guess for the same words, so it can be memoized
+
+    def first_guess(self, engine) -> str:
+        """
+        Picks the opening guess.
+
+        Args:
+            engine (SolverEngine): Engine with no feedback recorded yet.
+
+        Returns:
+            str: Random 5 letter word.
+        """
+        return engine.patterns.words[random.choice(engine.candidates)]
+
+    def choose(self, engine) -> str:
+        """
+        Picks the next guess.
+
+        Args:
+            engine (SolverEngine): Engine holding the feedback so far.
+
+        Raises:
+            ValueError: If no word fits the feedback so far.
+
+        Returns:
+            str: The 5 letter word to guess next.
+        """
+        raise NotImplementedError
+
+
+@register_strategy
+class HeuristicStrategy(Strategy):
+    """Picks a random word that covers the most letters left in the potential words."""
+
+    name = "heuristic"
+
+    def choose(self, engine) -> str:
+        return engine._get_best_guess()
+
+
+class ScoringStrategy(Strategy):
+    """
+    Base class for strategies that score every allowed guess against the
+    potential words with the pattern matrix, subclasses override scores.
+    """
+
+    deterministic = True
+
+    def scores(self, matrix: np.ndarray, guesses: np.ndarray, candidates: np.ndarray):
+        """
+        Scores guesses, higher is better.
+
+        Args:
+            matrix (np.ndarray): Pattern matrix from PatternMatrix.matrix.
+            guesses (np.ndarray): Indexes of the words to score.
+            candidates (np.ndarray): Indexes of the words that could be the answer.
+
+        Returns:
+            np.ndarray: Score of each guess.
+        """
+        raise NotImplementedError
+
+    def batch_scores(self, matrix: np.ndarray, guesses: np.ndarray, candidate_sets: list):
+        """
+        Scores guesses against several sets of candidates, like games played side by side.
+
+        Args:
+            matrix (np.ndarray): Pattern matrix from PatternMatrix.matrix.
+            guesses (np.ndarray): Indexes of the words to score.
+            candidate_sets (list): Indexes of the words that could be the answer, per set.
+
+        Returns:
+            np.ndarray: (sets, guesses) score of each guess for each set.
+        """
+        return np.array([self.scores(matrix, guesses, candidates) for candidates in candidate_sets])
+
+    def pick(self, engine, guesses: np.ndarray, scores: np.ndarray) -> str:
+        """
+        Picks the best scoring guess.
+
+        Args:
+            engine (SolverEngine): Engine holding the feedback so far.
+            guesses (np.ndarray): Indexes of the words that were scored.
+            scores (np.ndarray): Score of each guess.
+
+        Returns:
+            str: The 5 letter word to guess next.
+        """
+        scores = scores.astype(np.float64)
+        # Ties go to words that could still be the answer
+        scores[np.isin(guesses, engine.candidates)] += 1e-9
+        return engine.patterns.words[guesses[np.argmax(scores)]]
+
+    def first_guess(self, engine) -> str:
+        # The opener only depends on the word lists and the rules
+        key = (self.name, engine.state_key()[0])
+        if key not in _OPENERS:
+            _OPENERS[key] = self.choose(engine)
+        return _OPENERS[key]
+
+    def choose(self, engine) -> str:
+        candidates = engine.candidates
+        if len(candidates) == 0:
+            raise ValueError("No words left that fit the feedback")
+        if len(candidates) <= 2:
+            return engine.patterns.words[candidates[0]]
+        guesses = engine.allowed_guesses()
+        return self.pick(engine, guesses, self.scores(engine.patterns.matrix, guesses, candidates))
+
+
+@register_strategy
+class EntropyStrategy(ScoringStrategy):
+    """Picks the word whose feedback is expected to split the potential words the most."""
+
+    name = "entropy"
+
+    def scores(self, matrix: np.ndarray, guesses: np.ndarray, candidates: np.ndarray):
+        return entropy_scores(matrix, guesses, candidates)
+
+    def batch_scores(self, matrix: np.ndarray, guesses: np.ndarray, candidate_sets: list):
+        return batched_entropy_scores(matrix, guesses, candidate_sets)
+
+
+@register_strategy
+class MinimaxStrategy(ScoringStrategy):
+    """
+    Picks the word whose worst feedback leaves the fewest potential words,
+    breaking ties by the expected number left.
+    """
+
+    name = "minimax"
+
+    def scores(self, matrix: np.ndarray, guesses: np.ndarray, candidates: np.ndarray):
+        worst = worst_case_sizes(matrix, guesses, candidates)
+        # The expected size is below len(candidates) + 1, so it only decides ties
+        expected = expected_sizes(matrix, guesses, candidates) / (len(candidates) + 1)
+        return -(worst + expected)
+
+
+@register_strategy
+class ExpectedSizeStrategy(ScoringStrategy):
+    """Picks the word whose feedback is expected to leave the fewest potential words."""
+
+    name = "expected_size"
+
+    def scores(self, matrix: np.ndarray, guesses: np.ndarray, candidates: np.ndarray):
+        return -expected_sizes(matrix, guesses, candidates)
+
+
+@register_strategy
+class TreeStrategy(Strategy):
+    """
+    Plays by walking a decision tree built with `wordle_bot tree`, so no guess costs
+    any compute. Falls back to the strategy the tree was built from if the game
+    leaves the tree, like when Wordle rejects one of the tree's words, or if the
+    tree was built for another word list.
+
+    Args:
+        tree (DecisionTree, optional): Tree to walk. Defaults to the saved tree for strategy.
+        strategy (str, optional): Strategy the tree was built from. Defaults to "entropy".
+    """
+
+    name = "tree"
+
+    def __init__(self, tree: DecisionTree = None, strategy: str = "entropy") -> None:
+        self.tree = tree
+        self.fallback = get_strategy(strategy)
+
+    def _get_tree(self, engine):
+        if self.tree is None:
+            self.tree = DecisionTree.load(self.fallback.name)
+            if self.tree is None:
+                raise FileNotFoundError(
+                    f"There is no {self.fallback.name} decision tree, "
+                    f"build one with `wordle_bot tree --strategy {self.fallback.name}`."
+                )
+        # A tree for another word list would walk nodes that point at other words
+        if not self.tree.fits(engine.patterns):
+            return None
+        return self.tree
+
+    def first_guess(self, engine) -> str:
+        tree = self._get_tree(engine)
+        if tree is None or not engine.is_allowed(tree.opener):
+            return self.fallback.first_guess(engine)
+        return tree.opener
+
+    def choose(self, engine) -> str:
+        tree = self._get_tree(engine)
+        guess = None if tree is None else tree.lookup(engine.history)
+        if guess is None or not engine.is_allowed(guess):
+            return self.fallback.choose(engine)
+        return guess
+
+
+def get_strategy(strategy) -> Strategy:
+    """
+    Looks up a strategy by name.
+
+    Args:
+        strategy (str | Strategy): Name of the strategy, or a Strategy to use as is.
+
+    Raises:
+        ValueError: If there isn't a strategy with that name.
+
+    Returns:
+        Strategy: Strategy instance.
+    """
+    if isinstance(strategy, Strategy):
+        return strategy
+    try:
+        return STRATEGIES[strategy]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown strategy {strategy!r}, pick one of: {', '.join(STRATEGIES)}"
+        ) from None
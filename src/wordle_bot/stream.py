@@ -0,0 +1,197 @@
+"""Stream Module, solves a feed of known answers offline and yields each result as it finishes."""
+
+import json
+from itertools import islice
+
+from .engine import SolverEngine, get_feedback
+from .memo import TransitionCache
+from .patterns import PatternMatrix
+from .rules import Rules
+from .strategies import ScoringStrategy
+from .words import load_words
+
+IN_FLIGHT = 64  # Games played at once, and so answers read ahead of the results
+
+
+class _Game:
+    """One game in flight, the engine plus what the result needs."""
+
+    def __init__(self, number: int, answer: str, engine: SolverEngine, extra: dict) -> None:
+        self.number = number
+        self.answer = answer
+        self.engine = engine
+        self.extra = extra
+        self.guesses = []
+
+    def result(self) -> dict:
+        return {
+            **self.extra,
+            "index": self.number,
+            "answer": self.answer,
+            "guesses": self.guesses,
+            "solved": bool(self.guesses) and self.guesses[-1] == self.answer,
+        }
+
+
+def parse_answer(line) -> tuple:
+    """
+    Reads one answer from the feed, a plain word or a JSON object with an "answer".
+    The object's other fields are passed through to the result.
+
+    Args:
+        line (str): One line of input, or a word.
+
+    Raises:
+        ValueError: If the line isn't a 5 letter word.
+
+    Returns:
+        tuple: The answer and the fields to pass through.
+    """
+    line = line.strip()
+    extra = {}
+    if line.startswith("{"):
+        extra = json.loads(line)
+        line = str(extra.pop("answer", ""))
+    answer = line.lower()
+    if len(answer) != 5 or not answer.isascii() or not answer.isalpha():
+        raise ValueError(f"{line!r} isn't a 5 letter word")
+    return answer, extra
+
+
+def _batched_guesses(games: list) -> None:
+    """Scores every game's next guess with one pass over the pattern matrix per word list."""
+    groups = {}
+    for game in games:
+        guesses = game.engine.allowed_guesses()
+        # Games share the engine's arrays unless hard mode filtered them
+        groups.setdefault(id(guesses), (guesses, []))[1].append(game)
+    for guesses, group in groups.values():
+        strategy = group[0].engine.strategy
+        scores = strategy.batch_scores(
+            group[0].engine.patterns.matrix,
+            guesses,
+            [game.engine.candidates for game in group],
+        )
+        for game, game_scores in zip(group, scores):
+            guess = strategy.pick(game.engine, guesses, game_scores)
+            if game.engine.memo:
+                game.engine.memo.add_guess(game.engine.state_key(), strategy.name, guess)
+            game.guesses.append(guess)
+
+
+def _next_guesses(games: list, first_guess: str) -> None:
+    """Adds the next guess to every game, batching the ones that need scoring."""
+    scoring = []
+    for game in games:
+        engine = game.engine
+        if not game.guesses and first_guess:
+            game.guesses.append(first_guess)
+            continue
+        if not isinstance(engine.strategy, ScoringStrategy) or not engine.history:
+            game.guesses.append(engine.next_guess())
+            continue
+        # Everything the engine would try before asking the strategy to score
+        guess = engine._book_guess()
+        if guess is None and engine.memo:
+            guess = engine.memo.guess(engine.state_key(), engine.strategy.name)
+        if guess is None and len(engine.candidates) <= 2:
+            guess = engine.patterns.words[engine.candidates[0]]
+        if guess is None:
+            scoring.append(game)
+        else:
+            game.guesses.append(guess)
+    if scoring:
+        _batched_guesses(scoring)
+
+
+def solve_many(
+    answers,
+    strategy: str = "entropy",
+    first_guess: str = "",
+    rules: Rules = None,
+    in_flight: int = IN_FLIGHT,
+    patterns: PatternMatrix = None,
+    memo: TransitionCache | bool = None,
+):
+    """
+    Solves a stream of answers offline. Only in_flight answers are read ahead,
+    so memory stays flat however long the stream is, and nothing more is read
+    until the caller takes the next result. The games in flight move one turn
+    at a time, so the ones a scoring strategy has to score share one pass over
+    the pattern matrix.
+
+    Args:
+        answers (Iterable[str]): Hidden 5 letter words, or lines read by parse_answer.
+        strategy (str, optional): Name of the strategy to play with. Defaults to "entropy".
+        first_guess (str, optional): Opener to use for every game. Defaults to the strategy's.
+        rules (Rules, optional): Rules every game is played by. Defaults to normal Wordle.
+        in_flight (int, optional): Games played at once. Defaults to IN_FLIGHT.
+        patterns (PatternMatrix, optional):
+            Precomputed feedback for the word list. Defaults to the shared matrix.
+        memo (TransitionCache | bool, optional):
+            Cache shared by the games, False to not use one.
+            Defaults to the cache shared by the whole process.
+
+    Raises:
+        ValueError: If in_flight is less than 1, or first_guess can't be guessed.
+
+    Returns:
+        Iterator[dict]: Index of the answer in the stream, the answer, the guesses and
+        whether it was solved, in the order the games finish. Answers that can't be read
+        or aren't in the word list give their index and the error instead.
+    """
+    if in_flight < 1:
+        raise ValueError(f"in_flight has to be at least 1, not {in_flight}")
+    base = SolverEngine(
+        load_words(offline=True),
+        patterns=patterns,
+        strategy=strategy,
+        memo=memo,
+        rules=rules,
+        offline=True,
+    )
+    first_guess = first_guess.lower()
+    if first_guess and not base.is_allowed(first_guess):
+        raise ValueError(f"{first_guess!r} isn't a word that can be guessed")
+    # Checked before the first answer is read, not when the results are first asked for
+    return _solve_stream(base, answers, first_guess, in_flight)
+
+
+def _solve_stream(base: SolverEngine, answers, first_guess: str, in_flight: int):
+    """Plays the games of solve_many, see there."""
+    max_guesses = base.rules.max_guesses
+    feed = enumerate(answers)
+    games = []
+    while True:
+        read = 0
+        for number, line in islice(feed, in_flight - len(games)):
+            read += 1
+            if not line.strip():
+                continue
+            try:
+                answer, extra = parse_answer(line)
+                if answer not in base.patterns.index:
+                    raise ValueError(f"{answer!r} isn't in the word list")
+            except ValueError as error:
+                yield {"index": number, "error": str(error)}
+                continue
+            games.append(_Game(number, answer, base.new_game(), extra))
+        if not games:
+            if read == 0:
+                return
+            continue
+
+        _next_guesses(games, first_guess)
+        playing = []
+        for game in games:
+            guess = game.guesses[-1]
+            game.engine.update(guess, get_feedback(guess, game.answer))
+            if (
+                guess == game.answer
+                or len(game.guesses) >= max_guesses
+                or len(game.engine.candidates) == 0
+            ):
+                yield game.result()
+            else:
+                playing.append(game)
+        games = playing
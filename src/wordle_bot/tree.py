@@ -0,0 +1,319 @@
+"""Decision Tree Module, the whole solve policy of a strategy as a flat tree."""
+
+import os
+
+import numpy as np
+
+from .patterns import (
+    PATTERN_DIRECTORY,
+    SOLVED_PATTERN,
+    PatternMatrix,
+    decode_words,
+    encode_pattern,
+    encode_words,
+    words_digest,
+)
+from .words import CACHE_DIRECTORY, load_words
+
+TREE_DIRECTORIES = (PATTERN_DIRECTORY, CACHE_DIRECTORY)
+MAX_DEPTH = 12  # Answers still unsolved this deep are recorded as failed games
+
+_TREES = {}
+
+
+def tree_filename(strategy: str) -> str:
+    """
+    File name of the decision tree for a strategy.
+
+    Args:
+        strategy (str): Name of the strategy.
+
+    Returns:
+        str: File name.
+    """
+    return f"decision_tree.{strategy}.npz"
+
+
+class DecisionTree:
+    """
+    Every guess a strategy makes for every answer, stored as flat arrays.
+    Node 0 is the opener. The edges of node n are edge_patterns and edge_children
+    from edge_offsets[n] to edge_offsets[n + 1], sorted by pattern code.
+
+    Args:
+        strategy (str): Name of the strategy the tree was built from.
+        words (list): Word list the guesses index into.
+        guesses (np.ndarray): Word index guessed at each node.
+        edge_offsets (np.ndarray): Start of each node's edges, plus the total at the end.
+        edge_patterns (np.ndarray): Pattern code of each edge.
+        edge_children (np.ndarray): Node each edge leads to.
+        unsolved (np.ndarray, optional):
+            Word index of every answer still unsolved at MAX_DEPTH. Defaults to none.
+    """
+
+    def __init__(
+        self,
+        strategy: str,
+        words: list,
+        guesses: np.ndarray,
+        edge_offsets: np.ndarray,
+        edge_patterns: np.ndarray,
+        edge_children: np.ndarray,
+        unsolved: np.ndarray = None,
+    ) -> None:
+        self.strategy = strategy
+        self.words = words
+        self.digest = words_digest(words)
+        self.guesses = guesses
+        self.edge_offsets = edge_offsets
+        self.edge_patterns = edge_patterns
+        self.edge_children = edge_children
+        self.unsolved = np.zeros(0, dtype=np.int32) if unsolved is None else unsolved
+
+    @property
+    def opener(self) -> str:
+        """First guess of the tree."""
+        return self.words[self.guesses[0]]
+
+    def child(self, node: int, pattern) -> int:
+        """
+        Follows the edge for a feedback pattern.
+
+        Args:
+            node (int): Node the pattern was seen at.
+            pattern (tuple | int): The data-state of each tile, or the pattern code.
+
+        Returns:
+            int: Child node, or -1 if the tree has no such edge.
+        """
+        start, end = self.edge_offsets[node], self.edge_offsets[node + 1]
+        patterns = self.edge_patterns[start:end]
+        position = np.searchsorted(patterns, encode_pattern(pattern))
+        if position == len(patterns) or patterns[position] != encode_pattern(pattern):
+            return -1
+        return int(self.edge_children[start + position])
+
+    def lookup(self, history: list):
+        """
+        Walks the tree along the guesses and feedback so far.
+
+        Args:
+            history (list): (guess, pattern) pairs, oldest first.
+
+        Returns:
+            str | None: The next guess, or None if the game left the tree.
+        """
+        node = 0
+        for guess, pattern in history:
+            if self.words[self.guesses[node]] != guess:
+                return None
+            node = self.child(node, pattern)
+            if node == -1:
+                return None
+        return self.words[self.guesses[node]]
+
+    def paths(self):
+        """
+        Every answer with the guesses the tree makes for it.
+
+        Yields:
+            tuple[str, list[str]]: Answer and guesses, the last guess is the answer.
+        """
+        stack = [(0, [])]
+        while stack:
+            node, guesses = stack.pop()
+            guesses = guesses + [self.words[self.guesses[node]]]
+            start, end = self.edge_offsets[node], self.edge_offsets[node + 1]
+            for edge in range(end - 1, start - 1, -1):
+                if self.edge_patterns[edge] == SOLVED_PATTERN:
+                    yield guesses[-1], guesses
+                else:
+                    stack.append((int(self.edge_children[edge]), guesses))
+
+    def fits(self, patterns: PatternMatrix) -> bool:
+        """
+        Checks the tree was built for the word list being played, like OpeningBook.load does.
+        Node guesses index into the tree's own word list, so a tree for another list
+        would play words that aren't there.
+
+        Args:
+            patterns (PatternMatrix): Matrix for the word list being played.
+
+        Returns:
+            bool: True if the word lists are the same, False if otherwise.
+        """
+        return self.digest == patterns.digest
+
+    def stats(self) -> dict:
+        """
+        Guess counts over every answer in the tree.
+
+        Returns:
+            dict: Number of answers solved and unsolved, nodes, worst case and
+            mean number of guesses of the solved ones.
+        """
+        lengths = [len(guesses) for _, guesses in self.paths()]
+        return {
+            "answers": len(lengths),
+            "unsolved": len(self.unsolved),
+            "nodes": len(self.guesses),
+            "worst_case": max(lengths),
+            "mean_guesses": sum(lengths) / len(lengths),
+        }
+
+    def to_text(self) -> str:
+        """
+        One line per answer with its guesses, sorted so two trees can be diffed.
+
+        Returns:
+            str: Lines of "answer: guess guess ...", or "answer: unsolved".
+        """
+        lines = sorted(
+            [f"{answer}: {' '.join(guesses)}" for answer, guesses in self.paths()]
+            + [f"{self.words[indx]}: unsolved" for indx in self.unsolved]
+        )
+        return "\n".join(lines) + "\n"
+
+    def save(self, path: str) -> None:
+        """
+        Saves the tree as a compressed .npz.
+
+        Args:
+            path (str): File to write.
+        """
+        np.savez_compressed(
+            path,
+            strategy=np.array(self.strategy),
+            word_list=np.array(words_digest(self.words)),
+            letters=encode_words(self.words),
+            guesses=self.guesses,
+            edge_offsets=self.edge_offsets,
+            edge_patterns=self.edge_patterns,
+            edge_children=self.edge_children,
+            unsolved=self.unsolved,
+        )
+
+    @classmethod
+    def read(cls, path: str) -> "DecisionTree":
+        """
+        Reads a tree saved with save.
+
+        Args:
+            path (str): .npz file.
+
+        Returns:
+            DecisionTree: The tree.
+        """
+        with np.load(path) as data:
+            return cls(
+                strategy=str(data["strategy"]),
+                words=decode_words(data["letters"]),
+                guesses=data["guesses"],
+                edge_offsets=data["edge_offsets"],
+                edge_patterns=data["edge_patterns"],
+                edge_children=data["edge_children"],
+                # Trees saved before unsolved answers were recorded don't have them
+                unsolved=data["unsolved"] if "unsolved" in data else None,
+            )
+
+    @classmethod
+    def load(cls, strategy: str):
+        """
+        Loads the saved tree for a strategy once per process.
+
+        Args:
+            strategy (str): Name of the strategy the tree was built from.
+
+        Returns:
+            DecisionTree | None: The tree, or None if it hasn't been built.
+            Check fits before walking it, it may be for another word list.
+        """
+        if strategy not in _TREES:
+            _TREES[strategy] = None
+            for directory in TREE_DIRECTORIES:
+                path = os.path.join(directory, tree_filename(strategy))
+                if os.path.exists(path):
+                    _TREES[strategy] = cls.read(path)
+                    break
+        return _TREES[strategy]
+
+
+def build_tree(strategy: str = "entropy", opener: str = "") -> DecisionTree:
+    """
+    Plays the strategy against every feedback pattern, starting from every word
+    as a possible answer, until every answer is solved. Answers still unsolved
+    after MAX_DEPTH guesses are recorded in the tree's unsolved.
+
+    Args:
+        strategy (str, optional): Name of the strategy. Defaults to "entropy".
+        opener (str, optional): First guess. Defaults to the strategy's own opener.
+
+    Returns:
+        DecisionTree: The complete tree.
+    """
+    from .engine import SolverEngine  # The engine plays trees, so import it late
+
+    five_letter_words = load_words(offline=True)
+    patterns = PatternMatrix.for_words(load_words(offline=True, overlay=False))
+    root = SolverEngine(five_letter_words, patterns=patterns, strategy=strategy)
+
+    guesses = []
+    edges = []
+    unsolved = []
+
+    def build_node(engine: SolverEngine, guess: str, depth: int) -> int:
+        node = len(guesses)
+        guesses.append(patterns.index[guess])
+        node_edges = []
+        edges.append(node_edges)
+        for code in np.unique(patterns.row(guess)[engine.candidates]).tolist():
+            if code == SOLVED_PATTERN:
+                node_edges.append((code, -1))
+                continue
+            child = engine.branch(guess, code)
+            if depth < MAX_DEPTH:
+                node_edges.append((code, build_node(child, child.next_guess(), depth + 1)))
+            else:
+                unsolved.extend(child.candidates.tolist())
+        return node
+
+    build_node(root, opener.lower() or root.first_guess(), 1)
+    return DecisionTree(
+        strategy=strategy,
+        words=patterns.words,
+        guesses=np.array(guesses, dtype=np.int32),
+        edge_offsets=np.cumsum([0] + [len(node_edges) for node_edges in edges], dtype=np.int32),
+        edge_patterns=np.array(
+            [code for node_edges in edges for code, _ in node_edges], dtype=np.uint8
+        ),
+        edge_children=np.array(
+            [child for node_edges in edges for _, child in node_edges], dtype=np.int32
+        ),
+        unsolved=np.array(sorted(unsolved), dtype=np.int32),
+    )
+
+
+def save_tree(tree: DecisionTree, directory: str = None) -> str:
+    """
+    Saves a tree where DecisionTree.load will find it.
+
+    Args:
+        tree (DecisionTree): Tree from build_tree.
+        directory (str, optional):
+            Where to save it. Defaults to the package directory,
+            or the cache directory if the package can't be written to.
+
+    Returns:
+        str: Path of the saved tree.
+    """
+    directories = [directory] if directory else TREE_DIRECTORIES
+    for directory in directories:
+        path = os.path.join(directory, tree_filename(tree.strategy))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            tree.save(path)
+        except OSError:
+            continue
+        _TREES.pop(tree.strategy, None)
+        return path
+    raise OSError("Couldn't save the decision tree anywhere.")
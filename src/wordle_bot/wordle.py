@@ -1,10 +1,8 @@
 """Wordle Module, connects to and plays Wordle"""
 
-import time
-import json
-import random
 import os
-import requests
+import time
+from contextlib import nullcontext
 
 from rich.live import Live
 from rich.table import Table
@@ -13,7 +11,6 @@ from rich.layout import Layout
 from rich.panel import Panel
 
 from selenium.webdriver import Chrome
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -22,6 +19,14 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from selenium.common.exceptions import SessionNotCreatedException
 
+from .board import BoardSnapshot
+from .browser_pool import BrowserPool, chrome_options
+from .engine import SolverEngine
+from .profiler import PROFILER, print_summary
+from .rules import Rules
+from .strategies import get_strategy
+from .words import BUNDLED_WORDS_PATH, load_words, record_rejected
+
 
 class Wordle:
     """
@@ -38,6 +43,26 @@ class Wordle:
             You will still be able to see what is going on since
             it will build a dynamic table in the console.
             Defaults to False.
+        offline (bool, optional):
+            Load the word list without touching the network.
+            Defaults to the WORDLE_BOT_OFFLINE environment variable.
+        wait_timeout (float, optional):
+            Seconds to wait for the page to react, like a row of tiles flipping,
+            before giving up. Defaults to 10.
+        base_url (str, optional):
+            Page to play on, like a MockWordleServer's url. Defaults to NYT Wordle.
+        pool (BrowserPool, optional):
+            Pool to borrow the browser from, so it isn't relaunched for every game.
+            The pool's headless setting is used instead. Defaults to launching a new browser.
+        quiet (bool, optional):
+            Don't print anything to the console, for games played side by side.
+            Defaults to False.
+        render (bool, optional):
+            Draw the live table while solving. Defaults to True,
+            unless quiet or running in CI.
+        rules (Rules, optional):
+            Rules to solve by, like hard mode. The board always has 6 rows,
+            so max_guesses can only lower that. Defaults to normal Wordle.
     """
 
     NYT_WEBSITE = "https://www.nytimes.com/games/wordle/index.html"
@@ -49,51 +74,37 @@ class Wordle:
     CSS_ABSENT = ".Tile-module_tile__UWEHN[data-state=absent]"
     CSS_CORRECT = ".Tile-module_tile__UWEHN[data-state=correct]"
     CSS_PRESENT = ".Tile-module_tile__UWEHN[data-state=present]"
-    FIVE_LETTER_WORDS_ABSOLUTE_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)),
-        "five_letter_words.json",
-    )
-
-    def __init__(self, headless: bool = False) -> None:
-        self.console = Console()
+    TOAST_CLASS = "Toast-module_toast__iiVsN"
+    WAIT_POLL = 0.05
+    CANDIDATES_SHOWN = 150  # Potential words listed, the rest are only counted
+    REFRESH_INTERVAL = 0.1  # Seconds between redraws of the live display
+    FIVE_LETTER_WORDS_ABSOLUTE_PATH = BUNDLED_WORDS_PATH
+
+    @PROFILER.timed("wordle.init")
+    def __init__(
+        self,
+        headless: bool = False,
+        offline: bool = None,
+        wait_timeout: float = 10,
+        base_url: str = None,
+        pool: BrowserPool = None,
+        quiet: bool = False,
+        render: bool = None,
+        rules: Rules = None,
+    ) -> None:
+        self.console = Console(quiet=quiet)
+        if render is None:
+            render = not (quiet or os.getenv("CI") or os.getenv("GITHUB_ACTIONS"))
+        self.render = render
+        self._rows = {}
+        self._info = None
+        self._last_refresh = 0.0
+        self.wait_timeout = wait_timeout
+        self.wait_times = []
+        self.board = None
         with self.console.status("Setting up Wordle..."):
-            try:
-                response = requests.get("https://raw.githubusercontent.com/Jampamane/wordle_bot/refs/heads/main/five_letter_words.json")
-                response.raise_for_status()
-                self.five_letter_words = response.json()
-            except requests.RequestException as e:
-                print("Error fetching data:", e)
-            except ValueError as e:
-                print("Error decoding JSON:", e)
-
-            self.potential_words = self.five_letter_words
-            self.potential_letters = [
-                "a",
-                "b",
-                "c",
-                "d",
-                "e",
-                "f",
-                "g",
-                "h",
-                "i",
-                "j",
-                "k",
-                "l",
-                "m",
-                "n",
-                "o",
-                "p",
-                "q",
-                "r",
-                "s",
-                "t",
-                "u",
-                "v",
-                "w",
-                "x",
-                "y",
-                "z",
-            ]
+            self.five_letter_words = load_words(offline=offline)
+            self.engine = SolverEngine(self.five_letter_words, rules=rules, offline=offline)
             self.style_dict = {
                 "absent": "grey53",
                 "present": "yellow bold",
@@ -101,15 +112,6 @@ class Wordle:
                 "tbd": "red",
             }
             self.wordle = {
-                "letters": {
-                    1: {"correct": "", "incorrect": []},
-                    2: {"correct": "", "incorrect": []},
-                    3: {"correct": "", "incorrect": []},
-                    4: {"correct": "", "incorrect": []},
-                    5: {"correct": "", "incorrect": []},
-                },
-                "absent_letters": [],
-                "present_letters": [],
                 "guess": {
                     1: {"word": "", "letters": []},
                     2: {"word": "", "letters": []},
@@ -119,82 +121,115 @@ class Wordle:
                     6: {"word": "", "letters": []},
                 },
             }
-            options = Options()
-            options.add_experimental_option("excludeSwitches", ["enable-logging"])
-            options.add_argument("--log-level=3")
-            options.add_argument("--no-sandbox")  # Bypass OS security model
-            options.add_argument("--disable-dev-shm-usage")  # Overcome limited resource issues
-            options.add_argument("--disable-gpu")  # Applicable for Windows/Linux GUI environments
-            options.add_argument("--remote-debugging-port=9222")  # Debugging port for ChromeDriver
-            options.add_argument("--disable-software-rasterizer")  # Avoid GPU rendering issues
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-logging")
-            options.add_argument("--disable-popup-blocking")
-            if headless is True:
-                options.add_argument("--headless")
-            options.add_argument("--ignore-certificate-errors")
-            options.add_argument("--ignore-ssl-errors")
-
+            self.pool = pool
             try:
-                self.browser = Chrome(options=options)
-            except SessionNotCreatedException as e:
+                if pool is not None:
+                    self.browser = pool.acquire()
+                else:
+                    self.browser = Chrome(options=chrome_options(headless=headless))
+            except SessionNotCreatedException:
                 self.console.print("Selenium web browser failed to start!", style="red")
                 self.console.print("You might be missing some dependencies.", style="red")
                 self.console.print("Selenium error: SessionNotCreatedException", style="yellow")
                 exit(3)
 
-            self.action_chains = ActionChains(self.browser)
+            try:
+                PROFILER.watch(self.browser)
+                self.action_chains = ActionChains(self.browser)
+                self._open_game(base_url or self.NYT_WEBSITE)
+            except BaseException:
+                # The caller never gets this Wordle to close, so the session is given up here
+                self.close(discard=True)
+                raise
+
+    @PROFILER.timed("browser.page_load")
+    def _open_game(self, url: str) -> None:
+        """
+        Loads the page and clicks through the dialogs until the board is showing.
 
-            self.browser.get(self.NYT_WEBSITE)
+        Args:
+            url (str): Wordle page to load.
+        """
+        self.browser.get(url)
+
+        # NEW YORK TIMES "WE'VE UPDATED OUR TERMS OF SERVICE" BUTTON
+        # Only shows up once per browser, so wait for it or the play button
+        self._wait(
+            "welcome",
+            EC.any_of(
+                EC.presence_of_element_located((By.CLASS_NAME, "purr-blocker-card__button")),
+                EC.presence_of_element_located((By.CLASS_NAME, self.PLAY_BUTTON_CLASS)),
+            ),
+        )
+        for button in self.browser.find_elements(By.CLASS_NAME, "purr-blocker-card__button"):
+            button.click()
 
-            # ----------------------------------------------------------------------------------
-            # NEW YORK TIMES "WE'VE UPDATED OUR TERMS OF SERVICE" BUTTON
-            try:
-                WebDriverWait(self.browser, 10).until(
-                    EC.presence_of_element_located(
-                        (By.CLASS_NAME, "purr-blocker-card__button")
-                    )
-                )
-                self.browser.find_element(
-                    By.CLASS_NAME, "purr-blocker-card__button"
-                ).click()
-            except TimeoutException:
-                pass
-            # -----------------------------------------------------------------------------------
-
-            WebDriverWait(self.browser, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, self.PLAY_BUTTON_CLASS))
+        self._wait(
+            "play_button",
+            EC.presence_of_element_located((By.CLASS_NAME, self.PLAY_BUTTON_CLASS)),
+        )
+        play = self.browser.find_elements(By.CLASS_NAME, self.PLAY_BUTTON_CLASS)[-1]
+        play.click()
+        # The "how to play" popup only shows up for new players
+        try:
+            self._wait(
+                "how_to_play",
+                EC.element_to_be_clickable((By.CLASS_NAME, self.CLOSE_POPUP_CLASS)),
+                timeout=2,
             )
-            play = self.browser.find_elements(By.CLASS_NAME, self.PLAY_BUTTON_CLASS)[-1]
-            play.click()
-            time.sleep(1)
             self.action_chains.send_keys(Keys.ESCAPE).perform()
-            time.sleep(1)
+            self._wait(
+                "how_to_play_closed",
+                EC.invisibility_of_element_located((By.CLASS_NAME, self.CLOSE_POPUP_CLASS)),
+            )
+        except TimeoutException:
+            pass
+
+        last_row = self.browser.find_elements(By.CLASS_NAME, self.ROW_CLASS)[5]
+        self.action_chains.scroll_to_element(last_row).perform()
 
-            last_row = self.browser.find_elements(By.CLASS_NAME, self.ROW_CLASS)[5]
-            self.action_chains.scroll_to_element(last_row).perform()
+    def close(self, discard: bool = False) -> None:
+        """
+        Gives the browser back to the pool, or quits it if there isn't one.
+
+        Args:
+            discard (bool, optional):
+                Quit the browser even if there's a pool, like when the session broke.
+                Defaults to False.
+        """
+        if self.pool is not None and discard is False:
+            self.pool.release(self.browser)
+        else:
+            self.browser.quit()
 
     @property
     def wordle_today(self) -> str:
         """
-        Grabs today's wordle from the Wordle Class's wordle dictionary.
+        Grabs today's wordle from the solver engine.
         Only works if wordle has been solved.
 
         Returns:
             str: Today's wordle.
         """
-        return str(
-            self.wordle["letters"][1]["correct"]
-            + self.wordle["letters"][2]["correct"]
-            + self.wordle["letters"][3]["correct"]
-            + self.wordle["letters"][4]["correct"]
-            + self.wordle["letters"][5]["correct"]
-        )
+        return self.engine.wordle_today
+
+    @property
+    def potential_words(self) -> dict:
+        """Words that could still be the answer, according to the solver engine."""
+        return self.engine.potential_words
+
+    @property
+    def potential_letters(self) -> list:
+        """Letters that are still useful for narrowing down the answer."""
+        return self.engine.potential_letters
 
+    @PROFILER.timed("console.render")
     def build_layout(self, guess="", style="yellow") -> Layout:
         """
         Dynamically build the layout in the console so
         the user can see how the wordle is being solved.
+        Rows that have been scored are only built once, and only the
+        first CANDIDATES_SHOWN potential words are listed.
 
         Args:
             guess (str, optional):
@@ -216,14 +251,15 @@ class Wordle:
         table.add_column("5", width=1, justify="center")
         for x in range(1, 7):
             if self.wordle["guess"][x]["letters"]:
-                table.add_row(
-                    self.wordle["guess"][x]["word"].capitalize(),
-                    f"[{self.wordle['guess'][x]['letters'][0][1]}]{self.wordle['guess'][x]['letters'][0][0]}",
-                    f"[{self.wordle['guess'][x]['letters'][1][1]}]{self.wordle['guess'][x]['letters'][1][0]}",
-                    f"[{self.wordle['guess'][x]['letters'][2][1]}]{self.wordle['guess'][x]['letters'][2][0]}",
-                    f"[{self.wordle['guess'][x]['letters'][3][1]}]{self.wordle['guess'][x]['letters'][3][0]}",
-                    f"[{self.wordle['guess'][x]['letters'][4][1]}]{self.wordle['guess'][x]['letters'][4][0]}",
-                )
+                if x not in self._rows:
+                    self._rows[x] = (
+                        self.wordle["guess"][x]["word"].capitalize(),
+                        *(
+                            f"[{letter_style}]{letter}"
+                            for letter, letter_style in self.wordle["guess"][x]["letters"]
+                        ),
+                    )
+                table.add_row(*self._rows[x])
                 table.add_section()
             elif not guess:
                 table.add_row(str(x), style="cyan")
@@ -236,14 +272,10 @@ class Wordle:
                 table.add_row(str(x), style="cyan")
                 table.add_section()
 
-        letters = Table(show_header=False, show_lines=False, show_edge=False)
-        letters.add_row(
-            f"Total potential words: [cyan bold]{len(self.potential_words.keys())}"
-        )
-        words = Table(show_header=False, show_lines=False, show_edge=False)
-        words.add_row(str(self.potential_letters))
-        words.add_section()
-        words.add_row(str(list(self.potential_words.keys())))
+        # The potential words only change when a guess is scored
+        info_key = (len(self.engine.history), len(self.engine.candidates))
+        if self._info is None or self._info[0] != info_key:
+            self._info = (info_key, *self._build_info())
 
         layout = Layout()
         layout.split_row(Layout(name="table"), Layout(name="info"))
@@ -251,10 +283,63 @@ class Wordle:
         layout["table"].size = 33
         layout["letters"].size = 3
         layout["table"].update(Panel(table))
-        layout["letters"].update(Panel(letters))
-        layout["words"].update(Panel(words))
+        layout["letters"].update(self._info[1])
+        layout["words"].update(self._info[2])
         return layout
 
+    def _build_info(self) -> tuple:
+        """
+        Builds the panels with the potential letters and the first CANDIDATES_SHOWN
+        potential words, truncated so a long list doesn't slow down every redraw.
+
+        Returns:
+            tuple[Panel, Panel]: The letters panel and the words panel.
+        """
+        candidates = self.engine.candidates
+        total = len(candidates)
+        letters = Table(show_header=False, show_lines=False, show_edge=False)
+        letters.add_row(f"Total potential words: [cyan bold]{total}")
+        shown = [
+            self.engine.patterns.words[indx] for indx in candidates[: self.CANDIDATES_SHOWN]
+        ]
+        words = Table(show_header=False, show_lines=False, show_edge=False)
+        words.add_row(str(self.potential_letters))
+        words.add_section()
+        words.add_row(" ".join(shown))
+        if total > len(shown):
+            words.add_row(f"[cyan]First {len(shown)} of {total}")
+        return Panel(letters), Panel(words)
+
+    def _live(self):
+        """
+        Live display for solve, or a stand-in that draws nothing when render is off.
+
+        Returns:
+            Live | nullcontext: Context manager for the display.
+        """
+        if self.render is False:
+            return nullcontext()
+        return Live(self.build_layout(), console=self.console, auto_refresh=False)
+
+    def _refresh(self, live, guess: str = "", style: str = "yellow", force: bool = False) -> None:
+        """
+        Redraws the live display, at most once every REFRESH_INTERVAL seconds.
+
+        Args:
+            live (Live | None): Display from _live.
+            guess (str, optional): The 5 letter word that is being guessed. Defaults to "".
+            style (str, optional): The color of the guess. Defaults to "yellow".
+            force (bool, optional): Redraw even if the last one was too recent. Defaults to False.
+        """
+        if live is None:
+            return
+        now = time.monotonic()
+        if force is False and now - self._last_refresh < self.REFRESH_INTERVAL:
+            return
+        self._last_refresh = now
+        live.update(self.build_layout(guess=guess, style=style), refresh=True)
+
+    @PROFILER.timed("browser.submit")
     def _submit_guess(self, guess: str, row_number: int) -> bool:
         """Submits the guess to NYT Wordle.
 
@@ -265,215 +350,136 @@ class Wordle:
                 Row number the guess is being submitted to.
                 Used for validating if the guess was successful or not.
 
-        Returns:
-            bool: True or False based on if guess was successfully submitted.
-        """
-        for letter in guess:
-            self.action_chains.send_keys(letter).perform()
-            time.sleep(0.1)
-        self.action_chains.send_keys(Keys.ENTER).perform()
-        time.sleep(2.5)
-
-        row = self.browser.find_elements(By.CLASS_NAME, self.ROW_CLASS)[row_number - 1]
-        tiles = row.find_elements(By.CLASS_NAME, self.TILE_CLASS)
-        for letter in tiles:
-            letter_check = letter.get_attribute("data-state")
-            if letter_check == "tbd":
-                return False
-        return True
-
-    def _is_letter_duplicate(self, letter: str, word: str) -> bool:
-        """Checks if a given letter shows up more than once in a word.
-
-        Args:
-            letter (str): Letter to check for duplicate.
-            word (str): Word to check letter duplicate.
+        Raises:
+            TimeoutException: If the row neither flips nor gets rejected, even after a retry.
 
         Returns:
-            bool: True if duplicate, False if otherwise.
+            bool: False if the word was rejected, True once the row is scored.
         """
-        count = 0
-        for word_letter in word:
-            if word_letter == letter:
-                count += 1
-        if count > 1:
-            return True
-        return False
-
-    def _totally_absent(self, row_number: int, letter: str) -> bool:
-        row = self.browser.find_elements(By.CLASS_NAME, self.ROW_CLASS)[row_number - 1]
-        tiles = row.find_elements(By.CLASS_NAME, self.TILE_CLASS)
-        for tile_letter in tiles:
-            if tile_letter.text.lower() == letter:
-                if tile_letter.get_attribute("data-state") != "absent":
-                    return False
-        return True
-
-    def _update_wordle(self, row_number: int, word: str) -> None:
-        self.wordle["guess"][row_number]["word"] = word
-        row = self.browser.find_elements(By.CLASS_NAME, self.ROW_CLASS)[row_number - 1]
-        tiles = row.find_elements(By.CLASS_NAME, self.TILE_CLASS)
-        for indx, letter in enumerate(tiles, start=1):
-            letter_check = letter.get_attribute("data-state")
-            if letter_check == "absent":
-                if (
-                    self._is_letter_duplicate(letter=letter.text.lower(), word=word)
-                    is True
-                ):
-                    if (
-                        self._totally_absent(
-                            row_number=row_number, letter=letter.text.lower()
-                        )
-                        is False
-                    ):
-                        self.wordle["letters"][indx]["incorrect"].append(
-                            letter.text.lower()
-                        )
-                    else:
-                        self.wordle["absent_letters"].append(letter.text.lower())
-                else:
-                    self.wordle["absent_letters"].append(letter.text.lower())
-            elif letter_check == "correct":
-                self.wordle["letters"][indx]["correct"] = letter.text.lower()
-                self.wordle["present_letters"].append(letter.text.lower())
-            elif letter_check == "present":
-                self.wordle["present_letters"].append(letter.text.lower())
-                self.wordle["letters"][indx]["incorrect"].append(letter.text.lower())
-
-            self.wordle["guess"][row_number]["letters"].append(
-                (letter.text, self.style_dict[letter_check])
-            )
-
-    def _check_for_present_letters(self, word):
-        if self.wordle["present_letters"]:
-            for present_letter in self.wordle["present_letters"]:
-                if present_letter not in word:
-                    return False
-        return True
-
-    def _get_potential_words(self):
-        potential_words = {}
-        for word in self.potential_words.keys():
-            if self._check_for_present_letters(word) is False:
-                continue
-
-            for indx, letter in enumerate(word, start=1):
-                if letter in self.wordle["absent_letters"]:
-                    break
-                if letter in self.wordle["letters"][indx]["incorrect"]:
-                    break
+        self.action_chains.send_keys(guess + Keys.ENTER).perform()
+        try:
+            result = self._wait("submit", lambda browser: self._row_result(row_number))
+        except TimeoutException:
+            # A slow page doesn't mean the word was rejected, so it gets one more wait
+            result = self._wait("submit_retry", lambda browser: self._row_result(row_number))
+        return result != "invalid"
 
-                if not self.wordle["letters"][indx]["correct"]:
-                    pass
-                elif letter != self.wordle["letters"][indx]["correct"]:
-                    break
+    def _wait(self, name: str, condition, timeout: float = None):
+        """
+        Waits for a condition on the page and records how long it took.
 
-                if indx == 5:
-                    potential_words[word] = 1
-        return potential_words
+        Args:
+            name (str): What is being waited for, used in wait_times.
+            condition (Callable): Selenium expected condition.
+            timeout (float, optional): Seconds before giving up. Defaults to wait_timeout.
 
-    def _check_for_win(self, check_word: str):
-        for indx in range(1, 6):
-            if not self.wordle["letters"][indx]["correct"]:
-                return False
-        if check_word != self.wordle_today:
-            return False
-        return True
-
-    def _delete_guess(self, guess: str):
-        for _ in range(5):
-            self.action_chains.send_keys(Keys.BACK_SPACE).perform()
-            time.sleep(0.1)
-        try:
-            self.potential_words.pop(guess)
-        except KeyError:
-            pass
+        Raises:
+            TimeoutException: If the condition isn't met in time.
 
+        Returns:
+            Any: Whatever the condition returned.
+        """
+        start = time.perf_counter()
         try:
-            self.five_letter_words.pop(guess)
-        except KeyError:
-            pass
-
-        with open(self.FIVE_LETTER_WORDS_ABSOLUTE_PATH, "w", encoding="utf-8") as file:
-            file.write(json.dumps(self.five_letter_words, indent=1))
+            return WebDriverWait(
+                self.browser, timeout or self.wait_timeout, poll_frequency=self.WAIT_POLL
+            ).until(condition)
+        finally:
+            self.wait_times.append((name, time.perf_counter() - start))
 
-    def _get_available_letters(self) -> dict:
-        availible_letters = {}
-        for word in self.potential_words.keys():
-            for letter in word:
-                availible_letters[letter] = 1
+    def _read_board(self) -> BoardSnapshot:
+        """
+        Reads every tile on the board in one round-trip, and keeps it as self.board.
 
-        for indx in range(1, 6):
-            try:
-                availible_letters.pop(self.wordle["letters"][indx]["correct"])
-            except KeyError:
-                pass
-        self.potential_letters = list(availible_letters.keys())
-        return availible_letters
+        Returns:
+            BoardSnapshot: Snapshot of the board.
+        """
+        self.board = BoardSnapshot.read(
+            self.browser, self.ROW_CLASS, self.TILE_CLASS, self.TOAST_CLASS
+        )
+        return self.board
 
-    def _get_best_guess(self, score: int = 5) -> str:
+    def _row_result(self, row_number: int):
         """
-        Generates a list of best guesses based on the remaining
-        letters from the list of potential remaining words.
+        Checks if a submitted row is done.
 
         Args:
-            score (int, optional):
-                Defaults to 5. Used in recusion. If function can't find a word that
-                includes 5 unique letters from the list of potential letters
-                then it will call the function again with a score of -= 1.
+            row_number (int): Row number the guess was submitted to.
 
         Returns:
-            guess (str):
-                Random guess for the list of potential guesses.
+            str | bool: "evaluated" once every tile has flipped,
+            "invalid" if the "not in word list" toast shows up, False while waiting.
         """
-        best_guesses = []
-        availible_letters = self._get_available_letters()
+        board = self._read_board()
+        if board.row(row_number).settled:
+            return "evaluated"
+        # Rejected words stay tbd, so the toast only counts while the row hasn't flipped
+        if board.toast:
+            return "invalid"
+        return False
 
-        if len(self.potential_words) == 1 or len(availible_letters) == 0:
-            best_guess = list(self.potential_words.keys())[0]
-            return best_guess
+    @PROFILER.timed("browser.scrape")
+    def _update_wordle(self, row_number: int, word: str) -> None:
+        """
+        Records a scored row from the last board snapshot and feeds it to the engine.
 
-        if len(self.potential_words) == 2:
-            best_guess = random.choice(list(self.potential_words.keys()))
-            return best_guess
+        Args:
+            row_number (int): Row number the guess was submitted to.
+            word (str): The guess.
+        """
+        row = self.board.row(row_number)
+        self._rows.pop(row_number, None)
+        self.wordle["guess"][row_number]["word"] = word
+        self.wordle["guess"][row_number]["letters"] = [
+            (tile.letter, self.style_dict[tile.state]) for tile in row.tiles
+        ]
+        self.engine.update(word, row.pattern)
 
-        for word in self.five_letter_words:
-            for index, letter in enumerate(word, start=1):
-                if self._is_letter_duplicate(letter=letter, word=word) is True:
-                    break
-                if letter in self.wordle["letters"][index]["incorrect"]:
-                    break
+    def _check_for_win(self, check_word: str):
+        return self.engine.check_for_win(check_word)
 
-                if index == 5:
-                    word_score = 0
-                    for availible_letter in availible_letters:
-                        if availible_letter in word:
-                            word_score += 1
-                    if word_score == score:
-                        best_guesses.append(word)
-        if len(best_guesses) == 0:
-            guess = self._get_best_guess(score=score - 1)
-        else:
-            guess = random.choice(best_guesses)
-        return guess
+    @PROFILER.timed("browser.delete")
+    def _delete_guess(self, guess: str, row_number: int):
+        self.action_chains.send_keys(Keys.BACK_SPACE * 5).perform()
+        try:
+            # Wait for the toast to go too, or it would reject the next guess
+            self._wait(
+                "delete",
+                lambda browser: not self._read_board().toast
+                and self.board.row(row_number).empty,
+            )
+        except TimeoutException:
+            pass
+        self.engine.remove_word(guess)
+        record_rejected(guess)
 
+    @PROFILER.timed("browser.popups")
     def _close_popups(self) -> None:
         """Closes the popups when done solving the Wordle."""
-        WebDriverWait(self.browser, 5).until(
-            EC.presence_of_element_located((By.CLASS_NAME, self.CLOSE_POPUP_CLASS))
-        ).click()
-        time.sleep(0.5)
-        WebDriverWait(self.browser, 5).until(
-            EC.presence_of_element_located((By.CLASS_NAME, self.CLOSE_POPUP_CLASS))
+        popup = self._wait(
+            "first_popup",
+            EC.element_to_be_clickable((By.CLASS_NAME, self.CLOSE_POPUP_CLASS)),
+            timeout=5,
+        )
+        popup.click()
+        self._wait("first_popup_closed", EC.staleness_of(popup), timeout=5)
+        self._wait(
+            "second_popup",
+            EC.element_to_be_clickable((By.CLASS_NAME, self.CLOSE_POPUP_CLASS)),
+            timeout=5,
         ).click()
 
-    def solve(self, first_guess: str = "") -> bool:
+    def solve(self, first_guess: str = "", strategy: str = "heuristic") -> bool:
         """Solve the wordle by selecting random 'best guesses'.
 
         Args:
             first_guess (str, optional):
                 The first guess the wordle solver will use.
-                If blank, will just pick a random word. Defaults to "".
+                If blank, the strategy picks one. Defaults to "".
+            strategy (str, optional):
+                How guesses are picked, "heuristic" for random words covering
+                the most letters or "entropy" for the most expected information.
+                Defaults to "heuristic".
 
         Raises:
             ValueError:
@@ -482,36 +488,64 @@ class Wordle:
         Returns:
             bool: True if successfully solved, False if otherwise.
         """
-        with Live(self.build_layout()) as live:
+        self.engine.strategy = get_strategy(strategy)
+        with PROFILER.phase("wordle.solve"):
+            solved = self._play(first_guess)
+        if PROFILER.enabled:
+            summary = PROFILER.write(
+                solved=solved, guesses=[guess for guess, _ in self.engine.history]
+            )
+            print_summary(summary, console=self.console)
+        return solved
+
+    def _play(self, first_guess: str = "") -> bool:
+        """
+        Plays the game on the page, see solve.
+
+        Args:
+            first_guess (str, optional): The first guess. Defaults to the strategy's.
+
+        Raises:
+            ValueError: If provided an invalid first guess.
+
+        Returns:
+            bool: True if successfully solved, False if otherwise.
+        """
+        with self._live() as live:
             if first_guess:
-                live.update(self.build_layout(guess=first_guess))
+                self._refresh(live, guess=first_guess)
             if not first_guess:
-                first_guess = random.choice(list(self.potential_words.keys()))
-                live.update(self.build_layout(guess=first_guess))
+                first_guess = self.engine.first_guess()
+                self._refresh(live, guess=first_guess)
                 while self._submit_guess(guess=first_guess, row_number=1) is False:
-                    live.update(self.build_layout(guess=first_guess, style="red bold"))
-                    self._delete_guess(first_guess)
-                    first_guess = random.choice(list(self.potential_words.keys()))
-                    live.update(self.build_layout(guess=first_guess))
+                    # Rejections are forced, the throttle would drop them for good
+                    self._refresh(live, guess=first_guess, style="red bold", force=True)
+                    self._delete_guess(first_guess, row_number=1)
+                    first_guess = self.engine.first_guess()
+                    self._refresh(live, guess=first_guess, force=True)
             elif self._submit_guess(guess=first_guess, row_number=1) is False:
                 raise ValueError("You have provided an invalid first guess.")
             self._update_wordle(row_number=1, word=first_guess)
-            live.update(self.build_layout())
+            self._refresh(live, force=True)
             if self._check_for_win(first_guess) is True:
                 self._close_popups()
                 return True
 
-            for indx in range(2, 7):
-                self.potential_words = self._get_potential_words()
-                new_guess = self._get_best_guess()
-                live.update(self.build_layout(guess=new_guess))
+            new_guess = first_guess
+            for indx in range(2, min(self.engine.rules.max_guesses, 6) + 1):
+                # Nothing fits the feedback, so there's no guess that could win,
+                # and no end of game popup to close either
+                if len(self.engine.candidates) == 0:
+                    return False
+                new_guess = self.engine.next_guess()
+                self._refresh(live, guess=new_guess)
                 while self._submit_guess(guess=new_guess, row_number=indx) is False:
-                    live.update(self.build_layout(guess=new_guess, style="red bold"))
-                    self._delete_guess(new_guess)
-                    new_guess = self._get_best_guess()
-                    live.update(self.build_layout(guess=new_guess))
+                    self._refresh(live, guess=new_guess, style="red bold", force=True)
+                    self._delete_guess(new_guess, row_number=indx)
+                    new_guess = self.engine.next_guess()
+                    self._refresh(live, guess=new_guess, force=True)
                 self._update_wordle(row_number=indx, word=new_guess)
-                live.update(self.build_layout())
+                self._refresh(live, force=True)
                 if self._check_for_win(new_guess) is True:
                     break
 
@@ -0,0 +1,375 @@
+"""Word List Module, loads the list of valid 5 letter words."""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from types import MappingProxyType
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+import numpy as np
+
+BUNDLED_WORDS_PATH = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "five_letter_words.json"
+)
+BUNDLED_PACKED_PATH = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "five_letter_words.bin"
+)
+PACKED_MAGIC = b"WBW1"  # Followed by the word count as a little endian uint32
+PACKED_HEADER_SIZE = 8
+WORDS_URL = (
+    "https://raw.githubusercontent.com/Jampamane/wordle_bot/refs/heads/main/"
+    "src/wordle_bot/five_letter_words.json"
+)
+CACHE_DIRECTORY = os.getenv(
+    "WORDLE_BOT_CACHE",
+    os.path.join(os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "wordle_bot"),
+)
+CACHED_WORDS_PATH = os.path.join(CACHE_DIRECTORY, "five_letter_words.json")
+CACHED_HEADERS_PATH = os.path.join(CACHE_DIRECTORY, "five_letter_words.headers.json")
+JOURNAL_PATH = os.path.join(CACHE_DIRECTORY, "rejected_words.log")
+CACHE_MAX_AGE = 24 * 60 * 60  # Seconds before the cache is revalidated
+REQUEST_TIMEOUT = 5
+
+_WORDS = {}
+
+
+def is_offline() -> bool:
+    """
+    Checks the WORDLE_BOT_OFFLINE environment variable.
+
+    Returns:
+        bool: True if the network shouldn't be used, False if otherwise.
+    """
+    return os.getenv("WORDLE_BOT_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+def wants_refresh() -> bool:
+    """
+    Checks the WORDLE_BOT_REFRESH environment variable.
+
+    Returns:
+        bool: True if the word list should come from GitHub, False if otherwise.
+    """
+    return os.getenv("WORDLE_BOT_REFRESH", "").lower() in ("1", "true", "yes")
+
+
+def encode_words(words: list) -> np.ndarray:
+    """
+    Turns 5 letter words into a (words, 5) array of letters from 0 to 25.
+
+    Args:
+        words (list): Lowercase 5 letter words.
+
+    Returns:
+        np.ndarray: uint8 array of letter indexes.
+    """
+    if not words:
+        return np.zeros((0, 5), dtype=np.uint8)
+    raw = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return (raw.reshape(len(words), 5) - ord("a")).astype(np.uint8)
+
+
+def decode_words(letters: np.ndarray) -> list[str]:
+    """
+    Turns an array from encode_words back into words.
+
+    Args:
+        letters (np.ndarray): (words, 5) array of letter indexes.
+
+    Returns:
+        list[str]: Lowercase 5 letter words.
+    """
+    raw = (np.asarray(letters, dtype=np.uint8) + ord("a")).tobytes().decode("ascii")
+    return [raw[start : start + 5] for start in range(0, len(raw), 5)]
+
+
+def write_packed(path: str, words) -> None:
+    """
+    Saves words in the packed format: a short header, then 5 bytes per word
+    holding each letter from 0 to 25, in sorted order.
+
+    Args:
+        path (str): File to write.
+        words (Iterable[str]): Lowercase 5 letter words.
+    """
+    words = sorted(words)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(PACKED_MAGIC + len(words).to_bytes(4, "little"))
+        file.write(encode_words(words).tobytes())
+    os.replace(temp_path, path)
+
+
+def read_packed(path: str) -> np.ndarray:
+    """
+    Memory maps a word list saved with write_packed, nothing is read until it's used.
+
+    Args:
+        path (str): Packed word list.
+
+    Raises:
+        ValueError: If the file isn't a packed word list.
+
+    Returns:
+        np.ndarray: Read only (words, 5) array of letters from 0 to 25.
+    """
+    with open(path, "rb") as file:
+        header = file.read(PACKED_HEADER_SIZE)
+    if len(header) != PACKED_HEADER_SIZE or header[:4] != PACKED_MAGIC:
+        raise ValueError(f"{path} isn't a packed word list.")
+    count = int.from_bytes(header[4:], "little")
+    if count == 0:
+        return np.zeros((0, 5), dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode="r", offset=PACKED_HEADER_SIZE, shape=(count, 5))
+
+
+def export_json(path: str, words) -> None:
+    """
+    Saves words in the JSON word list format, mapping each word to 1.
+
+    Args:
+        path (str): File to write.
+        words (Iterable[str]): Lowercase 5 letter words.
+    """
+    _write_json(path, dict.fromkeys(sorted(words), 1), indent=1)
+
+
+def read_word_file(path: str) -> list[str]:
+    """
+    Reads a plain text file of words, one per line.
+
+    Args:
+        path (str): File to read.
+
+    Returns:
+        list[str]: Lowercase words, blank lines skipped.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return [line.strip().lower() for line in file if line.strip()]
+
+
+def _read_json(path: str):
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _write_json(path: str, data, indent: int = None) -> None:
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=indent)
+    os.replace(temp_path, path)
+
+
+def _refresh_cache() -> bool:
+    """
+    Revalidates the cached word list against GitHub.
+    The cache is trusted without a request while it's younger than CACHE_MAX_AGE,
+    after that a conditional request only downloads the list if its ETag changed.
+
+    Returns:
+        bool: True if the cache holds a usable word list, False if otherwise.
+    """
+    has_cache = os.path.exists(CACHED_WORDS_PATH)
+    if has_cache and time.time() - os.path.getmtime(CACHED_WORDS_PATH) < CACHE_MAX_AGE:
+        return True
+
+    headers = {}
+    if has_cache and os.path.exists(CACHED_HEADERS_PATH):
+        try:
+            cached_headers = _read_json(CACHED_HEADERS_PATH)
+        except ValueError:
+            cached_headers = {}
+        if cached_headers.get("etag"):
+            headers["If-None-Match"] = cached_headers["etag"]
+        if cached_headers.get("last-modified"):
+            headers["If-Modified-Since"] = cached_headers["last-modified"]
+
+    import requests  # Only needed when the cache is stale, and slow to import
+
+    try:
+        response = requests.get(WORDS_URL, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304:
+            os.utime(CACHED_WORDS_PATH)
+            return True
+        response.raise_for_status()
+        words = response.json()
+        os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+        _write_json(CACHED_WORDS_PATH, words)
+        _write_json(
+            CACHED_HEADERS_PATH,
+            {
+                "etag": response.headers.get("ETag", ""),
+                "last-modified": response.headers.get("Last-Modified", ""),
+            },
+        )
+    except (requests.RequestException, ValueError, OSError):
+        return has_cache
+    return True
+
+
+@contextmanager
+def _locked(file, exclusive: bool = True):
+    """Holds an OS level lock on an open file, so processes don't interleave writes."""
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield file
+        finally:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    else:
+        position = file.tell()
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+        file.seek(position)
+        try:
+            yield file
+        finally:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def record_rejected(*words: str, path: str = JOURNAL_PATH) -> None:
+    """
+    Appends rejected words to the journal in a single locked write,
+    and forgets the loaded word lists that leave out the journaled words.
+
+    Args:
+        *words (str): Words that aren't in Wordle's word list.
+        path (str, optional): Journal file. Defaults to JOURNAL_PATH.
+    """
+    if not words:
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as file, _locked(file):
+        file.write("".join(f"{word.lower()}\n" for word in words))
+        file.flush()
+    # Word lists loaded from now on have to leave these words out too
+    for key in [key for key in _WORDS if key[-1] is True]:
+        del _WORDS[key]
+
+
+def read_rejected(path: str = JOURNAL_PATH) -> set[str]:
+    """
+    Reads every word in the journal.
+
+    Args:
+        path (str, optional): Journal file. Defaults to JOURNAL_PATH.
+
+    Returns:
+        set[str]: Rejected words, empty if there is no journal.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file, _locked(file, exclusive=False):
+            return {line.strip() for line in file if line.strip()}
+    except FileNotFoundError:
+        return set()
+
+
+def compact(
+    words_paths: tuple = (BUNDLED_PACKED_PATH, BUNDLED_WORDS_PATH, CACHED_WORDS_PATH),
+    path: str = JOURNAL_PATH,
+) -> int:
+    """
+    Removes every journaled word from the word list files, then empties the journal.
+    Word lists that don't exist or can't be written to are skipped.
+
+    Args:
+        words_paths (tuple, optional):
+            Word lists to rewrite, .bin files are packed word lists.
+            Defaults to the bundled and cached word lists.
+        path (str, optional): Journal file. Defaults to JOURNAL_PATH.
+
+    Returns:
+        int: Number of words removed from the word lists.
+    """
+    if not os.path.exists(path):
+        return 0
+    removed = set()
+    with open(path, "r+", encoding="utf-8") as file, _locked(file):
+        rejected = {line.strip() for line in file if line.strip()}
+        for words_path in words_paths:
+            if not os.access(words_path, os.W_OK):
+                continue
+            packed = words_path.endswith(".bin")
+            if packed:
+                five_letter_words = dict.fromkeys(decode_words(read_packed(words_path)), 1)
+            else:
+                five_letter_words = _read_json(words_path)
+            removed_here = [word for word in rejected if five_letter_words.pop(word, None)]
+            if removed_here:
+                if packed:
+                    write_packed(words_path, five_letter_words)
+                else:
+                    _write_json(words_path, five_letter_words, indent=1)
+                removed.update(removed_here)
+        file.seek(0)
+        file.truncate()
+    if removed:
+        _WORDS.clear()
+    return len(removed)
+
+
+def load_words(
+    offline: bool = None, overlay: bool = True, refresh: bool = None
+) -> MappingProxyType:
+    """
+    Loads the word list once per process.
+    Reads the packed word list bundled with the package, or its JSON export.
+    With refresh, the copy on GitHub is used instead, cached and only
+    revalidated once it's older than CACHE_MAX_AGE.
+
+    Args:
+        offline (bool, optional):
+            Never touch the network, only read files on disk. A refresh then
+            uses the cached copy as is. Defaults to the WORDLE_BOT_OFFLINE
+            environment variable.
+        overlay (bool, optional):
+            Leave out the words in the rejected word journal. Defaults to True.
+        refresh (bool, optional):
+            Use the word list from GitHub. Defaults to the WORDLE_BOT_REFRESH
+            environment variable.
+
+    Returns:
+        MappingProxyType: Read only mapping of every word to 1.
+    """
+    if offline is None:
+        offline = is_offline()
+    if refresh is None:
+        refresh = wants_refresh()
+    key = (offline, refresh, overlay)
+    if key not in _WORDS:
+        if overlay is True:
+            rejected = read_rejected()
+            words = load_words(offline=offline, overlay=False, refresh=refresh)
+            _WORDS[key] = MappingProxyType({word: 1 for word in words if word not in rejected})
+            return _WORDS[key]
+
+        words = None
+        if refresh is True:
+            use_cache = os.path.exists(CACHED_WORDS_PATH) if offline else _refresh_cache()
+            if use_cache is True:
+                try:
+                    words = _read_json(CACHED_WORDS_PATH)
+                except (OSError, ValueError):
+                    words = None
+        if words is None:
+            try:
+                # Already sorted, so skip sorting it again
+                _WORDS[key] = MappingProxyType(
+                    dict.fromkeys(decode_words(read_packed(BUNDLED_PACKED_PATH)), 1)
+                )
+                return _WORDS[key]
+            except (OSError, ValueError):
+                words = _read_json(BUNDLED_WORDS_PATH)
+        _WORDS[key] = MappingProxyType(dict.fromkeys(sorted(words), 1))
+    return _WORDS[key]
+
+
+if __name__ == "__main__":
+    print(f"Removed {compact()} rejected words from {BUNDLED_WORDS_PATH}")
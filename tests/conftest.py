@@ -0,0 +1,22 @@
+import os
+import tempfile
+
+# Set before wordle_bot is imported, so the tests never touch the network or the real cache
+os.environ["WORDLE_BOT_OFFLINE"] = "1"
+os.environ.pop("WORDLE_BOT_REFRESH", None)
+os.environ["WORDLE_BOT_CACHE"] = tempfile.mkdtemp(prefix="wordle_bot_tests_")
+
+import pytest  # noqa: E402
+
+from wordle_bot.patterns import PatternMatrix  # noqa: E402
+from wordle_bot.words import load_words  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def words():
+    return load_words(offline=True)
+
+
+@pytest.fixture(scope="session")
+def patterns():
+    return PatternMatrix.for_words(load_words(offline=True, overlay=False))
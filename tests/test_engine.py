@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from wordle_bot.engine import SolverEngine, get_feedback
+from wordle_bot.rules import Rules
+
+
+@pytest.fixture
+def engine(words, patterns):
+    return SolverEngine(words, patterns=patterns, strategy="entropy", memo=False)
+
+
+def test_update_keeps_only_consistent_candidates(engine):
+    engine.update("crane", get_feedback("crane", "pound"))
+    engine.update("split", get_feedback("split", "pound"))
+    words = engine.patterns.words
+    for guess, pattern in engine.history:
+        assert all(get_feedback(guess, words[indx]) == pattern for indx in engine.candidates)
+    assert "pound" in engine.potential_words
+
+
+def test_update_accepts_pattern_codes(engine, patterns):
+    other = engine.new_game()
+    code = patterns.row("crane")[patterns.index["pound"]]
+    engine.update("crane", get_feedback("crane", "pound"))
+    other.update("crane", code)
+    assert list(engine.candidates) == list(other.candidates)
+
+
+@pytest.mark.parametrize("strategy", ["entropy", "minimax", "expected_size", "heuristic"])
+def test_play_solves(words, patterns, strategy):
+    rng = random.Random(2)
+    for answer in rng.sample(patterns.words, 5):
+        engine = SolverEngine(words, patterns=patterns, strategy=strategy, memo=False)
+        guesses = engine.play(answer, max_guesses=20)
+        assert guesses[-1] == answer
+
+
+def test_hard_mode_reuses_every_hint(words, patterns):
+    rng = random.Random(3)
+    for answer in rng.sample(patterns.words, 10):
+        engine = SolverEngine(
+            words, patterns=patterns, strategy="entropy", memo=False, rules=Rules(hard_mode=True)
+        )
+        guesses = engine.play(answer, max_guesses=20)
+        for turn, guess in enumerate(guesses[1:], start=1):
+            for previous in guesses[:turn]:
+                pattern = get_feedback(previous, answer)
+                for indx, state in enumerate(pattern):
+                    if state == "correct":
+                        assert guess[indx] == previous[indx]
+                    elif state == "present":
+                        assert previous[indx] in guess
+
+
+def test_remove_word(engine):
+    engine.remove_word("crane")
+    assert not engine.is_guessable("crane")
+    assert "crane" not in engine.potential_words
+
+
+def test_no_candidates_left_raises(engine):
+    # No word has every letter of crane but one in place and the last one elsewhere
+    engine.update("crane", ("correct",) * 4 + ("present",))
+    assert len(engine.candidates) == 0
+    with pytest.raises(ValueError):
+        engine.next_guess()
+
+
+def test_answers_rule_limits_candidates(words, patterns):
+    answers = ["crane", "slate", "pound"]
+    engine = SolverEngine(
+        words, patterns=patterns, strategy="entropy", memo=False, rules=Rules(answers=answers)
+    )
+    assert sorted(engine.potential_words) == sorted(answers)
+    assert engine.play("pound")[-1] == "pound"
@@ -0,0 +1,62 @@
+import random
+
+import numpy as np
+import pytest
+
+from wordle_bot.engine import get_feedback
+from wordle_bot.patterns import (
+    ABSENT,
+    CORRECT,
+    PRESENT,
+    SOLVED_PATTERN,
+    compute_patterns,
+    decode_pattern,
+    encode_pattern,
+)
+from wordle_bot.words import encode_words
+
+
+@pytest.mark.parametrize(
+    "guess, answer, expected",
+    [
+        ("crane", "crane", (CORRECT,) * 5),
+        ("speed", "abide", (ABSENT, ABSENT, PRESENT, ABSENT, PRESENT)),
+        # Only one e is left for the misplaced e's once the correct one is counted
+        ("geese", "those", (ABSENT, ABSENT, ABSENT, CORRECT, CORRECT)),
+        ("eerie", "elder", (CORRECT, PRESENT, PRESENT, ABSENT, ABSENT)),
+    ],
+)
+def test_get_feedback(guess, answer, expected):
+    assert get_feedback(guess, answer) == expected
+
+
+def test_encode_pattern_round_trip():
+    for code in range(243):
+        assert encode_pattern(decode_pattern(code)) == code
+    assert encode_pattern((CORRECT,) * 5) == SOLVED_PATTERN
+
+
+def test_compute_patterns_matches_get_feedback(patterns):
+    rng = random.Random(0)
+    guesses = rng.sample(patterns.words, 50)
+    answers = rng.sample(patterns.words, 50) + ["geese", "eerie", "mamma"]
+    codes = compute_patterns(encode_words(guesses), encode_words(answers))
+    for row, guess in enumerate(guesses):
+        for column, answer in enumerate(answers):
+            assert codes[row, column] == encode_pattern(get_feedback(guess, answer))
+
+
+def test_matrix_matches_get_feedback(patterns):
+    rng = random.Random(1)
+    for guess in rng.sample(patterns.words, 20):
+        row = patterns.row(guess)
+        for answer in rng.sample(patterns.words, 50):
+            assert row[patterns.index[answer]] == encode_pattern(get_feedback(guess, answer))
+
+
+def test_filter_keeps_exactly_the_consistent_words(patterns):
+    candidates = np.arange(len(patterns.words))
+    pattern = get_feedback("crane", "slate")
+    kept = patterns.filter(candidates, "crane", pattern)
+    expected = [word for word in patterns.words if get_feedback("crane", word) == pattern]
+    assert [patterns.words[indx] for indx in kept] == expected
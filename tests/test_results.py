@@ -0,0 +1,54 @@
+from wordle_bot.engine import get_feedback
+from wordle_bot.output_file import read_markdown, render_markdown, seed_store
+from wordle_bot.results import ResultsStore
+
+
+def record_game(store, guesses, answer, day, strategy="entropy"):
+    return store.record(
+        guesses=guesses,
+        patterns=[get_feedback(guess, answer) for guess in guesses],
+        strategy=strategy,
+        day=day,
+    )
+
+
+def test_record_and_query():
+    with ResultsStore(":memory:") as store:
+        record_game(store, ["crane", "slate"], "slate", "2025-01-01")
+        guesses = ["crane", "pound", "sound", "mound", "bound", "hound"]
+        record_game(store, guesses, "wound", "2025-01-02", strategy="heuristic")
+        games = store.games()
+        assert [game["date"] for game in games] == ["2025-01-02", "2025-01-01"]
+        assert games[1]["answer"] == "slate" and games[1]["solved"] is True
+        assert games[0]["answer"] is None and games[0]["solved"] is False
+        assert games[1]["patterns"][-1] == ("correct",) * 5
+        assert [game["date"] for game in store.games(strategy="entropy")] == ["2025-01-01"]
+        stats = store.stats()
+        assert stats["games"] == 2 and stats["solved"] == 1
+        assert stats["guess_distribution"] == {"2": 1}
+
+
+def test_markdown_round_trip():
+    with ResultsStore(":memory:") as store:
+        record_game(store, ["crane", "slate"], "slate", "2025-01-01")
+        record_game(store, ["crane"], "wound", "2025-01-02")
+        page = render_markdown(list(reversed(store.games())))
+    assert "| Crane | C | R | A | N | E |" in page
+    games = read_markdown(page)
+    assert [(game["date"], game["guesses"], game["solved"]) for game in games] == [
+        ("2025-01-01", ["crane", "slate"], True),
+        ("2025-01-02", ["crane"], False),
+    ]
+
+
+def test_seed_store_keeps_the_page_history(tmp_path):
+    page = tmp_path / "final_table.md"
+    with ResultsStore(":memory:") as store:
+        record_game(store, ["crane", "slate"], "slate", "2025-01-01")
+        page.write_text(render_markdown(list(reversed(store.games()))), encoding="utf-8")
+    with ResultsStore(str(tmp_path / "results.db")) as store:
+        assert seed_store(store, str(page)) == 1
+        assert seed_store(store, str(page)) == 0
+        (game,) = store.games()
+        assert game["answer"] == "slate" and game["solved"] is True
+        assert game["patterns"][0] == get_feedback("crane", "slate")
@@ -0,0 +1,64 @@
+import pytest
+
+from wordle_bot.engine import get_feedback
+from wordle_bot.patterns import SOLVED_PATTERN, encode_pattern
+from wordle_bot.reverse import ReverseSolver, parse_grid, parse_row
+
+
+@pytest.fixture(scope="module")
+def solver():
+    return ReverseSolver()
+
+
+def test_parse_row_reads_every_tile_alphabet():
+    code = encode_pattern(("correct", "absent", "present", "absent", "absent"))
+    assert parse_row("🟩⬛🟨⬛⬛") == (None, code)
+    assert parse_row("🟩⬜🟨⬜⬜") == (None, code)
+    assert parse_row("gbybb") == (None, code)
+    assert parse_row("20100") == (None, code)
+    assert parse_row("Crane:gbybb") == ("crane", code)
+
+
+@pytest.mark.parametrize("row", ["gbyb", "gbybbb", "gbyzb", "cran:ggggg", "cr4ne:ggggg"])
+def test_parse_row_rejects_bad_rows(row):
+    with pytest.raises(ValueError):
+        parse_row(row)
+
+
+def test_parse_row_checks_the_word_list(patterns):
+    with pytest.raises(ValueError):
+        parse_row("qqqqq:ggggg", index=patterns.index)
+
+
+def test_parse_grid_formats():
+    expected = [(None, encode_pattern(("absent",) * 5)), (None, SOLVED_PATTERN)]
+    assert parse_grid("bbbbb ggggg") == expected
+    assert parse_grid("bbbbb,ggggg") == expected
+    assert parse_grid('["bbbbb", "ggggg"]') == expected
+    assert parse_grid('{"grid": ["bbbbb", "ggggg"], "guesses": ["crane"]}')[0][0] == "crane"
+
+
+@pytest.mark.parametrize("line", ["", "[]", "[{}]", '[["a"]]', '{"grid": 5}', "{"])
+def test_parse_grid_rejects_bad_grids(line):
+    with pytest.raises(ValueError):
+        parse_grid(line)
+
+
+def test_solve_finds_the_answer(solver):
+    answer = "pound"
+    grid = [(guess, encode_pattern(get_feedback(guess, answer))) for guess in ("crane", "split")]
+    result = solver.solve(grid + [(None, SOLVED_PATTERN)], top=5000)
+    assert answer in [entry["word"] for entry in result["answers"]]
+    assert result["count"] == len(result["answers"])
+
+
+def test_solve_lines_reports_bad_lines_and_keeps_going(solver):
+    results = list(solver.solve_lines(["[{}]", "", "gbybb ggggg", "qqqqq:ggggg"], top=3))
+    assert [result["line"] for result in results] == [1, 3, 4]
+    assert "error" in results[0] and "error" in results[2]
+    assert results[1]["count"] > 0 and len(results[1]["answers"]) == 3
+
+
+def test_solve_rejects_top_below_one(solver):
+    with pytest.raises(ValueError):
+        solver.solve(parse_grid("ggggg"), top=0)
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from wordle_bot.engine import SolverEngine
+from wordle_bot.rules import Rules
+from wordle_bot.stream import parse_answer, solve_many
+
+
+@pytest.mark.parametrize("strategy", ["entropy", "minimax"])
+@pytest.mark.parametrize("hard_mode", [False, True])
+def test_solve_many_matches_engine_play(words, patterns, strategy, hard_mode):
+    rng = random.Random(4)
+    answers = rng.sample(patterns.words, 12)
+    rules = Rules(hard_mode=hard_mode)
+    results = list(
+        solve_many(
+            answers, strategy=strategy, rules=rules, in_flight=5, patterns=patterns, memo=False
+        )
+    )
+    assert sorted(result["index"] for result in results) == list(range(len(answers)))
+    for result in results:
+        engine = SolverEngine(words, patterns=patterns, strategy=strategy, memo=False, rules=rules)
+        assert result["guesses"] == engine.play(result["answer"])
+        assert result["solved"] is (result["guesses"][-1] == result["answer"])
+
+
+def test_solve_many_reports_bad_answers(patterns):
+    lines = ["crane", "qqqqq", "", "abc", '{"answer": "slate", "id": 7}']
+    results = {result["index"]: result for result in solve_many(lines, patterns=patterns)}
+    assert sorted(results) == [0, 1, 3, 4]
+    assert "error" in results[1] and "error" in results[3]
+    assert results[4]["id"] == 7 and results[4]["solved"] is True
+
+
+def test_solve_many_validates_up_front(patterns):
+    with pytest.raises(ValueError):
+        solve_many(["crane"], in_flight=0, patterns=patterns)
+    with pytest.raises(ValueError):
+        solve_many(["crane"], first_guess="zzzzz", patterns=patterns)
+
+
+def test_parse_answer():
+    assert parse_answer(" Crane\n") == ("crane", {})
+    assert parse_answer('{"answer": "crane", "day": 1}') == ("crane", {"day": 1})
+    with pytest.raises(ValueError):
+        parse_answer("cranes")
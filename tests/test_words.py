@@ -0,0 +1,28 @@
+from wordle_bot.words import (
+    decode_words,
+    encode_words,
+    load_words,
+    read_packed,
+    read_rejected,
+    record_rejected,
+    write_packed,
+)
+
+
+def test_packed_round_trip(tmp_path):
+    words = ["slate", "crane", "pound"]
+    path = str(tmp_path / "words.bin")
+    write_packed(path, words)
+    assert decode_words(read_packed(path)) == sorted(words)
+    assert decode_words(encode_words(words)) == words
+
+
+def test_record_rejected_reloads_the_word_list(tmp_path, monkeypatch):
+    journal = str(tmp_path / "rejected_words.log")
+    # A fresh cache, so the other tests still see the whole word list afterwards
+    monkeypatch.setattr("wordle_bot.words._WORDS", {})
+    monkeypatch.setattr("wordle_bot.words.read_rejected", lambda: read_rejected(journal))
+    assert "crane" in load_words()
+    record_rejected("crane", path=journal)
+    assert "crane" not in load_words()
+    assert "crane" in load_words(overlay=False)